@@ -221,12 +221,9 @@ if HAS_CLICK:
 
             # Generate output
             if fmt == "md":
-                output = differ.to_markdown(diff_result)
+                output_path.write_text(differ.to_markdown(diff_result), encoding="utf-8")
             else:
-                import json
-                output = json.dumps(diff_result, indent=2, default=str)
-
-            output_path.write_text(output, encoding="utf-8")
+                output_path.write_bytes(differ.to_json(diff_result))
 
             click.echo(f"\nDiff saved to: {output_path}")
             click.echo("\nSummary:")
@@ -12,9 +12,10 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
+from uuid import uuid4
 
-from ..trace.models import TraceRun, EventName
+from ..trace.models import TraceEvent, TraceRun, EventName
 from .budgets import BudgetConfig, get_default_budget_config
 
 
@@ -243,11 +244,8 @@ class TraceEvaluator:
         """
         trace_path = Path(trace_path)
 
-        # Load trace
-        trace_run = TraceRun.from_jsonl_file(str(trace_path))
-
-        # Extract metrics from trace
-        metrics = self._extract_metrics(trace_run)
+        # Stream the (validated) trace; scoring only needs running totals
+        metrics = self._extract_metrics(TraceRun.iter_events_jsonl(str(trace_path)))
 
         # Get budgets (with scenario override if applicable)
         cost_budget = self.budget.get_cost_budget(scenario)
@@ -278,7 +276,7 @@ class TraceEvaluator:
 
         return EvalResult(
             trace_path=str(trace_path),
-            run_id=trace_run.run_id,
+            run_id=metrics["run_id"] or f"run_{uuid4().hex[:8]}",
             scenario=scenario,
             passed=cost_result["passed"] and quality_result["passed"],
             cost_passed=cost_result["passed"],
@@ -296,8 +294,10 @@ class TraceEvaluator:
             issues=issues,
         )
 
-    def _extract_metrics(self, trace_run: TraceRun) -> Dict[str, Any]:
-        """Extract metrics from a trace run."""
+    def _extract_metrics(self, events: Iterable[TraceEvent]) -> Dict[str, Any]:
+        """Extract metrics (and the run id) from a trace's events in one pass."""
+        run_id: Optional[str] = None
+        end_data: Optional[Dict[str, Any]] = None
         tokens_total = 0
         usd_total = 0.0
         latency_total_ms = 0.0
@@ -305,8 +305,10 @@ class TraceEvaluator:
         tool_errors = 0
         quality_metrics: Dict[str, float] = {}
 
-        for event in trace_run.events:
+        for event in events:
             data = event.data if isinstance(event.data, dict) else event.data.model_dump()
+            if run_id is None:
+                run_id = event.run_id
 
             if event.name == EventName.COST_RECORD:
                 tokens_total += data.get("tokens", 0)
@@ -331,6 +333,9 @@ class TraceEvaluator:
                 value = data.get("value", 0.0)
                 quality_metrics[metric] = value
 
+            elif event.name == EventName.RUN_END and end_data is None:
+                end_data = data
+
         # Estimate USD if not tracked via cost_record
         if usd_total == 0 and tokens_total > 0:
             # Rough estimate: $0.002 per 1K tokens
@@ -339,15 +344,14 @@ class TraceEvaluator:
         # Default quality metrics if not present
         if "json_valid" not in quality_metrics:
             # Check if run completed successfully
-            end_event = trace_run.end_event
-            if end_event:
-                end_data = end_event.data if isinstance(end_event.data, dict) else end_event.data.model_dump()
+            if end_data is not None:
                 if end_data.get("status") == "success":
                     quality_metrics["json_valid"] = 1.0
                 else:
                     quality_metrics["json_valid"] = 0.0
 
         return {
+            "run_id": run_id,
             "tokens_total": tokens_total,
             "usd_total": usd_total,
             "latency_total_ms": latency_total_ms,
@@ -11,13 +11,15 @@ Implementations live in plugin packages (e.g. hu-plugins-hindsight).
 """
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
+from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryItem:
     """A single memory entry."""
     id: str
@@ -85,6 +87,23 @@ class MemoryPort(ABC):
         """
         ...
 
+    async def recall_batch(
+        self,
+        bank_id: str,
+        queries: List[str],
+        k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[MemoryItem]]:
+        """
+        Run several recalls against one bank; results are in *queries* order.
+
+        The default issues the recalls concurrently.  Backends that can
+        answer many queries in one pass over a bank should override this.
+        """
+        return list(await asyncio.gather(
+            *(self.recall(bank_id, q, k=k, filters=filters) for q in queries)
+        ))
+
 
 # ---------------------------------------------------------------------------
 # In-memory stub (useful for tests and stub mode)
@@ -97,7 +116,6 @@ class InMemoryPort(MemoryPort):
         self._banks: Dict[str, List[MemoryItem]] = {}
 
     async def retain(self, bank_id, content, context=None, timestamp=None, metadata=None):
-        from uuid import uuid4
         item = MemoryItem(
             id=f"mem_{uuid4().hex[:12]}",
             content=content,
@@ -124,5 +142,18 @@ class InMemoryPort(MemoryPort):
             results.append(it)
         return results
 
+    async def recall_batch(self, bank_id, queries, k=10, filters=None):
+        # One pass over the bank for all queries; each content is lowered once
+        items = self._banks.get(bank_id, [])
+        contents = [it.content.lower() for it in items]
+        results = []
+        for query in queries:
+            ql = query.lower()
+            scored = [(1.0 if ql in c else 0.0, it) for c, it in zip(contents, items)]
+            scored.sort(key=lambda x: -x[0])
+            # Copies, so one query's scores don't overwrite another's
+            results.append([replace(it, score=score) for score, it in scored[:k]])
+        return results
+
     async def reflect(self, bank_id, query, k=10, filters=None):
         return await self.recall(bank_id, query, k, filters)
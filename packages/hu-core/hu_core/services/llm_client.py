@@ -8,7 +8,7 @@ Provides:
 from __future__ import annotations
 import os
 import json
-from typing import List, Dict, Any, Optional, TYPE_CHECKING
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     pass  # For future type hints if needed
@@ -105,7 +105,7 @@ class LLMClient:
             In stub mode, returns deterministic response with fake usage.
         """
         import time
-        start = time.time()
+        start = time.perf_counter_ns()
 
         # Trace LLM request
         self._trace_llm_request(messages, temperature, max_tokens)
@@ -129,7 +129,7 @@ class LLMClient:
                 max_tokens=max_tokens,
             )
 
-            latency_ms = (time.time() - start) * 1000
+            latency_ms = (time.perf_counter_ns() - start) / 1_000_000
 
             usage = {
                 "prompt_tokens": resp.usage.prompt_tokens if resp.usage else 0,
@@ -265,6 +265,11 @@ class RoutedLLMClient:
         self._tracer = tracer
         self._pod = pod
 
+    async def aclose(self) -> None:
+        """Close the providers' HTTP sessions and clients (call on shutdown)."""
+        for provider in self._providers.values():
+            await provider.aclose()
+
     async def chat_completion_with_usage(
         self,
         messages: List[Dict[str, str]],
@@ -337,55 +342,86 @@ class RoutedLLMClient:
 
 from contextvars import ContextVar  # noqa: E402
 
-# Context-local client (for concurrent run isolation)
-_context_client: ContextVar[Optional[LLMClient]] = ContextVar(
-    "llm_client", default=None
+DEFAULT_CLIENT_KEY = "default"
+
+# Context-local client pool (for concurrent run isolation).
+# The dict is copy-on-write: never mutate the value returned by .get().
+_context_clients: ContextVar[Dict[str, LLMClient]] = ContextVar(
+    "llm_clients", default={}
 )
 
-# Global client singleton (fallback when no context set)
-_client_singleton: Optional[LLMClient] = None
+# Process-wide clients keyed on (stub_mode, api_key, model), so contexts that
+# share a configuration reuse one AsyncOpenAI connection pool.
+_client_pool: Dict[Tuple[bool, Optional[str], str], LLMClient] = {}
 
 
-def get_llm_client() -> LLMClient:
+def get_pooled_client(
+    api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    stub_mode: Optional[bool] = None,
+) -> LLMClient:
+    """
+    Get a shared LLM client for the given configuration, creating it once.
+
+    Unset arguments are resolved from the environment the same way
+    LLMClient() resolves them.
+    """
+    if stub_mode is None:
+        stub_mode = os.getenv("HUAP_LLM_MODE", "").lower() == "stub"
+    model = model or os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    api_key = None if stub_mode else (api_key or os.getenv("OPENAI_API_KEY"))
+
+    key = (stub_mode, api_key, model)
+    client = _client_pool.get(key)
+    if client is None:
+        client = LLMClient(api_key=api_key, model=model, stub_mode=stub_mode)
+        _client_pool[key] = client
+    return client
+
+
+def get_llm_client(key: str = DEFAULT_CLIENT_KEY) -> LLMClient:
     """
     Get the LLM client for the current context.
 
     Resolution order:
-    1. Context-local client (if set via set_context_client)
-    2. Global singleton (fallback)
+    1. Context-local client stored under ``key`` (via set_context_client)
+    2. Pooled client for the environment configuration (fallback)
 
     This enables concurrent runs to use isolated clients without
     cross-contamination.
     """
-    # Check context-local first
-    ctx_client = _context_client.get()
+    ctx_client = _context_clients.get().get(key)
     if ctx_client is not None:
         return ctx_client
-
-    # Fall back to global singleton
-    global _client_singleton
-    if _client_singleton is None:
-        _client_singleton = LLMClient()
-    return _client_singleton
+    return get_pooled_client()
 
 
-def set_context_client(client: Optional[LLMClient]) -> None:
+def set_context_client(
+    client: Optional[LLMClient],
+    key: str = DEFAULT_CLIENT_KEY,
+) -> None:
     """
-    Set the LLM client for the current async context.
+    Set the LLM client stored under ``key`` for the current async context.
 
-    Use this to isolate concurrent runs:
-        client = LLMClient()
+    Passing ``None`` removes the entry. Use this to isolate concurrent runs,
+    giving each run its own client (pooled clients are shared process-wide,
+    tracer included, so they do not isolate anything):
+        client = LLMClient(stub_mode=True)
         set_context_client(client)
         try:
             await run_workflow(...)
         finally:
             set_context_client(None)
     """
-    _context_client.set(client)
+    clients = dict(_context_clients.get())
+    if client is None:
+        clients.pop(key, None)
+    else:
+        clients[key] = client
+    _context_clients.set(clients)
 
 
 def reset_llm_client() -> None:
-    """Reset the LLM client singleton (for testing)."""
-    global _client_singleton
-    _client_singleton = None
-    _context_client.set(None)
+    """Reset pooled and context-local LLM clients (for testing)."""
+    _client_pool.clear()
+    _context_clients.set({})
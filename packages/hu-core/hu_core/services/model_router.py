@@ -5,15 +5,18 @@ Deterministic, rule-based model selection with full explainability.
 """
 from __future__ import annotations
 
+import heapq
 import os
+from collections.abc import Sequence
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .model_registry import ModelRegistry, ModelSpec
 
 
-@dataclass
+@dataclass(slots=True)
 class RouterRule:
     """A single routing rule from the policy YAML."""
     name: str
@@ -21,14 +24,55 @@ class RouterRule:
     prefer: List[str]     # ordered model IDs
 
 
-@dataclass
+class _FilterList(Sequence):
+    """
+    Filters applied by select(), kept as (name, value) pairs.
+
+    The ``name=value`` strings are only built when the list is read
+    (explain, to_dict, error messages), not on every routing call.
+    """
+
+    __slots__ = ("_pairs", "_formatted")
+
+    def __init__(self) -> None:
+        self._pairs: List[Tuple[str, Any]] = []
+        self._formatted: Optional[List[str]] = None
+
+    def add(self, name: str, value: Any) -> None:
+        self._pairs.append((name, value))
+        self._formatted = None
+
+    def _strings(self) -> List[str]:
+        if self._formatted is None:
+            self._formatted = [f"{name}={value}" for name, value in self._pairs]
+        return self._formatted
+
+    def __getitem__(self, index):  # type: ignore[override]
+        return self._strings()[index]
+
+    def __len__(self) -> int:
+        return len(self._pairs)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._strings())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _FilterList):
+            return self._strings() == other._strings()
+        return self._strings() == other
+
+    def __repr__(self) -> str:
+        return repr(self._strings())
+
+
+@dataclass(slots=True)
 class RouterDecision:
     """Outcome of a routing decision, including explainability."""
     model: ModelSpec
     rule_name: str
     reason: str
     candidates_considered: int
-    filters_applied: List[str]
+    filters_applied: Sequence[str]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -37,10 +81,27 @@ class RouterDecision:
             "rule_name": self.rule_name,
             "reason": self.reason,
             "candidates_considered": self.candidates_considered,
-            "filters_applied": self.filters_applied,
+            "filters_applied": list(self.filters_applied),
         }
 
 
+# Fallback ordering: cheapest first, then id
+_COST_KEY = attrgetter("usd_per_1k_tokens_est", "id")
+
+# Rule index key: (capability, privacy), where None means "any"
+_RuleKey = Tuple[Optional[str], Optional[str]]
+
+# Parsed policy rules keyed on (resolved path, st_mtime_ns, st_size)
+_POLICY_CACHE: Dict[Tuple[str, int, int], List[RouterRule]] = {}
+
+
+def _copy_rules(rules: List[RouterRule]) -> List[RouterRule]:
+    return [
+        RouterRule(name=r.name, when=dict(r.when), prefer=list(r.prefer))
+        for r in rules
+    ]
+
+
 class ModelRouter:
     """
     Rule-based model router.
@@ -56,6 +117,37 @@ class ModelRouter:
     ):
         self._registry = registry
         self._rules: List[RouterRule] = rules or []
+        self._rule_index = self._build_rule_index(self._rules)
+        self._has_rules = bool(self._rules)
+
+    @staticmethod
+    def _build_rule_index(
+        rules: List[RouterRule],
+    ) -> Dict[_RuleKey, List[Tuple[int, RouterRule]]]:
+        """
+        Bucket rules by their (capability, privacy) conditions.
+
+        Each bucket holds (policy position, rule) pairs in policy order, so
+        merging the buckets a request can hit preserves "first matching
+        rule wins". Rules with non-string conditions can never match and
+        are left out.
+        """
+        index: Dict[_RuleKey, List[Tuple[int, RouterRule]]] = {}
+        for position, rule in enumerate(rules):
+            when = rule.when
+            capability = when.get("capability")
+            privacy = when.get("privacy")
+            if ("capability" in when and not isinstance(capability, str)) or (
+                "privacy" in when and not isinstance(privacy, str)
+            ):
+                continue
+            index.setdefault((capability, privacy), []).append((position, rule))
+        return index
+
+    @property
+    def has_rules(self) -> bool:
+        """Whether any policy rules are loaded (False means fallback-only)."""
+        return self._has_rules
 
     # ------------------------------------------------------------------
     # Factory
@@ -78,10 +170,31 @@ class ModelRouter:
 
         return cls(registry, rules)
 
+    @staticmethod
+    def clear_policy_cache() -> None:
+        """Clear cached policy files (primarily for tests)."""
+        _POLICY_CACHE.clear()
+
     @staticmethod
     def _load_rules(path: Path) -> List[RouterRule]:
+        st = path.stat()
+        key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+        cached = _POLICY_CACHE.get(key)
+        if cached is None:
+            cached = ModelRouter._parse_rules(path)
+            _POLICY_CACHE[key] = cached
+        return _copy_rules(cached)
+
+    @staticmethod
+    def _parse_rules(path: Path) -> List[RouterRule]:
         import yaml
-        data = yaml.safe_load(path.read_text())
+        try:
+            from yaml import CSafeLoader as _Loader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
+        with path.open("rb") as f:
+            data = yaml.load(f, Loader=_Loader) or {}
         rules: List[RouterRule] = []
         for entry in data.get("rules", []):
             rules.append(RouterRule(
@@ -109,7 +222,7 @@ class ModelRouter:
         Raises ValueError if no model matches.
         """
         privacy = privacy or os.getenv("HUAP_PRIVACY", "cloud_ok")
-        filters: List[str] = []
+        filters = _FilterList()
 
         # 1. Filter by constraints
         candidates = self._registry.filter(
@@ -119,14 +232,15 @@ class ModelRouter:
             providers_allow=providers_allow,
             models_allow=models_allow,
         )
-        filters.append(f"capability={capability}")
-        filters.append(f"privacy={privacy}")
+        filters.add("capability", capability)
+        filters.add("privacy", privacy)
         if max_usd_est is not None:
-            filters.append(f"max_usd_est={max_usd_est}")
+            filters.add("max_usd_est", max_usd_est)
+        # Copies: formatting is deferred, and callers may reuse their lists
         if providers_allow:
-            filters.append(f"providers_allow={providers_allow}")
+            filters.add("providers_allow", list(providers_allow))
         if models_allow:
-            filters.append(f"models_allow={models_allow}")
+            filters.add("models_allow", list(models_allow))
 
         total_candidates = len(candidates)
 
@@ -137,22 +251,29 @@ class ModelRouter:
             )
 
         # 2. Apply policy rules (first matching rule wins)
-        for rule in self._rules:
-            if self._rule_matches(rule, capability, privacy):
+        if self._has_rules:
+            cand_by_id = {c.id: c for c in candidates}
+            index = self._rule_index
+            matching = heapq.merge(
+                index.get((capability, privacy), ()),
+                index.get((capability, None), ()),
+                index.get((None, privacy), ()),
+                index.get((None, None), ()),
+            )
+            for _, rule in matching:
                 for preferred_id in rule.prefer:
-                    for c in candidates:
-                        if c.id == preferred_id:
-                            return RouterDecision(
-                                model=c,
-                                rule_name=rule.name,
-                                reason=f"Matched rule '{rule.name}', preferred model '{c.id}'",
-                                candidates_considered=total_candidates,
-                                filters_applied=filters,
-                            )
-
-        # 3. Deterministic fallback: sort by cost asc, then id asc
-        candidates.sort(key=lambda m: (m.usd_per_1k_tokens_est, m.id))
-        chosen = candidates[0]
+                    c = cand_by_id.get(preferred_id)
+                    if c is not None:
+                        return RouterDecision(
+                            model=c,
+                            rule_name=rule.name,
+                            reason=f"Matched rule '{rule.name}', preferred model '{c.id}'",
+                            candidates_considered=total_candidates,
+                            filters_applied=filters,
+                        )
+
+        # 3. Deterministic fallback: cheapest by cost asc, then id asc
+        chosen = min(candidates, key=_COST_KEY)
         return RouterDecision(
             model=chosen,
             rule_name="__fallback",
@@ -161,15 +282,6 @@ class ModelRouter:
             filters_applied=filters,
         )
 
-    @staticmethod
-    def _rule_matches(rule: RouterRule, capability: str, privacy: str) -> bool:
-        when = rule.when
-        if "capability" in when and when["capability"] != capability:
-            return False
-        if "privacy" in when and when["privacy"] != privacy:
-            return False
-        return True
-
     # ------------------------------------------------------------------
     # Explain (for CLI / debugging)
     # ------------------------------------------------------------------
@@ -199,5 +311,5 @@ class ModelRouter:
             "selected": decision.to_dict(),
             "all_models": [m.to_dict() for m in self._registry.list()],
             "matching_candidates": decision.candidates_considered,
-            "filters_applied": decision.filters_applied,
+            "filters_applied": list(decision.filters_applied),
         }
@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderResponse:
     """Unified response from any provider."""
     text: str
@@ -38,3 +38,6 @@ class BaseProvider(ABC):
     ) -> ProviderResponse:
         """Send a chat completion request and return a unified response."""
         ...
+
+    async def aclose(self) -> None:
+        """Release pooled connections (no-op for providers without any)."""
@@ -1,17 +1,65 @@
 """
-Ollama provider — uses stdlib urllib so no extra dependencies are required.
+Ollama provider — uses a shared aiohttp session when aiohttp is installed,
+otherwise stdlib urllib in a worker thread, so no extra dependencies are required.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import time
 import urllib.request
-import urllib.error
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+try:
+    import aiohttp  # type: ignore
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised when dependency missing
+    aiohttp = None  # type: ignore[assignment]
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson  # type: ignore
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised when dependency missing
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    _loads = json.loads
 
 from .base import BaseProvider, ProviderResponse
 
 _DEFAULT_ENDPOINT = "http://localhost:11434"
+_TIMEOUT_S = 120
+
+# urllib.error.URLError and socket timeouts are OSError subclasses
+_CONNECTION_ERRORS: tuple = (asyncio.TimeoutError, OSError)
+if AIOHTTP_AVAILABLE:
+    _CONNECTION_ERRORS += (aiohttp.ClientError,)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=128)
+def _request_skeleton(model: str, temperature: float, max_tokens: int) -> Tuple[bytes, bytes]:
+    """
+    Encoded /api/chat body around the messages list, per model and options.
+
+    Returns (head, tail) such that ``head + <messages JSON> + tail`` is the
+    full request body; only the messages are serialized per request.
+    """
+    head = _dumps({"model": model})[:-1] + b',"messages":'
+    tail = b"," + _dumps({
+        "stream": True,
+        "options": {
+            "temperature": temperature,
+            "num_predict": max_tokens,
+        },
+    })[1:]
+    return head, tail
 
 
 class OllamaProvider(BaseProvider):
@@ -19,6 +67,32 @@ class OllamaProvider(BaseProvider):
 
     provider_name = "ollama"
 
+    def __init__(self) -> None:
+        # Keep-alive session, bound to the event loop that created it
+        self._session: Optional[Any] = None  # aiohttp.ClientSession
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _session_for(self) -> Any:
+        """
+        Return the aiohttp session for the running loop, creating it on
+        first use and again when the provider is used from another loop
+        (e.g. successive asyncio.run calls).
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=_TIMEOUT_S),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the HTTP session, if one was opened on the running loop."""
+        session, loop = self._session, self._session_loop
+        self._session = self._session_loop = None
+        if session is not None and not session.closed and loop is asyncio.get_running_loop():
+            await session.close()
+
     async def chat_completion(
         self,
         model: str,
@@ -30,37 +104,29 @@ class OllamaProvider(BaseProvider):
         base = (endpoint or _DEFAULT_ENDPOINT).rstrip("/")
         url = f"{base}/api/chat"
 
-        payload = json.dumps({
-            "model": model,
-            "messages": messages,
-            "stream": False,
-            "options": {
-                "temperature": temperature,
-                "num_predict": max_tokens,
-            },
-        }).encode()
-
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
+        head, tail = _request_skeleton(model, temperature, max_tokens)
+        body = head + _dumps(messages) + tail
 
-        start = time.time()
+        start = time.perf_counter_ns()
+        parts: List[str] = []
+        final: Dict[str, Any] = {}
         try:
-            with urllib.request.urlopen(req, timeout=120) as resp:
-                body = json.loads(resp.read())
-        except (urllib.error.URLError, OSError) as exc:
+            async for chunk in self._iter_chunks(url, body):
+                if "error" in chunk:
+                    raise RuntimeError(f"Ollama error: {chunk['error']}")
+                parts.append(chunk.get("message", {}).get("content", ""))
+                if chunk.get("done"):
+                    final = chunk
+        except _CONNECTION_ERRORS as exc:
             raise ConnectionError(
                 f"Ollama not reachable at {base}. Is it running? ({exc})"
             ) from exc
 
-        latency_ms = (time.time() - start) * 1000
-        text = body.get("message", {}).get("content", "")
+        latency_ms = (time.perf_counter_ns() - start) / 1_000_000
+        text = "".join(parts)
 
-        prompt_tokens = body.get("prompt_eval_count", 0)
-        completion_tokens = body.get("eval_count", 0)
+        prompt_tokens = final.get("prompt_eval_count", 0)
+        completion_tokens = final.get("eval_count", 0)
 
         return ProviderResponse(
             text=text,
@@ -73,3 +139,31 @@ class OllamaProvider(BaseProvider):
             },
             latency_ms=latency_ms,
         )
+
+    async def _iter_chunks(self, url: str, body: bytes) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the NDJSON chunks of a streamed /api/chat response."""
+        if AIOHTTP_AVAILABLE:
+            session = await self._session_for()
+            async with session.post(
+                url, data=body, headers=_JSON_HEADERS, raise_for_status=True
+            ) as resp:
+                async for line in resp.content:
+                    if line.strip():
+                        yield _loads(line)
+        else:
+            lines = await asyncio.to_thread(self._post_urllib, url, body)
+            for line in lines:
+                if line.strip():
+                    yield _loads(line)
+
+    @staticmethod
+    def _post_urllib(url: str, body: bytes) -> List[bytes]:
+        """Blocking stdlib POST; only call via asyncio.to_thread."""
+        req = urllib.request.Request(
+            url,
+            data=body,
+            headers=_JSON_HEADERS,
+            method="POST",
+        )
+        with urllib.request.urlopen(req, timeout=_TIMEOUT_S) as resp:
+            return resp.readlines()
@@ -3,12 +3,17 @@ OpenAI provider — requires the ``openai`` package (optional dep).
 """
 from __future__ import annotations
 
+import asyncio
 import os
 import time
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from .base import BaseProvider, ProviderResponse
 
+# Per-phase timeouts (seconds) and SDK-level retries with jittered backoff
+_TIMEOUTS = {"connect": 5.0, "read": 60.0, "write": 10.0, "pool": 5.0}
+_MAX_RETRIES = 2
+
 
 class OpenAIProvider(BaseProvider):
     """Calls the OpenAI chat completions API."""
@@ -17,17 +22,24 @@ class OpenAIProvider(BaseProvider):
 
     def __init__(self, api_key: Optional[str] = None):
         self._api_key = api_key or os.getenv("OPENAI_API_KEY")
+        # AsyncOpenAI client, bound to the event loop that created it
+        self._client: Optional[Any] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_client(self) -> Any:
+        """
+        Return the AsyncOpenAI client for the running loop, creating it on
+        first use and again when the provider is used from another loop
+        (e.g. successive asyncio.run calls). There is no await between the
+        check and the assignment, so concurrent callers on one loop cannot
+        build two clients.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._client_loop is loop:
+            return self._client
 
-    async def chat_completion(
-        self,
-        model: str,
-        messages: List[Dict[str, str]],
-        temperature: float = 0.2,
-        max_tokens: int = 800,
-        endpoint: Optional[str] = None,
-    ) -> ProviderResponse:
         try:
-            from openai import AsyncOpenAI
+            from openai import AsyncOpenAI, Timeout
         except ImportError as exc:
             raise ImportError(
                 "openai package is required for OpenAI provider. "
@@ -39,17 +51,46 @@ class OpenAIProvider(BaseProvider):
                 "OPENAI_API_KEY not set. Provide it via env or constructor."
             )
 
-        client = AsyncOpenAI(api_key=self._api_key)
-        start = time.time()
-
-        resp = await client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
+        self._client = AsyncOpenAI(
+            api_key=self._api_key,
+            timeout=Timeout(**_TIMEOUTS),
+            max_retries=_MAX_RETRIES,
         )
+        self._client_loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the HTTP connection pool, if one was opened on the running loop."""
+        client, loop = self._client, self._client_loop
+        self._client = self._client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+
+    async def chat_completion(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.2,
+        max_tokens: int = 800,
+        endpoint: Optional[str] = None,
+    ) -> ProviderResponse:
+        client = await self._get_client()
+        # After _get_client, which reports a missing openai package clearly
+        from openai import APIConnectionError  # also covers APITimeoutError
+
+        start = time.perf_counter_ns()
+
+        try:
+            resp = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+        except APIConnectionError as exc:
+            raise ConnectionError(f"OpenAI API not reachable ({exc})") from exc
 
-        latency_ms = (time.time() - start) * 1000
+        latency_ms = (time.perf_counter_ns() - start) / 1_000_000
         text = resp.choices[0].message.content or ""
         usage = {
             "prompt_tokens": resp.usage.prompt_tokens if resp.usage else 0,
@@ -4,10 +4,16 @@ Stub provider — deterministic canned responses for testing / CI.
 from __future__ import annotations
 
 import json
+import re
 from typing import Dict, List, Optional
 
 from .base import BaseProvider, ProviderResponse
 
+# Case-insensitive keyword probes; avoids lowercasing a copy of the prompt.
+# Checked in this order, so "classify" wins when both appear.
+_CLASSIFY_RE = re.compile("classify", re.IGNORECASE)
+_EXTRACT_RE = re.compile("extract", re.IGNORECASE)
+
 
 class StubProvider(BaseProvider):
     """Returns deterministic responses without any network calls."""
@@ -23,8 +29,13 @@ class StubProvider(BaseProvider):
         endpoint: Optional[str] = None,
     ) -> ProviderResponse:
         text = self._generate(messages)
-        word_count = len(text.split())
-        prompt_words = sum(len(m.get("content", "").split()) for m in messages)
+        # Approximate word counts by spaces so no token lists are allocated
+        word_count = text.count(" ") + (1 if text else 0)
+        prompt_words = sum(
+            c.count(" ") + (1 if c else 0)
+            for m in messages
+            for c in (m.get("content", ""),)
+        )
         return ProviderResponse(
             text=text,
             model=f"{model}-stub",
@@ -42,11 +53,11 @@ class StubProvider(BaseProvider):
         last_user = ""
         for msg in reversed(messages):
             if msg.get("role") == "user":
-                last_user = msg.get("content", "").lower()
+                last_user = msg.get("content", "")
                 break
 
-        if "classify" in last_user:
+        if _CLASSIFY_RE.search(last_user):
             return json.dumps({"label": "general", "confidence": 0.95, "stub": True})
-        if "extract" in last_user:
+        if _EXTRACT_RE.search(last_user):
             return json.dumps({"entities": [], "stub": True})
         return json.dumps({"response": "Stub response for testing", "status": "ok", "stub": True})
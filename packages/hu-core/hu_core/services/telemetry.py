@@ -3,8 +3,11 @@ Telemetry utilities connecting request logging to Prometheus exporters.
 """
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Optional
+import re
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     from prometheus_client import (  # type: ignore
@@ -24,6 +27,18 @@ except ImportError:  # pragma: no cover - exercised when dependency missing
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on cached label-bound metric children per metric
+_MAX_CACHED_CHILDREN = 10_000
+
+# Numeric and uuid/hex-like path segments collapse to ``:id`` in route labels
+_ID_SEGMENT_RE = re.compile(r"/(?:\d+|[0-9a-fA-F-]{8,})(?=/|$)")
+
+
+@functools.lru_cache(maxsize=1024)
+def _route_of(path: str) -> str:
+    """Normalize a request path to a low-cardinality route template."""
+    return _ID_SEGMENT_RE.sub("/:id", path.split("?", 1)[0])
+
 
 class BaseTelemetryExporter:
     """No-op exporter used when Prometheus client is unavailable."""
@@ -46,9 +61,13 @@ class BaseTelemetryExporter:
         """No-op implementation."""
         return
 
+    def iter_metrics(self) -> Iterator[bytes]:
+        """Yield the `/metrics` payload in chunks (for streaming responses)."""
+        yield b"# telemetry_disabled 1\n"
+
     def export_metrics(self) -> bytes:
         """Expose a stub payload for `/metrics`."""
-        return b"# telemetry_disabled 1\n"
+        return b"".join(self.iter_metrics())
 
 
 class PrometheusTelemetryExporter(BaseTelemetryExporter):
@@ -64,15 +83,17 @@ class PrometheusTelemetryExporter(BaseTelemetryExporter):
         self.request_counter = Counter(
             "huap_requests_total",
             "Total HUAP HTTP requests",
-            ["method", "path", "status", "pod", "user"],
+            ["method", "route", "status", "pod", "auth"],
             registry=self.registry,
         )
         self.latency_histogram = Histogram(
             "huap_request_duration_seconds",
             "HUAP request latency in seconds",
-            ["method", "path"],
+            ["method", "route"],
             registry=self.registry,
         )
+        self._counter_children: Dict[Tuple[str, ...], Any] = {}
+        self._hist_children: Dict[Tuple[str, ...], Any] = {}
 
     @property
     def enabled(self) -> bool:
@@ -89,52 +110,100 @@ class PrometheusTelemetryExporter(BaseTelemetryExporter):
     ) -> None:
         """
         Record structured request metrics for Prometheus scrapes.
+
+        ``path`` is reduced to its route template and ``user`` to an
+        anon/auth bucket so series count scales with routes, not users.
+        ``duration_ms`` is expected to come from a monotonic clock
+        (time.perf_counter_ns), so it is never negative.
         """
+        route = _route_of(path)
         status_label = str(status)
         pod_label = pod or "unknown"
-        user_label = user or "anonymous"
-
-        self.request_counter.labels(
-            method=method,
-            path=path,
-            status=status_label,
-            pod=pod_label,
-            user=user_label,
-        ).inc()
-
-        duration_seconds = max(duration_ms / 1000.0, 0.0)
-        self.latency_histogram.labels(
-            method=method,
-            path=path,
-        ).observe(duration_seconds)
+        auth_label = "auth" if user else "anon"
+
+        ckey = (method, route, status_label, pod_label, auth_label)
+        counter = self._counter_children.get(ckey)
+        if counter is None:
+            counter = _cache_child(
+                self._counter_children, ckey, self.request_counter.labels(*ckey)
+            )
+        counter.inc()
+
+        hkey = (method, route)
+        histogram = self._hist_children.get(hkey)
+        if histogram is None:
+            histogram = _cache_child(
+                self._hist_children, hkey, self.latency_histogram.labels(*hkey)
+            )
+        histogram.observe(duration_ms / 1000.0)
+
+    def iter_metrics(self) -> Iterator[bytes]:
+        """
+        Yield scraped metrics in Prometheus text format, one metric family
+        per chunk, so a streaming `/metrics` response never buffers the
+        whole exposition.
+        """
+        if generate_latest is None:  # pragma: no cover
+            return
+        for metric in self.registry.collect():
+            yield generate_latest(_SingleMetric(metric))
 
     def export_metrics(self) -> bytes:
         """Expose scraped metrics in Prometheus text format."""
-        if generate_latest is None:  # pragma: no cover
-            return b""
-        return generate_latest(self.registry)
+        return b"".join(self.iter_metrics())
+
+
+class _SingleMetric:
+    """Collector view over one collected metric family, for generate_latest."""
+
+    __slots__ = ("_metric",)
+
+    def __init__(self, metric: Any):
+        self._metric = metric
+
+    def collect(self) -> List[Any]:
+        return [self._metric]
+
 
+def _cache_child(cache: Dict[Tuple[str, ...], Any], key: Tuple[str, ...], child: Any) -> Any:
+    """Store a label-bound child, evicting the oldest entry once the cache is full."""
+    if len(cache) >= _MAX_CACHED_CHILDREN:
+        del cache[next(iter(cache))]
+    cache[key] = child
+    return child
 
-_EXPORTER: Optional[BaseTelemetryExporter] = None
+
+# Held around the cached builder: functools.cache alone does not stop two
+# first callers from both building (and double-registering collectors).
+_EXPORTER_LOCK = threading.Lock()
+
+
+@functools.cache
+def _build_exporter() -> BaseTelemetryExporter:
+    if PROMETHEUS_AVAILABLE:
+        logger.info("Telemetry exporter initialized (Prometheus)")
+        return PrometheusTelemetryExporter()
+    logger.warning(
+        "prometheus_client not installed; telemetry exporter disabled"
+    )
+    return BaseTelemetryExporter()
 
 
 def get_telemetry_exporter() -> BaseTelemetryExporter:
     """Return the global telemetry exporter instance."""
-    global _EXPORTER
-    if _EXPORTER is None:
-        if PROMETHEUS_AVAILABLE:
-            _EXPORTER = PrometheusTelemetryExporter()
-            logger.info("Telemetry exporter initialized (Prometheus)")
-        else:
-            logger.warning(
-                "prometheus_client not installed; telemetry exporter disabled"
-            )
-            _EXPORTER = BaseTelemetryExporter()
-    return _EXPORTER
+    with _EXPORTER_LOCK:
+        return _build_exporter()
+
+
+def reset_telemetry_exporter() -> None:
+    """Drop the global exporter so the next call builds a fresh one (for tests)."""
+    with _EXPORTER_LOCK:
+        _build_exporter.cache_clear()
 
 
 __all__ = [
     "BaseTelemetryExporter",
     "PrometheusTelemetryExporter",
     "get_telemetry_exporter",
+    "reset_telemetry_exporter",
 ]
@@ -37,6 +37,8 @@ from .base import (
     ToolStatus,
 )
 from .registry import (
+    NULL_TRACER,
+    NullTracer,
     ToolExecutionLog,
     ToolPermissionConfig,
     ToolRegistry,
@@ -56,6 +58,8 @@ __all__ = [
     "ToolSpec",
     "ToolStatus",
     # Registry
+    "NULL_TRACER",
+    "NullTracer",
     "ToolExecutionLog",
     "ToolPermissionConfig",
     "ToolRegistry",
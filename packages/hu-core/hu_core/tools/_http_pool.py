@@ -0,0 +1,62 @@
+"""
+Shared HTTP connection pool for the built-in HTTP tools.
+
+``http_fetch`` and ``http_fetch_safe`` draw from one aiohttp session, so
+keep-alive connections, the DNS cache and the SSL context are reused across
+tool boundaries. aiohttp is optional; check ``AIOHTTP_AVAILABLE`` before
+calling ``get_session()``.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import ssl
+from typing import Any, Optional
+
+try:
+    import aiohttp  # type: ignore
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised when dependency missing
+    aiohttp = None  # type: ignore[assignment]
+    AIOHTTP_AVAILABLE = False
+
+# Shared keep-alive session, bound to the event loop that created it
+_session: Optional[Any] = None  # aiohttp.ClientSession
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    """Default client SSL context (loading the CA bundle is expensive)."""
+    return ssl.create_default_context()
+
+
+def get_session() -> Any:
+    """
+    Return the shared ClientSession for the running loop, creating it on
+    first use. There is no await between the check and the assignment,
+    so concurrent callers on one loop cannot build two sessions.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                ssl=_ssl_context(),
+            ),
+        )
+        _session_loop = loop
+    return _session
+
+
+async def aclose() -> None:
+    """Close the shared session (call on shutdown)."""
+    global _session, _session_loop
+    session, _session, _session_loop = _session, None, None
+    if session is not None and not session.closed:
+        await session.close()
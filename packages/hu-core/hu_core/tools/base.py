@@ -9,7 +9,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Optional, Protocol, Tuple, Union, runtime_checkable
 
 
 class ToolCategory(str, Enum):
@@ -35,7 +36,7 @@ class ToolCategory(str, Enum):
     EXTERNAL = "external"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolSpec:
     """
     Specification for a tool including metadata and schemas.
@@ -73,20 +74,26 @@ class ToolSpec:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """
     Context passed to tool execution.
 
     Provides information about who is calling the tool and from where.
+    ``capabilities`` accepts any iterable of names and is stored as a
+    frozenset, ready for permission set arithmetic.
     """
     user_id: Optional[str] = None
     pod_name: Optional[str] = None
     session_id: Optional[str] = None
     correlation_id: Optional[str] = None
-    capabilities: List[str] = field(default_factory=list)
+    capabilities: FrozenSet[str] = frozenset()
     metadata: Dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        if not isinstance(self.capabilities, frozenset):
+            self.capabilities = frozenset(self.capabilities)
+
 
 class ToolStatus(str, Enum):
     """Status of tool execution."""
@@ -97,7 +104,7 @@ class ToolStatus(str, Enum):
     VALIDATION_ERROR = "validation_error"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """
     Standardized result from tool execution.
@@ -130,6 +137,37 @@ class ToolResult:
         }
 
 
+# JSON schema type name -> Python type(s) accepted by BaseTool._check_type
+_JSON_TYPE_MAP: Dict[str, Union[type, Tuple[type, ...]]] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+
+class CompiledInputSchema:
+    """
+    Input schema reduced once to the checks BaseTool.validate_input runs.
+
+    Holds the required field names and a field -> expected JSON type map,
+    so validation no longer walks the raw schema dict on every call.
+    """
+
+    __slots__ = ("required", "field_types")
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.required: Tuple[str, ...] = tuple(schema.get("required", []))
+        self.field_types: Dict[str, str] = {
+            name: field_spec["type"]
+            for name, field_spec in schema.get("properties", {}).items()
+            if field_spec.get("type")
+        }
+
+
 @runtime_checkable
 class Tool(Protocol):
     """Protocol for tools that can be registered and executed."""
@@ -149,14 +187,45 @@ class BaseTool(ABC):
     Abstract base class for implementing tools.
 
     Provides common functionality and enforces the tool interface.
-    Subclasses must implement the `execute` method.
+    Subclasses must implement the `execute` method, and either override
+    `spec` or declare `name` (plus optional `description`, `version`,
+    `category`, `input_schema`, `output_schema`, `required_capabilities`
+    and `tags`) as class attributes.
     """
 
-    @property
-    @abstractmethod
+    # Set per subclass by __init_subclass__ when its schema is known at
+    # class-definition time; None means compile lazily from `spec`.
+    _compiled_input_schema: Optional[CompiledInputSchema] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        namespace = cls.__dict__
+        declared_spec = namespace.get("_spec", namespace.get("spec"))
+        if "input_schema" in namespace:
+            cls._compiled_input_schema = CompiledInputSchema(namespace["input_schema"])
+        elif isinstance(declared_spec, ToolSpec):
+            cls._compiled_input_schema = CompiledInputSchema(declared_spec.input_schema)
+        elif "spec" in namespace:
+            # A computed spec may not match an inherited schema
+            cls._compiled_input_schema = None
+
+    @cached_property
     def spec(self) -> ToolSpec:
-        """Return the tool specification."""
-        ...
+        """Return the tool specification, built from class attributes."""
+        cls = type(self)
+        name = getattr(cls, "name", None)
+        if not name:
+            raise TypeError(f"{cls.__name__} must define 'name' or override 'spec'")
+        return ToolSpec(
+            name=name,
+            description=getattr(cls, "description", ""),
+            version=getattr(cls, "version", "1.0.0"),
+            category=getattr(cls, "category", ToolCategory.UTILITY),
+            input_schema=getattr(cls, "input_schema", {}),
+            output_schema=getattr(cls, "output_schema", {}),
+            required_capabilities=list(getattr(cls, "required_capabilities", [])),
+            tags=list(getattr(cls, "tags", [])),
+        )
 
     @abstractmethod
     async def execute(
@@ -184,52 +253,46 @@ class BaseTool(ABC):
         """Execute the tool (delegates to execute method)."""
         return await self.execute(input, context)
 
+    @cached_property
+    def _input_validator(self) -> Optional[CompiledInputSchema]:
+        """Compiled input schema (None when the tool declares no schema)."""
+        compiled = type(self)._compiled_input_schema
+        if compiled is not None:
+            return compiled
+        schema = self.spec.input_schema
+        return CompiledInputSchema(schema) if schema else None
+
     def validate_input(self, input: Dict[str, Any]) -> List[str]:
         """
         Validate input against the input schema.
 
         Returns list of validation errors (empty if valid).
         """
-        errors = []
-        schema = self.spec.input_schema
+        errors: List[str] = []
+        validator = self._input_validator
 
-        if not schema:
+        if validator is None:
             return errors
 
         # Check required fields
-        required = schema.get("required", [])
-        properties = schema.get("properties", {})
-
-        for field_name in required:
+        for field_name in validator.required:
             if field_name not in input:
                 errors.append(f"Missing required field: {field_name}")
 
         # Check field types
+        field_types = validator.field_types
         for field_name, value in input.items():
-            if field_name in properties:
-                field_spec = properties[field_name]
-                expected_type = field_spec.get("type")
-
-                if expected_type and not self._check_type(value, expected_type):
-                    errors.append(
-                        f"Field '{field_name}' should be {expected_type}, "
-                        f"got {type(value).__name__}"
-                    )
+            expected_type = field_types.get(field_name)
+            if expected_type and not self._check_type(value, expected_type):
+                errors.append(
+                    f"Field '{field_name}' should be {expected_type}, "
+                    f"got {type(value).__name__}"
+                )
 
         return errors
 
-    def _check_type(self, value: Any, expected_type: str) -> bool:
+    @staticmethod
+    def _check_type(value: Any, expected_type: str) -> bool:
         """Check if value matches expected JSON schema type."""
-        type_map = {
-            "string": str,
-            "integer": int,
-            "number": (int, float),
-            "boolean": bool,
-            "array": list,
-            "object": dict,
-            "null": type(None),
-        }
-        expected = type_map.get(expected_type)
-        if expected is None:
-            return True  # Unknown type, allow
-        return isinstance(value, expected)
+        expected = _JSON_TYPE_MAP.get(expected_type)
+        return expected is None or isinstance(value, expected)  # Unknown type, allow
@@ -8,12 +8,37 @@ These tools provide core functionality that all pods can use:
 - http_fetch: Make HTTP requests
 - memory_read/write/delete/list: File-based key-value storage
 """
+from typing import Tuple
+
+from ..base import BaseTool
 from .echo import EchoTool
 from .add import AddTool
 from .llm_call import LLMCallTool
 from .http_fetch import HTTPFetchTool
 from .memory import MemoryReadTool, MemoryWriteTool, MemoryDeleteTool, MemoryListTool
 
+# Shared instances: built-in tools are stateless, so every registry (and
+# every pod) can register the same objects.
+ECHO_TOOL = EchoTool()
+ADD_TOOL = AddTool()
+LLM_CALL_TOOL = LLMCallTool()
+HTTP_FETCH_TOOL = HTTPFetchTool()
+MEMORY_READ_TOOL = MemoryReadTool()
+MEMORY_WRITE_TOOL = MemoryWriteTool()
+MEMORY_DELETE_TOOL = MemoryDeleteTool()
+MEMORY_LIST_TOOL = MemoryListTool()
+
+BUILTIN_TOOLS: Tuple[BaseTool, ...] = (
+    ECHO_TOOL,
+    ADD_TOOL,
+    LLM_CALL_TOOL,
+    HTTP_FETCH_TOOL,
+    MEMORY_READ_TOOL,
+    MEMORY_WRITE_TOOL,
+    MEMORY_DELETE_TOOL,
+    MEMORY_LIST_TOOL,
+)
+
 __all__ = [
     "EchoTool",
     "AddTool",
@@ -23,24 +48,11 @@ __all__ = [
     "MemoryWriteTool",
     "MemoryDeleteTool",
     "MemoryListTool",
+    "BUILTIN_TOOLS",
+    "register_builtin_tools",
 ]
 
 
 def register_builtin_tools(registry) -> None:
-    """Register all built-in tools with a registry."""
-    tools = [
-        EchoTool(),
-        AddTool(),
-        LLMCallTool(),
-        HTTPFetchTool(),
-        MemoryReadTool(),
-        MemoryWriteTool(),
-        MemoryDeleteTool(),
-        MemoryListTool(),
-    ]
-    for tool in tools:
-        try:
-            registry.register(tool)
-        except ValueError:
-            # Already registered
-            pass
+    """Register all built-in tools with a registry (already-registered names are skipped)."""
+    registry.register_many(BUILTIN_TOOLS, skip_existing=True)
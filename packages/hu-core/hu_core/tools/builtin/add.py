@@ -38,6 +38,6 @@ class AddTool(BaseTool):
         b = input_data.get("b", 0)
         result = a + b
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"result": result},
+            ToolStatus.SUCCESS,
+            {"result": result},
         )
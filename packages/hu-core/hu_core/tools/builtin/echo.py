@@ -5,6 +5,8 @@ Pure Python, no external dependencies.
 """
 from ..base import BaseTool, ExecutionContext, ToolCategory, ToolResult, ToolStatus
 
+_SUCCESS = ToolStatus.SUCCESS
+
 
 class EchoTool(BaseTool):
     """Echo a message back."""
@@ -30,8 +32,5 @@ class EchoTool(BaseTool):
         context: ExecutionContext = None,
     ) -> ToolResult:
         """Execute the echo tool."""
-        message = input_data.get("message", "")
-        return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"echoed": message},
-        )
+        # Hot probe path: positional args, pre-bound status
+        return ToolResult(_SUCCESS, {"echoed": input_data.get("message", "")})
@@ -9,12 +9,28 @@ Enforces:
 """
 from __future__ import annotations
 
-from pathlib import Path
+import asyncio
+import functools
+import os
 from typing import Any, Dict, List, Optional
 
 from ..base import BaseTool, ToolResult, ToolStatus, ToolCategory
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_root(root: str) -> str:
+    """Canonical (symlink-free) absolute path of a sandbox root."""
+    return os.path.realpath(root)
+
+
+def _within_root(target_abs: str, root_abs: str) -> bool:
+    """String-prefix containment check on canonical paths."""
+    if target_abs == root_abs:
+        return True
+    prefix = root_abs if root_abs.endswith(os.sep) else root_abs + os.sep
+    return target_abs.startswith(prefix)
+
+
 class FsSandbox(BaseTool):
     """Sandboxed file I/O confined to a root directory."""
 
@@ -51,75 +67,98 @@ class FsSandbox(BaseTool):
         max_bytes: int = input_data.get("max_bytes", 1_048_576)
         allowed_ext: List[str] = input_data.get("allowed_extensions", [])
 
-        root_path = Path(root).resolve()
-        target = (root_path / rel_path).resolve()
+        root_abs = _resolve_root(root)
+        # realpath (not abspath) on the target too: a symlink inside the
+        # root must not be able to point outside it
+        target_abs = os.path.realpath(os.path.join(root_abs, rel_path))
 
         # Path traversal check
-        try:
-            target.relative_to(root_path)
-        except ValueError:
+        if not _within_root(target_abs, root_abs):
             return ToolResult(
-                status=ToolStatus.ERROR,
-                data={"error": f"Path traversal denied: '{rel_path}' escapes root '{root}'"},
+                ToolStatus.ERROR,
+                {"error": f"Path traversal denied: '{rel_path}' escapes root '{root}'"},
             )
 
-        # Extension check
-        if allowed_ext and target.suffix and target.suffix not in allowed_ext:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                data={"error": f"Extension '{target.suffix}' not allowed. Allowed: {allowed_ext}"},
-            )
+        # Extension check (no allowlist means every extension is allowed)
+        if allowed_ext:
+            suffix = os.path.splitext(target_abs)[1]
+            # Path.suffix semantics: a trailing dot ("notes.") is no suffix
+            if suffix == ".":
+                suffix = ""
+            if suffix and suffix not in frozenset(allowed_ext):
+                return ToolResult(
+                    ToolStatus.ERROR,
+                    {"error": f"Extension '{suffix}' not allowed. Allowed: {allowed_ext}"},
+                )
 
+        # Disk I/O runs in a worker thread so it doesn't block the event loop
         if action == "read":
-            return self._read(target, max_bytes)
+            return await asyncio.to_thread(self._read, target_abs, max_bytes)
         elif action == "write":
-            return self._write(target, content or "", max_bytes)
+            return await asyncio.to_thread(self._write, target_abs, content or "", max_bytes)
         elif action == "list":
-            return self._list(target)
+            return await asyncio.to_thread(self._list, target_abs)
         elif action == "exists":
             return ToolResult(
-                status=ToolStatus.SUCCESS,
-                data={"exists": target.exists(), "path": str(target.relative_to(root_path))},
+                ToolStatus.SUCCESS,
+                {
+                    "exists": await asyncio.to_thread(os.path.exists, target_abs),
+                    "path": os.path.relpath(target_abs, root_abs),
+                },
             )
         else:
             return ToolResult(
-                status=ToolStatus.ERROR,
-                data={"error": f"Unknown action '{action}'"},
+                ToolStatus.ERROR,
+                {"error": f"Unknown action '{action}'"},
             )
 
     @staticmethod
-    def _read(target: Path, max_bytes: int) -> ToolResult:
-        if not target.exists():
-            return ToolResult(status=ToolStatus.ERROR, data={"error": f"File not found: {target.name}"})
-        size = target.stat().st_size
-        if size > max_bytes:
-            return ToolResult(status=ToolStatus.ERROR, data={"error": f"File too large: {size} > {max_bytes}"})
-        text = target.read_text(encoding="utf-8")
+    def _read(target: str, max_bytes: int) -> ToolResult:
+        # One bounded read instead of exists() + stat() + read_text(); the
+        # extra byte tells us the file is over the cap.
+        try:
+            with open(target, "rb") as f:
+                data = f.read(max_bytes + 1)
+                if len(data) > max_bytes:
+                    size = os.fstat(f.fileno()).st_size
+                    return ToolResult(ToolStatus.ERROR, {"error": f"File too large: {size} > {max_bytes}"})
+        except FileNotFoundError:
+            return ToolResult(ToolStatus.ERROR, {"error": f"File not found: {os.path.basename(target)}"})
+        text = data.decode("utf-8")
+        if b"\r" in data:
+            # Match read_text()'s universal-newline translation
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"content": text, "size_bytes": size, "path": target.name},
+            ToolStatus.SUCCESS,
+            {"content": text, "size_bytes": len(data), "path": os.path.basename(target)},
         )
 
     @staticmethod
-    def _write(target: Path, content: str, max_bytes: int) -> ToolResult:
+    def _write(target: str, content: str, max_bytes: int) -> ToolResult:
         encoded = content.encode("utf-8")
         if len(encoded) > max_bytes:
-            return ToolResult(status=ToolStatus.ERROR, data={"error": f"Content too large: {len(encoded)} > {max_bytes}"})
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(encoded)
+            return ToolResult(ToolStatus.ERROR, {"error": f"Content too large: {len(encoded)} > {max_bytes}"})
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target, "wb") as f:
+            f.write(encoded)
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"written_bytes": len(encoded), "path": target.name},
+            ToolStatus.SUCCESS,
+            {"written_bytes": len(encoded), "path": os.path.basename(target)},
         )
 
     @staticmethod
-    def _list(target: Path) -> ToolResult:
-        if not target.exists():
-            return ToolResult(status=ToolStatus.ERROR, data={"error": f"Directory not found: {target.name}"})
-        if not target.is_dir():
-            return ToolResult(status=ToolStatus.ERROR, data={"error": f"Not a directory: {target.name}"})
+    def _list(target: str) -> ToolResult:
+        # scandir's DirEntry carries the file type from readdir, so only
+        # regular files cost a stat() (for their size)
+        try:
+            with os.scandir(target) as it:
+                dir_entries = sorted(it, key=lambda e: e.name)
+        except FileNotFoundError:
+            return ToolResult(ToolStatus.ERROR, {"error": f"Directory not found: {os.path.basename(target)}"})
+        except NotADirectoryError:
+            return ToolResult(ToolStatus.ERROR, {"error": f"Not a directory: {os.path.basename(target)}"})
         entries = [
-            {"name": p.name, "is_dir": p.is_dir(), "size": p.stat().st_size if p.is_file() else 0}
-            for p in sorted(target.iterdir())
+            {"name": e.name, "is_dir": e.is_dir(), "size": e.stat().st_size if e.is_file() else 0}
+            for e in dir_entries
         ]
-        return ToolResult(status=ToolStatus.SUCCESS, data={"entries": entries, "count": len(entries)})
+        return ToolResult(ToolStatus.SUCCESS, {"entries": entries, "count": len(entries)})
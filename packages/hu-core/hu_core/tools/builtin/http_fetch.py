@@ -3,11 +3,54 @@ HTTP Fetch Tool - Make HTTP requests.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import functools
+import json
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlparse
 
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised when dependency missing
+    _loads = json.loads
+
+from .. import _http_pool
 from ..base import BaseTool, ExecutionContext, ToolCategory, ToolSpec
 
 
+def _fast_domain(url: str) -> str:
+    """
+    Lower-cased netloc of *url*, identical to ``urlparse(url).netloc.lower()``.
+
+    Plain http(s) URLs are sliced with str.find; anything urlparse would
+    clean up or reject (control characters, surrounding whitespace,
+    non-ASCII or bracketed hosts) takes the urlparse path.
+    """
+    if (
+        url.startswith(("http://", "https://"))
+        and url.isascii()
+        and url.isprintable()
+        and not url.endswith(" ")
+    ):
+        start = url.find("://") + 3
+        end = len(url)
+        for sep in "/?#":
+            i = url.find(sep, start, end)
+            if i != -1:
+                end = i
+        netloc = url[start:end]
+        if "[" not in netloc and "]" not in netloc:
+            return netloc.lower()
+    return urlparse(url).netloc.lower()
+
+
+@functools.lru_cache(maxsize=2048)
+def _domain_of(url: str) -> str:
+    """Memoised _fast_domain (agents hit the same URLs repeatedly)."""
+    return _fast_domain(url)
+
+
 class HTTPFetchTool(BaseTool):
     """
     Tool for making HTTP requests.
@@ -18,11 +61,12 @@ class HTTPFetchTool(BaseTool):
         - headers: Optional headers dict
         - body: Optional request body (for POST/PUT/PATCH)
         - timeout: Optional timeout in seconds (default 30)
+        - include_body: Read and decode the response body (default True)
 
     Output:
         - status_code: HTTP status code
         - headers: Response headers
-        - body: Response body (text or JSON)
+        - body: Response body (text or JSON; None if include_body is False)
         - ok: Whether status code is 2xx
     """
 
@@ -30,6 +74,13 @@ class HTTPFetchTool(BaseTool):
     _allowed_domains: List[str] = []
     _blocked_domains: List[str] = []
 
+    # Lookup forms of the lists above, rebuilt by the setters: exact domains
+    # plus ".domain" suffixes for one-shot str.endswith() subdomain matching
+    _allowed_exact: FrozenSet[str] = frozenset()
+    _allowed_suffixes: Tuple[str, ...] = ()
+    _blocked_exact: FrozenSet[str] = frozenset()
+    _blocked_suffixes: Tuple[str, ...] = ()
+
     _spec = ToolSpec(
         name="http_fetch",
         description="Make HTTP requests to external APIs",
@@ -60,6 +111,11 @@ class HTTPFetchTool(BaseTool):
                     "description": "Timeout in seconds",
                     "default": 30,
                 },
+                "include_body": {
+                    "type": "boolean",
+                    "description": "Read the response body (false for status/header probes)",
+                    "default": True,
+                },
             },
             "required": ["url"],
         },
@@ -80,33 +136,42 @@ class HTTPFetchTool(BaseTool):
     def set_allowed_domains(cls, domains: List[str]) -> None:
         """Set allowed domains for HTTP requests."""
         cls._allowed_domains = domains
+        cls._allowed_exact = frozenset(domains)
+        cls._allowed_suffixes = tuple(f".{d}" for d in domains)
 
     @classmethod
     def set_blocked_domains(cls, domains: List[str]) -> None:
         """Set blocked domains for HTTP requests."""
         cls._blocked_domains = domains
+        cls._blocked_exact = frozenset(domains)
+        cls._blocked_suffixes = tuple(f".{d}" for d in domains)
 
     @property
     def spec(self) -> ToolSpec:
         return self._spec
 
+    @staticmethod
+    def _get_session() -> Any:
+        """Return the session shared with the other HTTP tools."""
+        return _http_pool.get_session()
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the shared session (call on shutdown)."""
+        await _http_pool.aclose()
+
     def _check_url_allowed(self, url: str) -> tuple[bool, Optional[str]]:
         """Check if URL is allowed based on domain rules."""
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        domain = parsed.netloc.lower()
+        domain = _domain_of(url)
 
         # Check blocked domains first
-        for blocked in self._blocked_domains:
-            if domain == blocked or domain.endswith(f".{blocked}"):
-                return False, f"Domain '{domain}' is blocked"
+        if domain in self._blocked_exact or domain.endswith(self._blocked_suffixes):
+            return False, f"Domain '{domain}' is blocked"
 
         # If allowlist is set, check against it
         if self._allowed_domains:
-            for allowed in self._allowed_domains:
-                if domain == allowed or domain.endswith(f".{allowed}"):
-                    return True, None
+            if domain in self._allowed_exact or domain.endswith(self._allowed_suffixes):
+                return True, None
             return False, f"Domain '{domain}' is not in the allowlist"
 
         return True, None
@@ -117,13 +182,16 @@ class HTTPFetchTool(BaseTool):
         context: ExecutionContext
     ) -> Dict[str, Any]:
         """Execute HTTP request."""
-        import aiohttp
+        if not _http_pool.AIOHTTP_AVAILABLE:
+            raise ImportError("http_fetch requires aiohttp (pip install aiohttp)")
+        aiohttp = _http_pool.aiohttp
 
         url = input["url"]
         method = input.get("method", "GET").upper()
         headers = input.get("headers", {})
         body = input.get("body")
         timeout_secs = input.get("timeout", 30)
+        include_body = input.get("include_body", True)
 
         # Check URL is allowed
         allowed, reason = self._check_url_allowed(url)
@@ -143,21 +211,28 @@ class HTTPFetchTool(BaseTool):
                 kwargs["data"] = body
 
         # Make request
-        async with aiohttp.ClientSession() as session:
-            async with session.request(method, url, **kwargs) as response:
-                # Get response body
-                content_type = response.headers.get("Content-Type", "")
-                if "application/json" in content_type:
-                    try:
-                        body_data = await response.json()
-                    except Exception:
-                        body_data = await response.text()
-                else:
+        session = self._get_session()
+        async with session.request(method, url, **kwargs) as response:
+            # Get response body
+            content_type = response.headers.get("Content-Type", "")
+            if not include_body:
+                # Hand the connection back without reading the payload
+                body_data = None
+                response.release()
+            elif "application/json" in content_type:
+                try:
+                    # Parse the raw bytes directly rather than decoding to
+                    # str first; empty bodies map to None like response.json()
+                    raw = await response.read()
+                    body_data = _loads(raw) if raw.strip() else None
+                except Exception:
                     body_data = await response.text()
-
-                return {
-                    "status_code": response.status,
-                    "headers": dict(response.headers),
-                    "body": body_data,
-                    "ok": 200 <= response.status < 300,
-                }
+            else:
+                body_data = await response.text()
+
+            return {
+                "status_code": response.status,
+                "headers": dict(response.headers),
+                "body": body_data,
+                "ok": 200 <= response.status < 300,
+            }
@@ -10,14 +10,42 @@ Enforces:
 """
 from __future__ import annotations
 
+import asyncio
 import urllib.request
 import urllib.error
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+from .._http_pool import AIOHTTP_AVAILABLE, aiohttp, get_session
 from ..base import BaseTool, ToolResult, ToolStatus, ToolCategory
 
+# Characters of body text returned to the caller
+_BODY_CHARS = 50_000
+# UTF-8 needs at most 4 bytes per character (and errors="replace" yields at
+# least one character per 4 bytes), so decoding this many bytes is enough
+# to produce the first _BODY_CHARS characters exactly
+_BODY_DECODE_BYTES = 4 * _BODY_CHARS
+
+
+def _content_type_allowed(ct: str, allowed_ct: List[str]) -> bool:
+    return not allowed_ct or any(ct.startswith(a) for a in allowed_ct)
+
+
+def _fetch_urllib(
+    url: str, timeout_s: float, max_bytes: int, allowed_ct: List[str]
+) -> Tuple[int, str, Optional[bytes]]:
+    """
+    Blocking stdlib GET (run via asyncio.to_thread); the body is None if
+    the content-type is rejected.
+    """
+    req = urllib.request.Request(url, method="GET")
+    with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+        ct = resp.headers.get("Content-Type", "")
+        if not _content_type_allowed(ct, allowed_ct):
+            return resp.status, ct, None
+        return resp.status, ct, resp.read(max_bytes)
+
 
 class HttpFetchSafe(BaseTool):
     """Safe HTTP GET with domain allowlist and size caps."""
@@ -61,49 +89,69 @@ class HttpFetchSafe(BaseTool):
         # Domain check
         if not unsafe and not allowed_domains:
             return ToolResult(
-                status=ToolStatus.ERROR,
-                data={"error": "allowed_domains is required (or set unsafe=true)"},
+                ToolStatus.ERROR,
+                {"error": "allowed_domains is required (or set unsafe=true)"},
             )
         if not unsafe and domain not in allowed_domains:
             return ToolResult(
-                status=ToolStatus.ERROR,
-                data={"error": f"Domain '{domain}' not in allowlist: {allowed_domains}"},
+                ToolStatus.ERROR,
+                {"error": f"Domain '{domain}' not in allowlist: {allowed_domains}"},
             )
 
         start = time.time()
         try:
-            req = urllib.request.Request(url, method="GET")
-            with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-                ct = resp.headers.get("Content-Type", "")
-                if allowed_ct and not any(ct.startswith(a) for a in allowed_ct):
-                    return ToolResult(
-                        status=ToolStatus.ERROR,
-                        data={"error": f"Content-Type '{ct}' not allowed. Allowed: {allowed_ct}"},
-                    )
-                body = resp.read(max_bytes)
-                status_code = resp.status
+            if AIOHTTP_AVAILABLE:
+                session = get_session()
+                async with session.get(
+                    url,
+                    timeout=aiohttp.ClientTimeout(total=timeout_s),
+                    raise_for_status=True,
+                ) as resp:
+                    status_code = resp.status
+                    ct = resp.headers.get("Content-Type", "")
+                    body: Optional[Union[bytes, bytearray]] = None
+                    if _content_type_allowed(ct, allowed_ct):
+                        buf = bytearray()
+                        while len(buf) < max_bytes:
+                            chunk = await resp.content.read(max_bytes - len(buf))
+                            if not chunk:
+                                break
+                            buf += chunk
+                        body = buf
+            else:
+                status_code, ct, body = await asyncio.to_thread(
+                    _fetch_urllib, url, timeout_s, max_bytes, allowed_ct
+                )
         except urllib.error.URLError as exc:
             return ToolResult(
-                status=ToolStatus.ERROR,
-                data={"error": str(exc), "url": url},
+                ToolStatus.ERROR,
+                {"error": str(exc), "url": url},
             )
         except Exception as exc:
             return ToolResult(
-                status=ToolStatus.ERROR,
-                data={"error": str(exc), "url": url},
+                ToolStatus.ERROR,
+                {"error": str(exc), "url": url},
+            )
+
+        if body is None:
+            return ToolResult(
+                ToolStatus.ERROR,
+                {"error": f"Content-Type '{ct}' not allowed. Allowed: {allowed_ct}"},
             )
 
         duration_ms = (time.time() - start) * 1000
 
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={
+            ToolStatus.SUCCESS,
+            {
                 "url": url,
                 "domain": domain,
                 "status_code": status_code,
                 "content_type": ct,
                 "size_bytes": len(body),
-                "body": body.decode("utf-8", errors="replace")[:50_000],
+                "body": str(
+                    memoryview(body)[:_BODY_DECODE_BYTES], "utf-8", "replace",
+                )[:_BODY_CHARS],
                 "duration_ms": round(duration_ms, 2),
             },
         )
@@ -4,9 +4,23 @@ Memory Tools - File-based key-value storage.
 Pure Python, no external dependencies.
 Uses FileKVStore for persistence.
 """
+import functools
+from pathlib import Path
+
+from ...persistence import FileKVStore, get_huap_home
 from ..base import BaseTool, ExecutionContext, ToolCategory, ToolResult, ToolStatus
 
 
+@functools.lru_cache(maxsize=4)
+def _kv_store_at(base_dir: Path) -> FileKVStore:
+    return FileKVStore(base_dir)
+
+
+def _kv_store() -> FileKVStore:
+    """Shared FileKVStore for the current HUAP_HOME (built once per directory)."""
+    return _kv_store_at(get_huap_home() / "kv")
+
+
 class MemoryReadTool(BaseTool):
     """Read a value from pod memory."""
 
@@ -36,26 +50,24 @@ class MemoryReadTool(BaseTool):
         context: ExecutionContext = None,
     ) -> ToolResult:
         """Execute the memory read tool."""
-        from ...persistence import FileKVStore
-
         key = input_data.get("key")
         namespace = input_data.get("namespace", "default")
 
         if context and context.pod_name:
             namespace = context.pod_name
 
-        store = FileKVStore()
+        store = _kv_store()
         value = store.get(namespace, key)
 
         if value is None:
             return ToolResult(
-                status=ToolStatus.SUCCESS,
-                data={"key": key, "value": None, "found": False},
+                ToolStatus.SUCCESS,
+                {"key": key, "value": None, "found": False},
             )
 
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"key": key, "value": value, "found": True},
+            ToolStatus.SUCCESS,
+            {"key": key, "value": value, "found": True},
         )
 
 
@@ -91,8 +103,6 @@ class MemoryWriteTool(BaseTool):
         context: ExecutionContext = None,
     ) -> ToolResult:
         """Execute the memory write tool."""
-        from ...persistence import FileKVStore
-
         key = input_data.get("key")
         value = input_data.get("value")
         namespace = input_data.get("namespace", "default")
@@ -100,12 +110,12 @@ class MemoryWriteTool(BaseTool):
         if context and context.pod_name:
             namespace = context.pod_name
 
-        store = FileKVStore()
+        store = _kv_store()
         store.set(namespace, key, value)
 
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"key": key, "written": True},
+            ToolStatus.SUCCESS,
+            {"key": key, "written": True},
         )
 
 
@@ -138,20 +148,18 @@ class MemoryDeleteTool(BaseTool):
         context: ExecutionContext = None,
     ) -> ToolResult:
         """Execute the memory delete tool."""
-        from ...persistence import FileKVStore
-
         key = input_data.get("key")
         namespace = input_data.get("namespace", "default")
 
         if context and context.pod_name:
             namespace = context.pod_name
 
-        store = FileKVStore()
+        store = _kv_store()
         deleted = store.delete(namespace, key)
 
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"key": key, "deleted": deleted},
+            ToolStatus.SUCCESS,
+            {"key": key, "deleted": deleted},
         )
 
 
@@ -179,17 +187,15 @@ class MemoryListTool(BaseTool):
         context: ExecutionContext = None,
     ) -> ToolResult:
         """Execute the memory list tool."""
-        from ...persistence import FileKVStore
-
         namespace = input_data.get("namespace", "default")
 
         if context and context.pod_name:
             namespace = context.pod_name
 
-        store = FileKVStore()
+        store = _kv_store()
         keys = store.list_keys(namespace)
 
         return ToolResult(
-            status=ToolStatus.SUCCESS,
-            data={"namespace": namespace, "keys": keys, "count": len(keys)},
+            ToolStatus.SUCCESS,
+            {"namespace": namespace, "keys": keys, "count": len(keys)},
         )
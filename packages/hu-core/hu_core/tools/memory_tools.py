@@ -7,19 +7,46 @@ Exposed as standard HUAP tools so memory operations appear as
 Tools:
     memory.retain  — store a memory item
     memory.recall  — retrieve relevant memories
+    memory.recall_many — retrieve memories for several queries in one batch
     memory.reflect — synthesise insights from memories
 """
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, Optional
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
 
 from ..ports.memory import MemoryPort, InMemoryPort
+from .registry import NULL_TRACER
+
+
+# Context-local port (for concurrent run isolation)
+_context_port: ContextVar[Optional[MemoryPort]] = ContextVar("memory_port", default=None)
+
+# Process-wide fallback port, so calls without an explicit port share state
+_DEFAULT_PORT: MemoryPort = InMemoryPort()
+
+
+def set_context_port(port: Optional[MemoryPort]) -> None:
+    """
+    Set the memory port used by memory tools in the current async context.
+
+    Use this to isolate concurrent runs:
+        set_context_port(InMemoryPort())
+        try:
+            await run_workflow(...)
+        finally:
+            set_context_port(None)
+    """
+    _context_port.set(port)
 
 
 def _get_port(port: Optional[MemoryPort] = None) -> MemoryPort:
-    """Return the supplied port or a default InMemoryPort."""
-    return port or InMemoryPort()
+    """Return the supplied port, else the context-local one, else the shared default."""
+    if port is not None:
+        return port
+    ctx_port = _context_port.get()
+    return ctx_port if ctx_port is not None else _DEFAULT_PORT
 
 
 async def memory_retain(
@@ -28,23 +55,26 @@ async def memory_retain(
     context: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
     port: Optional[MemoryPort] = None,
-    tracer=None,
+    tracer=NULL_TRACER,
 ) -> Dict[str, Any]:
     """Tool: memory.retain — store a memory item."""
-    if tracer:
-        tracer.tool_call("memory.retain", {"bank_id": bank_id, "content": content[:200], "context": context})
+    tracer = tracer or NULL_TRACER
+    if tracer is not NULL_TRACER:
+        # Skip building the truncated payload when nothing records it
+        tracer.tool_call(
+            "memory.retain", {"bank_id": bank_id, "content": content[:200], "context": context}
+        )
 
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     p = _get_port(port)
     item = await p.retain(bank_id, content, context=context, metadata=metadata)
     result = {"status": "retained", "item": item.to_dict()}
 
-    if tracer:
-        tracer.tool_result(
-            "memory.retain",
-            {"status": "retained", "item_id": item.id, "bank_id": bank_id},
-            duration_ms=(time.time() - t0) * 1000,
-        )
+    tracer.tool_result(
+        "memory.retain",
+        {"status": "retained", "item_id": item.id, "bank_id": bank_id},
+        duration_ms=(time.perf_counter_ns() - t0) / 1_000_000,
+    )
 
     return result
 
@@ -55,27 +85,71 @@ async def memory_recall(
     k: int = 10,
     filters: Optional[Dict[str, Any]] = None,
     port: Optional[MemoryPort] = None,
-    tracer=None,
+    tracer=NULL_TRACER,
+    serialize: bool = True,
 ) -> Dict[str, Any]:
-    """Tool: memory.recall — retrieve relevant memories."""
-    if tracer:
-        tracer.tool_call("memory.recall", {"bank_id": bank_id, "query": query, "k": k})
+    """
+    Tool: memory.recall — retrieve relevant memories.
+
+    With ``serialize=False`` the result holds the MemoryItem objects
+    instead of their dicts, for callers that consume them in-process.
+    """
+    tracer = tracer or NULL_TRACER
+    tracer.tool_call("memory.recall", {"bank_id": bank_id, "query": query, "k": k})
 
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     p = _get_port(port)
     items = await p.recall(bank_id, query, k=k, filters=filters)
     result = {
         "status": "recalled",
         "count": len(items),
-        "items": [i.to_dict() for i in items],
+        "items": [i.to_dict() for i in items] if serialize else items,
     }
 
-    if tracer:
-        tracer.tool_result(
-            "memory.recall",
-            {"status": "recalled", "count": len(items), "query": query},
-            duration_ms=(time.time() - t0) * 1000,
-        )
+    tracer.tool_result(
+        "memory.recall",
+        {"status": "recalled", "count": len(items), "query": query},
+        duration_ms=(time.perf_counter_ns() - t0) / 1_000_000,
+    )
+
+    return result
+
+
+async def memory_recall_many(
+    bank_id: str,
+    queries: List[str],
+    k: int = 10,
+    filters: Optional[Dict[str, Any]] = None,
+    port: Optional[MemoryPort] = None,
+    tracer=NULL_TRACER,
+    serialize: bool = True,
+) -> Dict[str, Any]:
+    """
+    Tool: memory.recall_many — retrieve memories for several queries at once.
+
+    ``serialize`` behaves as in memory_recall.
+    """
+    tracer = tracer or NULL_TRACER
+    tracer.tool_call("memory.recall_many", {"bank_id": bank_id, "queries": queries, "k": k})
+
+    t0 = time.perf_counter_ns()
+    p = _get_port(port)
+    batches = await p.recall_batch(bank_id, queries, k=k, filters=filters)
+    results = [
+        {
+            "query": q,
+            "count": len(items),
+            "items": [i.to_dict() for i in items] if serialize else items,
+        }
+        for q, items in zip(queries, batches)
+    ]
+    result = {"status": "recalled", "count": len(results), "results": results}
+
+    tracer.tool_result(
+        "memory.recall_many",
+        {"status": "recalled", "count": len(results), "queries": queries},
+        duration_ms=(time.perf_counter_ns() - t0) / 1_000_000,
+    )
 
     return result
 
@@ -86,26 +160,30 @@ async def memory_reflect(
     k: int = 10,
     filters: Optional[Dict[str, Any]] = None,
     port: Optional[MemoryPort] = None,
-    tracer=None,
+    tracer=NULL_TRACER,
+    serialize: bool = True,
 ) -> Dict[str, Any]:
-    """Tool: memory.reflect — synthesise insights from memories."""
-    if tracer:
-        tracer.tool_call("memory.reflect", {"bank_id": bank_id, "query": query, "k": k})
+    """
+    Tool: memory.reflect — synthesise insights from memories.
+
+    ``serialize`` behaves as in memory_recall.
+    """
+    tracer = tracer or NULL_TRACER
+    tracer.tool_call("memory.reflect", {"bank_id": bank_id, "query": query, "k": k})
 
-    t0 = time.time()
+    t0 = time.perf_counter_ns()
     p = _get_port(port)
     items = await p.reflect(bank_id, query, k=k, filters=filters)
     result = {
         "status": "reflected",
         "count": len(items),
-        "items": [i.to_dict() for i in items],
+        "items": [i.to_dict() for i in items] if serialize else items,
     }
 
-    if tracer:
-        tracer.tool_result(
-            "memory.reflect",
-            {"status": "reflected", "count": len(items)},
-            duration_ms=(time.time() - t0) * 1000,
-        )
+    tracer.tool_result(
+        "memory.reflect",
+        {"status": "reflected", "count": len(items)},
+        duration_ms=(time.perf_counter_ns() - t0) / 1_000_000,
+    )
 
     return result
@@ -6,11 +6,15 @@ validation, timing, permission checking, and logging.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 import time
 import uuid
-from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Set
+from collections import Counter, deque
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Sequence, Set, Tuple
 
 from .base import (
     BaseTool,
@@ -25,8 +29,53 @@ from .base import (
 logger = logging.getLogger(__name__)
 
 
+def _noop(*args: Any, **kwargs: Any) -> None:
+    """Trace emitter used when no tracer is set."""
+
+
+class NullTracer:
+    """
+    Tracer that drops every event.
+
+    Stands in for "no tracer" so tool code can always call through
+    instead of checking for None.
+    """
+
+    __slots__ = ()
+
+    def tool_call(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def tool_result(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+NULL_TRACER = NullTracer()
+
+
+# (tool_name, context, result, input_summary) awaiting ToolRegistry.flush_logs()
+_PendingLog = Tuple[str, ExecutionContext, ToolResult, Optional[str]]
+
+_EPOCH = datetime(1970, 1, 1)
+
+_AccessKey = Tuple[Optional[str], str, FrozenSet[str], bool]
+_AccessDecision = Tuple[bool, Optional[str]]
+
+
 class ToolExecutionLog:
-    """Record of a tool execution for auditing."""
+    """
+    Record of a tool execution for auditing.
+
+    The id and the datetime timestamp are produced on first access; most
+    entries are never read, so only the raw wall-clock nanoseconds are
+    taken per execution.
+    """
+
+    __slots__ = (
+        "_id", "timestamp_ns", "tool_name", "user_id", "pod_name",
+        "session_id", "correlation_id", "status", "duration_ms", "error",
+        "input_summary",
+    )
 
     def __init__(
         self,
@@ -35,8 +84,18 @@ class ToolExecutionLog:
         result: ToolResult,
         input_summary: Optional[str] = None,
     ):
-        self.id = str(uuid.uuid4())
-        self.timestamp = datetime.utcnow()
+        self.reset(tool_name, context, result, input_summary)
+
+    def reset(
+        self,
+        tool_name: str,
+        context: ExecutionContext,
+        result: ToolResult,
+        input_summary: Optional[str] = None,
+    ) -> None:
+        """Overwrite this record in place with a new execution."""
+        self._id: Optional[str] = None
+        self.timestamp_ns = time.time_ns()
         self.tool_name = tool_name
         self.user_id = context.user_id
         self.pod_name = context.pod_name
@@ -47,6 +106,18 @@ class ToolExecutionLog:
         self.error = result.error
         self.input_summary = input_summary
 
+    @property
+    def id(self) -> str:
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
+    @property
+    def timestamp(self) -> datetime:
+        """Naive UTC datetime of the execution."""
+        seconds, ns = divmod(self.timestamp_ns, 1_000_000_000)
+        return _EPOCH + timedelta(seconds=seconds, microseconds=ns // 1000)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -73,36 +144,62 @@ class ToolPermissionConfig:
         self._tool_capabilities: Dict[str, Set[str]] = {}
         # Default: all pods can use all tools (can be restricted)
         self._allow_all_by_default = True
+        # (pod, tool, capabilities, default) -> decision; cleared on mutation
+        self._decision_cache: Dict[_AccessKey, _AccessDecision] = {}
+        self._max_cache_size = 4096
 
     def allow_pod(self, pod_name: str, tool_names: List[str]) -> None:
         """Allow a pod to use specific tools."""
+        pod_name = sys.intern(pod_name)
         if pod_name not in self._pod_permissions:
             self._pod_permissions[pod_name] = set()
-        self._pod_permissions[pod_name].update(tool_names)
+        self._pod_permissions[pod_name].update(map(sys.intern, tool_names))
+        self._decision_cache.clear()
 
     def allow_pod_all(self, pod_name: str) -> None:
         """Allow a pod to use all tools."""
-        self._pod_permissions[pod_name] = {"*"}
+        self._pod_permissions[sys.intern(pod_name)] = {"*"}
+        self._decision_cache.clear()
 
     def deny_pod_all(self, pod_name: str) -> None:
         """Deny a pod access to all tools (must explicitly allow)."""
-        self._pod_permissions[pod_name] = set()
+        self._pod_permissions[sys.intern(pod_name)] = set()
+        self._decision_cache.clear()
 
     def set_tool_capabilities(self, tool_name: str, capabilities: List[str]) -> None:
         """Set required capabilities for a tool."""
         self._tool_capabilities[tool_name] = set(capabilities)
+        self._decision_cache.clear()
 
     def can_access(
         self,
         pod_name: Optional[str],
         tool_name: str,
-        capabilities: List[str]
+        capabilities: Iterable[str]
     ) -> tuple[bool, Optional[str]]:
         """
         Check if a pod can access a tool.
 
         Returns (allowed, reason) tuple.
         """
+        key = (pod_name, tool_name, frozenset(capabilities), self._allow_all_by_default)
+        try:
+            return self._decision_cache[key]
+        except KeyError:
+            pass
+        decision = self._decide(pod_name, tool_name, key[2])
+        if len(self._decision_cache) >= self._max_cache_size:
+            self._decision_cache.clear()
+        self._decision_cache[key] = decision
+        return decision
+
+    def _decide(
+        self,
+        pod_name: Optional[str],
+        tool_name: str,
+        provided: FrozenSet[str],
+    ) -> _AccessDecision:
+        """Uncached permission check behind can_access."""
         # Check pod-level permissions
         if pod_name and pod_name in self._pod_permissions:
             allowed_tools = self._pod_permissions[pod_name]
@@ -114,7 +211,6 @@ class ToolPermissionConfig:
         # Check capability requirements
         if tool_name in self._tool_capabilities:
             required = self._tool_capabilities[tool_name]
-            provided = set(capabilities)
             missing = required - provided
             if missing:
                 return False, f"Missing capabilities: {', '.join(missing)}"
@@ -136,17 +232,36 @@ class ToolRegistry:
 
     def __init__(self, tracer: Optional[Any] = None):
         self._tools: Dict[str, Tool] = {}
-        self._execution_logs: List[ToolExecutionLog] = []
-        self._permissions = ToolPermissionConfig()
         self._max_log_size = 10000  # Keep last N logs in memory
+        # Ring buffer: appending past maxlen drops the oldest entry in O(1)
+        self._execution_logs: Deque[ToolExecutionLog] = deque(maxlen=self._max_log_size)
+        # The same entries indexed by tool and by pod, oldest first
+        self._logs_by_tool: Dict[str, Deque[ToolExecutionLog]] = {}
+        self._logs_by_pod: Dict[Optional[str], Deque[ToolExecutionLog]] = {}
+        self._permissions = ToolPermissionConfig()
+        # Running totals for get_stats(), maintained as tools/logs change
+        self._status_counts: Counter[str] = Counter()
+        self._category_counts: Counter[str] = Counter()
+        # Input validators of BaseTool instances, resolved at registration
+        self._validators: Dict[str, Callable[[Dict[str, Any]], List[str]]] = {}
+        # Tool names by category/tag/capability (dicts as ordered sets)
+        self._names_by_category: Dict[ToolCategory, Dict[str, None]] = {}
+        self._names_by_tag: Dict[str, Dict[str, None]] = {}
+        self._names_by_capability: Dict[str, Dict[str, None]] = {}
         self._on_execute_callbacks: List[Callable[[ToolExecutionLog], None]] = []
+        # All callbacks composed into one call, rebuilt by on_execute()
+        self._notify: Callable[[ToolExecutionLog], None] = _noop
+        # Executions not yet recorded; flushed in batches off the call path
+        self._pending_logs: List[_PendingLog] = []
+        self._max_pending_logs = 8192
+        self._flush_loop: Optional[asyncio.AbstractEventLoop] = None
         self._tracer = tracer
-        self._use_trace_service = hasattr(tracer, 'tool_call') if tracer else False
+        self._bind_tracer()
 
     def set_tracer(self, tracer: Any) -> None:
         """Set the tracer for this registry."""
         self._tracer = tracer
-        self._use_trace_service = hasattr(tracer, 'tool_call') if tracer else False
+        self._bind_tracer()
 
     def get_tracer(self) -> Optional[Any]:
         """Get the current tracer for this registry."""
@@ -164,13 +279,49 @@ class ToolRegistry:
         Raises:
             ValueError: If tool with same name already exists
         """
-        name = tool.spec.name
+        # Interned so lookups by the same name compare by identity
+        name = sys.intern(tool.spec.name)
         if name in self._tools:
             raise ValueError(f"Tool '{name}' is already registered")
 
         self._tools[name] = tool
+        self._category_counts[tool.spec.category.value] += 1
+        self._index_tool(name, tool.spec)
         logger.info(f"Registered tool: {name} v{tool.spec.version}")
 
+    def register_many(self, tools: Iterable[Tool], skip_existing: bool = False) -> int:
+        """
+        Register several tools in one batch.
+
+        Args:
+            tools: Tool instances implementing the Tool protocol
+            skip_existing: Skip tools whose name is already registered
+                instead of raising
+
+        Returns:
+            Number of tools registered
+
+        Raises:
+            ValueError: If a tool name is already registered (or repeated in
+                the batch) and skip_existing is False; nothing is registered
+        """
+        new: Dict[str, Tool] = {}
+        for tool in tools:
+            name = sys.intern(tool.spec.name)
+            if name in self._tools or name in new:
+                if skip_existing:
+                    continue
+                raise ValueError(f"Tool '{name}' is already registered")
+            new[name] = tool
+
+        self._tools.update(new)
+        self._category_counts.update(tool.spec.category.value for tool in new.values())
+        for name, tool in new.items():
+            self._index_tool(name, tool.spec)
+        if new:
+            logger.info(f"Registered tools: {', '.join(new)}")
+        return len(new)
+
     def unregister(self, name: str) -> bool:
         """
         Remove a tool from the registry.
@@ -178,11 +329,37 @@ class ToolRegistry:
         Returns True if tool was removed, False if not found.
         """
         if name in self._tools:
-            del self._tools[name]
+            tool = self._tools.pop(name)
+            self._category_counts[tool.spec.category.value] -= 1
+            self._unindex_tool(name, tool.spec)
             logger.info(f"Unregistered tool: {name}")
             return True
         return False
 
+    def _index_tool(self, name: str, spec: ToolSpec) -> None:
+        tool = self._tools[name]
+        if isinstance(tool, BaseTool):
+            self._validators[name] = tool.validate_input
+        self._names_by_category.setdefault(spec.category, {})[name] = None
+        for tag in spec.tags:
+            self._names_by_tag.setdefault(tag, {})[name] = None
+        for capability in spec.required_capabilities:
+            self._names_by_capability.setdefault(capability, {})[name] = None
+
+    def _unindex_tool(self, name: str, spec: ToolSpec) -> None:
+        self._validators.pop(name, None)
+        for index, keys in (
+            (self._names_by_category, (spec.category,)),
+            (self._names_by_tag, spec.tags),
+            (self._names_by_capability, spec.required_capabilities),
+        ):
+            for key in keys:
+                names = index.get(key)
+                if names is not None:
+                    names.pop(name, None)
+                    if not names:
+                        del index[key]
+
     # --- Discovery ---
 
     def get(self, name: str) -> Optional[Tool]:
@@ -212,10 +389,22 @@ class ToolRegistry:
         Returns:
             List of matching tool specifications
         """
-        results = []
+        # Start from the smallest index among the given filters; only
+        # name_contains on its own needs a scan of every tool
+        candidates: Iterable[str] = self._tools
+        for value, index in (
+            (category, self._names_by_category),
+            (tag, self._names_by_tag),
+            (capability, self._names_by_capability),
+        ):
+            if value:
+                names = index.get(value, {})
+                if candidates is self._tools or len(names) < len(candidates):
+                    candidates = names
 
-        for tool in self._tools.values():
-            spec = tool.spec
+        results = []
+        for name in candidates:
+            spec = self._tools[name].spec
 
             # Apply filters
             if category and spec.category != category:
@@ -259,7 +448,7 @@ class ToolRegistry:
             ToolResult with status, data, and metadata
         """
         context = context or ExecutionContext()
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
 
         # Get tool
         tool = self._tools.get(name)
@@ -273,18 +462,12 @@ class ToolRegistry:
             return result
 
         # Check permissions
-        permissions_dict = {}
         if check_permissions:
             allowed, reason = self._permissions.can_access(
                 context.pod_name,
                 name,
                 context.capabilities
             )
-            permissions_dict = {
-                "allowed": allowed,
-                "pod": context.pod_name,
-                "capabilities": context.capabilities,
-            }
             if not allowed:
                 result = ToolResult(
                     status=ToolStatus.DENIED,
@@ -295,8 +478,9 @@ class ToolRegistry:
                 return result
 
         # Validate input
-        if validate and isinstance(tool, BaseTool):
-            errors = tool.validate_input(input)
+        validator = self._validators.get(name) if validate else None
+        if validator is not None:
+            errors = validator(input)
             if errors:
                 result = ToolResult(
                     status=ToolStatus.VALIDATION_ERROR,
@@ -307,12 +491,12 @@ class ToolRegistry:
                 return result
 
         # Trace tool call (after validation passes)
-        self._trace_tool_call(name, input, permissions_dict, context)
+        self._trace_tool_call(name, input, context, check_permissions)
 
         # Execute tool
         try:
             data = await tool(input, context)
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
 
             result = ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -324,7 +508,7 @@ class ToolRegistry:
             )
 
         except TimeoutError as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             result = ToolResult(
                 status=ToolStatus.TIMEOUT,
                 error=str(e),
@@ -332,7 +516,7 @@ class ToolRegistry:
             )
 
         except Exception as e:
-            duration_ms = (time.perf_counter() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
             logger.exception(f"Tool '{name}' execution failed")
             result = ToolResult(
                 status=ToolStatus.ERROR,
@@ -344,6 +528,36 @@ class ToolRegistry:
         self._trace_tool_result(name, result, context)
         return result
 
+    async def execute_fast(
+        self,
+        name: str,
+        input: Dict[str, Any],
+        context: Optional[ExecutionContext] = None,
+    ) -> ToolResult:
+        """
+        Execute a tool for trusted internal callers.
+
+        Skips permission checks, input validation, execution logs,
+        callbacks and tracing; only timing and error capture remain.
+        Use execute() for anything that must be audited or replayed.
+        """
+        tool = self._tools.get(name)
+        if tool is None:
+            return ToolResult(ToolStatus.ERROR, error=f"Tool '{name}' not found")
+
+        start_time = time.perf_counter_ns()
+        try:
+            data = await tool(input, context or ExecutionContext())
+        except TimeoutError as e:
+            status, data, error = ToolStatus.TIMEOUT, None, str(e)
+        except Exception as e:
+            logger.exception("Tool '%s' execution failed", name)
+            status, data, error = ToolStatus.ERROR, None, str(e)
+        else:
+            status, error = ToolStatus.SUCCESS, None
+        duration_ms = (time.perf_counter_ns() - start_time) / 1_000_000
+        return ToolResult(status, data, error, duration_ms)
+
     # --- Permissions ---
 
     @property
@@ -370,60 +584,91 @@ class ToolRegistry:
 
     # --- Tracing ---
 
-    def _trace_tool_call(
+    def _bind_tracer(self) -> None:
+        """
+        Pick the tool_call/tool_result emitters once per tracer, so emitting
+        an event is a direct call with no per-event type checks.
+        """
+        tracer = self._tracer
+        if not tracer or tracer is NULL_TRACER:
+            self._trace_tool_call = _noop
+            self._trace_tool_result = _noop
+        elif hasattr(tracer, "tool_call"):
+            self._trace_tool_call = self._service_tool_call
+            self._trace_tool_result = self._service_tool_result
+        else:
+            self._trace_tool_call = self._legacy_tool_call
+            self._trace_tool_result = self._legacy_tool_result
+
+    def _service_tool_call(
         self,
         tool_name: str,
         input: Dict[str, Any],
-        permissions: Dict[str, Any],
         context: ExecutionContext,
+        permissions_checked: bool,
     ) -> None:
-        """Emit tool_call trace event."""
-        if not self._tracer:
-            return
+        """Emit tool_call trace event via TraceService."""
+        # Built here rather than in execute(), so untraced calls skip it;
+        # a traced call only gets this far once access was allowed
+        permissions: Dict[str, Any] = {}
+        if permissions_checked:
+            permissions = {
+                "allowed": True,
+                "pod": context.pod_name,
+                # Sorted list: JSON-serializable and stable across runs
+                "capabilities": sorted(context.capabilities),
+            }
+        self._tracer.tool_call(
+            tool=tool_name,
+            input_data=input,
+            permissions=permissions,
+            pod=context.pod_name,
+        )
 
-        if self._use_trace_service:
-            self._tracer.tool_call(
-                tool=tool_name,
-                input_data=input,
-                permissions=permissions,
-                pod=context.pod_name,
-            )
-        else:
-            # Legacy callable tracer
-            self._tracer({
-                "event": "tool_call",
-                "tool": tool_name,
-                "input_keys": list(input.keys()) if input else [],
-            })
-
-    def _trace_tool_result(
+    def _legacy_tool_call(
+        self,
+        tool_name: str,
+        input: Dict[str, Any],
+        context: ExecutionContext,
+        permissions_checked: bool,
+    ) -> None:
+        """Emit tool_call trace event to a legacy callable tracer."""
+        self._tracer({
+            "event": "tool_call",
+            "tool": tool_name,
+            "input_keys": list(input.keys()) if input else [],
+        })
+
+    def _service_tool_result(
         self,
         tool_name: str,
         result: ToolResult,
         context: ExecutionContext,
     ) -> None:
-        """Emit tool_result trace event."""
-        if not self._tracer:
-            return
+        """Emit tool_result trace event via TraceService."""
+        result_data = result.data if result.data else {}
+        self._tracer.tool_result(
+            tool=tool_name,
+            result=result_data if isinstance(result_data, dict) else {"value": result_data},
+            duration_ms=result.duration_ms or 0,
+            status=result.status.value,
+            error=result.error,
+            pod=context.pod_name,
+        )
 
-        if self._use_trace_service:
-            result_data = result.data if result.data else {}
-            self._tracer.tool_result(
-                tool=tool_name,
-                result=result_data if isinstance(result_data, dict) else {"value": result_data},
-                duration_ms=result.duration_ms or 0,
-                status=result.status.value,
-                error=result.error,
-                pod=context.pod_name,
-            )
-        else:
-            # Legacy callable tracer
-            self._tracer({
-                "event": "tool_result",
-                "tool": tool_name,
-                "status": result.status.value,
-                "duration_ms": result.duration_ms,
-            })
+    def _legacy_tool_result(
+        self,
+        tool_name: str,
+        result: ToolResult,
+        context: ExecutionContext,
+    ) -> None:
+        """Emit tool_result trace event to a legacy callable tracer."""
+        self._tracer({
+            "event": "tool_result",
+            "tool": tool_name,
+            "status": result.status.value,
+            "duration_ms": result.duration_ms,
+        })
 
     # --- Logging ---
 
@@ -434,39 +679,82 @@ class ToolRegistry:
         result: ToolResult,
         input: Dict[str, Any],
     ) -> None:
-        """Log a tool execution."""
-        # Create summary of input (avoid logging sensitive data)
-        input_summary = ", ".join(input.keys()) if input else None
+        """
+        Queue a tool execution for recording.
 
-        log_entry = ToolExecutionLog(
-            tool_name=tool_name,
-            context=context,
-            result=result,
-            input_summary=input_summary,
-        )
+        The log entry, stats, logger line and on_execute callbacks are
+        handled by flush_logs(), scheduled once per event-loop iteration,
+        so a burst of executions is recorded in one batch.
+        """
+        # Create summary of input now (avoid logging sensitive data, and
+        # the caller may reuse the dict)
+        input_summary = ", ".join(input.keys()) if input else None
+        self._pending_logs.append((tool_name, context, result, input_summary))
 
-        # Store in memory (with limit)
-        self._execution_logs.append(log_entry)
-        if len(self._execution_logs) > self._max_log_size:
-            self._execution_logs = self._execution_logs[-self._max_log_size:]
+        if len(self._pending_logs) >= self._max_pending_logs:
+            self.flush_logs()
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush_logs()
+            return
+        # Comparing loops (not a bool) means a flush stranded on a closed
+        # loop cannot block scheduling on the next one
+        if self._flush_loop is not loop:
+            self._flush_loop = loop
+            loop.call_soon(self.flush_logs)
+
+    def flush_logs(self) -> None:
+        """Record all pending tool executions (readers call this first)."""
+        self._flush_loop = None
+        pending, self._pending_logs = self._pending_logs, []
+        for tool_name, context, result, input_summary in pending:
+            self._record_execution(tool_name, context, result, input_summary)
+
+    def _record_execution(
+        self,
+        tool_name: str,
+        context: ExecutionContext,
+        result: ToolResult,
+        input_summary: Optional[str],
+    ) -> None:
+        """Store, log and announce one execution."""
+        logs = self._execution_logs
+        log_entry: Optional[ToolExecutionLog] = None
+        if len(logs) == logs.maxlen:
+            evicted = logs[0]
+            self._status_counts[evicted.status] -= 1
+            _drop_oldest(self._logs_by_tool, evicted.tool_name)
+            _drop_oldest(self._logs_by_pod, evicted.pod_name)
+            # Without callbacks nothing outside the registry can hold the
+            # evicted record, so it is recycled for this execution
+            if not self._on_execute_callbacks:
+                log_entry = evicted
+                log_entry.reset(tool_name, context, result, input_summary)
+        if log_entry is None:
+            log_entry = ToolExecutionLog(tool_name, context, result, input_summary)
+
+        # Store in memory (deque maxlen enforces the limit)
+        logs.append(log_entry)
+        self._status_counts[log_entry.status] += 1
+        _index_append(self._logs_by_tool, tool_name, log_entry)
+        _index_append(self._logs_by_pod, log_entry.pod_name, log_entry)
 
         # Log to standard logger
         log_level = logging.INFO if result.success else logging.WARNING
-        logger.log(
-            log_level,
-            f"Tool execution: {tool_name} | "
-            f"status={result.status.value} | "
-            f"duration={result.duration_ms:.2f}ms | "
-            f"pod={context.pod_name} | "
-            f"user={context.user_id}"
-        )
+        if logger.isEnabledFor(log_level):
+            logger.log(
+                log_level,
+                "Tool execution: %s | status=%s | duration=%.2fms | pod=%s | user=%s",
+                tool_name,
+                result.status.value,
+                result.duration_ms,
+                context.pod_name,
+                context.user_id,
+            )
 
-        # Notify callbacks
-        for callback in self._on_execute_callbacks:
-            try:
-                callback(log_entry)
-            except Exception:
-                logger.exception("Error in tool execution callback")
+        self._notify(log_entry)
 
     def get_execution_logs(
         self,
@@ -487,26 +775,44 @@ class ToolRegistry:
         Returns:
             List of log entries as dictionaries
         """
-        logs = self._execution_logs
-
-        if tool_name:
-            logs = [entry for entry in logs if entry.tool_name == tool_name]
-        if pod_name:
-            logs = [entry for entry in logs if entry.pod_name == pod_name]
-        if status:
-            logs = [entry for entry in logs if entry.status == status]
-
-        # Return most recent first
-        return [entry.to_dict() for entry in reversed(logs[-limit:])]
+        self.flush_logs()
+        logs: Sequence[ToolExecutionLog] = self._execution_logs
+
+        # Start from the smaller index matching the tool/pod filters; only
+        # the other filter still has to be checked per entry
+        by_tool = self._logs_by_tool.get(tool_name, ()) if tool_name else None
+        by_pod = self._logs_by_pod.get(pod_name, ()) if pod_name else None
+        if by_pod is not None and (by_tool is None or len(by_pod) < len(by_tool)):
+            logs, pod_name = by_pod, None
+        elif by_tool is not None:
+            logs, tool_name = by_tool, None
+
+        # Most recent first; the remaining filters stop at `limit` matches
+        entries: Iterable[ToolExecutionLog] = reversed(logs)
+        if tool_name or pod_name or status:
+            entries = (
+                entry for entry in entries
+                if (not tool_name or entry.tool_name == tool_name)
+                and (not pod_name or entry.pod_name == pod_name)
+                and (not status or entry.status == status)
+            )
+        return [entry.to_dict() for entry in islice(entries, max(limit, 0))]
 
     def on_execute(self, callback: Callable[[ToolExecutionLog], None]) -> None:
-        """Register a callback to be called after each tool execution."""
+        """
+        Register a callback to be called after each tool execution.
+
+        Callbacks run when pending executions are flushed: on the next
+        event-loop iteration, or on flush_logs()/get_execution_logs().
+        """
         self._on_execute_callbacks.append(callback)
+        self._notify = _fuse_callbacks(tuple(self._on_execute_callbacks))
 
     # --- Stats ---
 
     def get_stats(self) -> Dict[str, Any]:
         """Get registry statistics."""
+        self.flush_logs()
         return {
             "total_tools": len(self._tools),
             "total_executions": len(self._execution_logs),
@@ -515,17 +821,53 @@ class ToolRegistry:
         }
 
     def _count_by_category(self) -> Dict[str, int]:
-        counts: Dict[str, int] = {}
-        for tool in self._tools.values():
-            cat = tool.spec.category.value
-            counts[cat] = counts.get(cat, 0) + 1
-        return counts
+        return {cat: n for cat, n in self._category_counts.items() if n}
 
     def _count_by_status(self) -> Dict[str, int]:
-        counts: Dict[str, int] = {}
-        for log in self._execution_logs:
-            counts[log.status] = counts.get(log.status, 0) + 1
-        return counts
+        return {status: n for status, n in self._status_counts.items() if n}
+
+
+def _fuse_callbacks(
+    callbacks: Tuple[Callable[[ToolExecutionLog], None], ...],
+) -> Callable[[ToolExecutionLog], None]:
+    """Compose execution callbacks into one; a failing callback does not stop the rest."""
+    if len(callbacks) == 1:
+        (callback,) = callbacks
+
+        def notify(entry: ToolExecutionLog) -> None:
+            try:
+                callback(entry)
+            except Exception:
+                logger.exception("Error in tool execution callback")
+
+        return notify
+
+    def notify_all(entry: ToolExecutionLog) -> None:
+        for callback in callbacks:
+            try:
+                callback(entry)
+            except Exception:
+                logger.exception("Error in tool execution callback")
+
+    return notify_all
+
+
+def _index_append(
+    index: Dict[Any, Deque[ToolExecutionLog]], key: Any, entry: ToolExecutionLog
+) -> None:
+    """Append ``entry`` under ``key``, creating the bucket on first use."""
+    bucket = index.get(key)
+    if bucket is None:
+        bucket = index[key] = deque()
+    bucket.append(entry)
+
+
+def _drop_oldest(index: Dict[Any, Deque[ToolExecutionLog]], key: Any) -> None:
+    """Drop the oldest entry under ``key`` (the one evicted from the main log)."""
+    bucket = index[key]
+    bucket.popleft()
+    if not bucket:
+        del index[key]
 
 
 # =============================================================================
@@ -10,14 +10,143 @@ Provides:
 """
 from __future__ import annotations
 
+import functools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from datetime import datetime
+from uuid import uuid4
+
+import yaml
+
+try:
+    import orjson  # type: ignore
+
+    def _dumps_json(obj: Any) -> bytes:
+        return orjson.dumps(
+            obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+except ImportError:  # pragma: no cover - exercised when dependency missing
+    def _dumps_json(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, default=str).encode()
 
 from .models import TraceEvent, TraceRun, EventKind, EventName
 
+# (event, event.data as a dict); the dict form is built once per event per diff
+_EventWithData = Tuple[TraceEvent, Dict[str, Any]]
+
+# Both trace files must be at least this big to be loaded concurrently
+_PARALLEL_LOAD_BYTES = 1 << 20
+
+# (sequence, kind, name, identifier) of an event within its trace
+_EventKey = Tuple[int, str, str, Any]
+
+# (field, old, new) for one changed field of a matched event
+_FieldChange = Tuple[str, Any, Any]
+
+# Changed fields that EventDiff.evaluate_severity can rank above INFO
+_SEVERITY_FIELDS = frozenset({"status", "decision"})
+
+# libyaml's C loader when PyYAML was built with it (several times faster)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _with_data(events: Iterable[TraceEvent]) -> List[_EventWithData]:
+    """Pair each event with its data as a plain dict (model_dump at most once)."""
+    return [
+        (event, event.data if isinstance(event.data, dict) else event.data.model_dump())
+        for event in events
+    ]
+
+
+def _load_events(path: str) -> List[_EventWithData]:
+    """
+    Stream a trace file straight into (event, data) pairs. Lines are
+    validated so data models fill in defaults a trace may leave out;
+    otherwise such a trace would differ from its re-serialized copy.
+    """
+    return _with_data(TraceRun.iter_events_jsonl(path))
+
+
+def _load_pair(
+    baseline_path: str, candidate_path: str
+) -> Tuple[List[_EventWithData], List[_EventWithData]]:
+    """
+    Load baseline and candidate traces. When both files are large, the
+    candidate is read on a worker thread so its file reads overlap the
+    baseline parse; small files are not worth a thread.
+    """
+    if min(os.path.getsize(baseline_path), os.path.getsize(candidate_path)) < _PARALLEL_LOAD_BYTES:
+        return _load_events(baseline_path), _load_events(candidate_path)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        candidate = pool.submit(_load_events, candidate_path)
+        return _load_events(baseline_path), candidate.result()
+
+
+def _event_key_str(key: _EventKey) -> str:
+    """Reported form of an event key: {sequence}_{kind}_{name}_{identifier}."""
+    count, kind, name, identifier = key
+    return f"{count}_{kind}_{name}_{identifier}"
+
+
+def _run_id(events: List[_EventWithData]) -> str:
+    """Run id of a loaded trace (as TraceRun.from_jsonl_file resolves it)."""
+    run_id = events[0][0].run_id if events else None
+    return run_id or f"run_{uuid4().hex[:8]}"
+
+
+@functools.lru_cache(maxsize=32)
+def _load_policy_yaml(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a diff policy file. mtime_ns and size are part of the cache key
+    only, so an edited file is parsed again. Treat the result as read-only.
+    """
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+# Data field naming the node/tool/model/policy an event refers to, by kind
+_IDENTIFIER_FIELDS: Dict[str, str] = {
+    EventKind.NODE.value: "node",
+    EventKind.TOOL.value: "tool",
+    EventKind.LLM.value: "model",
+    EventKind.POLICY.value: "policy",
+}
+
+# Fields compared per event type; every type also compares status and error
+_COMPARE_FIELDS_DEFAULT: Tuple[str, ...] = ("status", "error")
+_COMPARE_FIELDS: Dict[str, Tuple[str, ...]] = {
+    EventName.NODE_ENTER: ("node",) + _COMPARE_FIELDS_DEFAULT,
+    EventName.NODE_EXIT: ("node", "output", "duration_ms") + _COMPARE_FIELDS_DEFAULT,
+    EventName.TOOL_CALL: ("tool", "input") + _COMPARE_FIELDS_DEFAULT,
+    EventName.TOOL_RESULT: ("tool", "result", "duration_ms") + _COMPARE_FIELDS_DEFAULT,
+    EventName.LLM_REQUEST: ("model", "temperature", "max_tokens") + _COMPARE_FIELDS_DEFAULT,
+    EventName.LLM_RESPONSE: ("model", "text", "usage") + _COMPARE_FIELDS_DEFAULT,
+    EventName.POLICY_CHECK: ("policy", "decision", "reason") + _COMPARE_FIELDS_DEFAULT,
+    EventName.RUN_START: ("pod", "graph") + _COMPARE_FIELDS_DEFAULT,
+    # dict.fromkeys drops the defaults already listed (each field once)
+    EventName.RUN_END: tuple(
+        dict.fromkeys(("status", "duration_ms", "error") + _COMPARE_FIELDS_DEFAULT)
+    ),
+}
+# Compared fields whose differences are never reported (input-dependent hashes)
+_HASH_FIELDS: FrozenSet[str] = frozenset(
+    fld
+    for fields in (_COMPARE_FIELDS_DEFAULT, *_COMPARE_FIELDS.values())
+    for fld in fields
+    if fld.endswith("_hash")
+)
+
+
+# Markdown markers per severity: report-level emoji and per-event badges
+_SEVERITY_EMOJI = {"info": "✅", "warn": "⚠️", "fail": "❌"}
+_SEVERITY_BADGES = {"info": "ℹ️", "warn": "⚠️", "fail": "❌"}
+
 
 # =============================================================================
 # SEVERITY LEVELS
@@ -30,6 +159,16 @@ class DiffSeverity(str, Enum):
     FAIL = "fail"       # Failure, CI should fail
 
 
+# Severities ordered by rank, so the highest of several is a max() over ints
+_SEVERITY_BY_RANK = (DiffSeverity.INFO, DiffSeverity.WARN, DiffSeverity.FAIL)
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(_SEVERITY_BY_RANK)}
+
+
+def _threshold_rank(pct: float, warn_pct: float, fail_pct: float) -> int:
+    """Severity rank of a percentage increase against warn/fail thresholds."""
+    return 2 if pct >= fail_pct else 1 if pct >= warn_pct else 0
+
+
 @dataclass
 class DiffPolicy:
     """
@@ -46,30 +185,37 @@ class DiffPolicy:
     latency_increase_warn_pct: float = 50.0
     latency_increase_fail_pct: float = 100.0
 
-    # Fields to ignore in comparisons
-    ignore_fields: List[str] = field(default_factory=lambda: [
+    # Fields to ignore in comparisons (any iterable; stored as a frozenset)
+    ignore_fields: FrozenSet[str] = frozenset({
         "timestamp", "run_id", "span_id", "parent_span_id",
         "duration_ms",  # Duration varies
-    ])
+    })
 
     # Event types where removal is only INFO (not FAIL)
-    removals_info_only: List[str] = field(default_factory=lambda: [
+    removals_info_only: FrozenSet[str] = frozenset({
         "quality_record", "cost_record",  # Metadata events
-    ])
+    })
 
     # Allow new errors without failing (for testing)
     allow_new_errors: bool = False
 
+    # Stop at the first FAIL finding; the result then only carries that reason
+    fail_fast: bool = False
+
+    def __post_init__(self) -> None:
+        # Membership is tested per removed/changed event
+        self.ignore_fields = frozenset(self.ignore_fields)
+        self.removals_info_only = frozenset(self.removals_info_only)
+
     @classmethod
     def from_yaml(cls, path: Path) -> "DiffPolicy":
-        """Load policy from YAML file."""
-        import yaml
-
-        if not path.exists():
+        """Load policy from YAML file (parsed once per file version)."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             return cls()
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_policy_yaml(str(path), st.st_mtime_ns, st.st_size)
 
         return cls(
             token_increase_warn_pct=data.get("token_increase_warn_pct", 20.0),
@@ -79,8 +225,9 @@ class DiffPolicy:
             latency_increase_warn_pct=data.get("latency_increase_warn_pct", 50.0),
             latency_increase_fail_pct=data.get("latency_increase_fail_pct", 100.0),
             ignore_fields=data.get("ignore_fields", cls.ignore_fields),
-            removals_info_only=data.get("removals_info_only", []),
+            removals_info_only=data.get("removals_info_only", ()),
             allow_new_errors=data.get("allow_new_errors", False),
+            fail_fast=data.get("fail_fast", False),
         )
 
     @classmethod
@@ -89,14 +236,14 @@ class DiffPolicy:
         return cls()
 
 
-@dataclass
+@dataclass(slots=True)
 class EventDiff:
     """Difference between two events."""
     event_key: str  # Unique key for matching (kind/name/node/tool)
     baseline_event: Optional[TraceEvent]
     candidate_event: Optional[TraceEvent]
     diff_type: str  # "added" | "removed" | "changed"
-    changes: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)  # field -> (old, new)
+    changes: List[_FieldChange] = field(default_factory=list)  # (field, old, new)
     severity: DiffSeverity = DiffSeverity.INFO
 
     @property
@@ -115,8 +262,8 @@ class EventDiff:
         if self.diff_type == "removed":
             # Removing required events
             if self.baseline_event:
-                event_name = self.baseline_event.name.value if hasattr(self.baseline_event.name, 'value') else str(self.baseline_event.name)
-                if event_name in policy.removals_info_only:
+                # EventName is a str subclass, so enum and raw names compare alike
+                if self.baseline_event.name in policy.removals_info_only:
                     self.severity = DiffSeverity.INFO
                 elif self.baseline_event.name in (
                     EventName.RUN_START, EventName.RUN_END,
@@ -127,9 +274,17 @@ class EventDiff:
                     self.severity = DiffSeverity.WARN
 
         elif self.diff_type == "changed":
+            # Only a handful of fields change per event, so scan the list
+            status = decision = None
+            for fld, old, new in self.changes:
+                if fld == "status":
+                    status = (old, new)
+                elif fld == "decision":
+                    decision = (old, new)
+
             # Status changes
-            if "status" in self.changes:
-                old, new = self.changes["status"]
+            if status is not None:
+                old, new = status
                 if old == "ok" and new in ("error", "timeout"):
                     self.severity = DiffSeverity.FAIL
                 elif old == "success" and new == "error":
@@ -138,8 +293,8 @@ class EventDiff:
                     self.severity = DiffSeverity.WARN
 
             # Policy violations
-            elif "decision" in self.changes:
-                old, new = self.changes["decision"]
+            elif decision is not None:
+                old, new = decision
                 if old == "allow" and new == "deny":
                     self.severity = DiffSeverity.FAIL
                 else:
@@ -210,6 +365,18 @@ class QualityDelta:
         return self.all_deltas()
 
 
+@dataclass
+class _TraceTotals:
+    """Per-trace aggregates gathered in a single pass over the events."""
+    tokens: int = 0
+    usd: float = 0.0
+    latency_ms: float = 0.0
+    quality: Dict[str, float] = field(default_factory=dict)
+    tool_errors: int = 0
+    policy_violations: int = 0
+    errors: List[str] = field(default_factory=list)  # error event descriptions, if requested
+
+
 class TraceDiffer:
     """
     Compare two traces and identify differences.
@@ -250,114 +417,135 @@ class TraceDiffer:
         Returns:
             Dict with diff results
         """
-        # Load traces
-        baseline = TraceRun.from_jsonl_file(baseline_path)
-        candidate = TraceRun.from_jsonl_file(candidate_path)
+        baseline_data, candidate_data = _load_pair(baseline_path, candidate_path)
+        fail_fast = self.policy.fail_fast
+        candidate_totals = self._aggregate_trace(candidate_data)
+
+        # With fail_fast, a new error decides the result before any matching
+        if fail_fast and not self.policy.allow_new_errors:
+            if candidate_totals.errors:
+                return self._fail_fast_result(
+                    baseline_data, candidate_data, candidate_totals.errors[0]
+                )
 
-        # Build event sequences
-        baseline_events = self._index_events(baseline.events)
-        candidate_events = self._index_events(candidate.events)
+        baseline_events = self._index_events(baseline_data)
+        candidate_events = self._index_events(candidate_data)
 
         # Find differences
         added = []
         removed = []
         changed = []
 
-        # Check for removed/changed events
-        for key, b_event in baseline_events.items():
-            if key not in candidate_events:
+        # Check for removed/changed events (one lookup per baseline key)
+        matched = 0
+        compare_events = self._compare_events
+        for key, b_item in baseline_events.items():
+            c_item = candidate_events.get(key)
+            if c_item is None:
                 diff = EventDiff(
-                    event_key=key,
-                    baseline_event=b_event,
+                    event_key=_event_key_str(key),
+                    baseline_event=b_item[0],
                     candidate_event=None,
                     diff_type="removed",
                 )
                 diff.evaluate_severity(self.policy)
-                removed.append(diff)
-            else:
-                c_event = candidate_events[key]
-                changes = self._compare_events(b_event, c_event)
-                if changes:
-                    diff = EventDiff(
-                        event_key=key,
-                        baseline_event=b_event,
-                        candidate_event=c_event,
-                        diff_type="changed",
-                        changes=changes,
+                if fail_fast and diff.severity is DiffSeverity.FAIL:
+                    return self._fail_fast_result(
+                        baseline_data, candidate_data, self._describe_regression(diff)
                     )
-                    diff.evaluate_severity(self.policy)
-                    changed.append(diff)
+                removed.append(diff)
+                continue
 
-        # Check for added events
-        for key, c_event in candidate_events.items():
-            if key not in baseline_events:
+            matched += 1
+            changes = compare_events(b_item, c_item)
+            if changes:
                 diff = EventDiff(
-                    event_key=key,
+                    event_key=_event_key_str(key),
+                    baseline_event=b_item[0],
+                    candidate_event=c_item[0],
+                    diff_type="changed",
+                    changes=changes,
+                )
+                # Only status/decision changes rank above the INFO default
+                if any(c[0] in _SEVERITY_FIELDS for c in changes):
+                    diff.evaluate_severity(self.policy)
+                    if fail_fast and diff.severity is DiffSeverity.FAIL:
+                        return self._fail_fast_result(
+                            baseline_data, candidate_data, self._describe_regression(diff)
+                        )
+                changed.append(diff)
+
+        # Check for added events (none if every candidate key was matched)
+        if matched < len(candidate_events):
+            for key, (c_event, _) in candidate_events.items():
+                if key in baseline_events:
+                    continue
+                diff = EventDiff(
+                    event_key=_event_key_str(key),
                     baseline_event=None,
                     candidate_event=c_event,
                     diff_type="added",
-                )
-                diff.evaluate_severity(self.policy)
+                )  # added events are always INFO, the EventDiff default
                 added.append(diff)
 
-        # Calculate cost delta
-        cost_delta = self._calculate_cost_delta(baseline, candidate)
+        baseline_totals = self._aggregate_trace(baseline_data, describe_errors=False)
 
-        # Calculate quality delta
-        quality_delta = self._calculate_quality_delta(baseline, candidate)
+        cost_delta = CostDelta(
+            baseline_tokens=baseline_totals.tokens,
+            candidate_tokens=candidate_totals.tokens,
+            baseline_usd=baseline_totals.usd,
+            candidate_usd=candidate_totals.usd,
+            baseline_latency_ms=baseline_totals.latency_ms,
+            candidate_latency_ms=candidate_totals.latency_ms,
+        )
+        quality_delta = QualityDelta(
+            baseline_metrics=baseline_totals.quality,
+            candidate_metrics=candidate_totals.quality,
+        )
 
-        # Identify regressions
-        regressions = []
-        for diff in removed + changed:
-            if diff.is_regression:
-                regressions.append(self._describe_regression(diff))
+        # Identify regressions (only WARN/FAIL diffs are ever formatted)
+        regressions = [
+            self._describe_regression(diff)
+            for diff in chain(removed, changed)
+            if diff.is_regression
+        ]
 
         # Check for new errors in candidate
-        for event in candidate.events:
-            if event.name == EventName.ERROR:
-                event_data = event.data if isinstance(event.data, dict) else event.data.model_dump()
-                regressions.append(f"New error: {event_data.get('error_type', 'unknown')}: {event_data.get('message', '')}")
+        regressions.extend(candidate_totals.errors)
 
         # Check for tool errors
-        candidate_tool_errors = self._count_tool_errors(candidate)
-        baseline_tool_errors = self._count_tool_errors(baseline)
-        if candidate_tool_errors > baseline_tool_errors:
-            regressions.append(f"Tool errors increased: {baseline_tool_errors} -> {candidate_tool_errors}")
+        if candidate_totals.tool_errors > baseline_totals.tool_errors:
+            regressions.append(
+                f"Tool errors increased: {baseline_totals.tool_errors} -> {candidate_totals.tool_errors}"
+            )
 
         # Check for policy violations
-        candidate_violations = self._count_policy_violations(candidate)
-        baseline_violations = self._count_policy_violations(baseline)
-        if candidate_violations > baseline_violations:
-            regressions.append(f"Policy violations increased: {baseline_violations} -> {candidate_violations}")
+        if candidate_totals.policy_violations > baseline_totals.policy_violations:
+            regressions.append(
+                "Policy violations increased: "
+                f"{baseline_totals.policy_violations} -> {candidate_totals.policy_violations}"
+            )
 
         # Evaluate cost severity based on policy thresholds
         cost_severity = self._evaluate_cost_severity(cost_delta)
 
-        # Calculate overall severity (highest of all findings)
-        all_severities = [d.severity for d in added + removed + changed]
-        all_severities.append(cost_severity)
+        # Overall severity is the highest of all findings
+        rank = _SEVERITY_RANK[cost_severity]
+        for diffs in (added, removed, changed):
+            for d in diffs:
+                rank = max(rank, _SEVERITY_RANK[d.severity])
 
         # New errors are FAIL severity (unless allowed by policy)
-        has_new_errors = any(
-            event.name == EventName.ERROR
-            for event in candidate.events
-        )
-        if has_new_errors and not self.policy.allow_new_errors:
-            all_severities.append(DiffSeverity.FAIL)
-
-        # Determine overall severity
-        if DiffSeverity.FAIL in all_severities:
-            overall_severity = DiffSeverity.FAIL
-        elif DiffSeverity.WARN in all_severities:
-            overall_severity = DiffSeverity.WARN
-        else:
-            overall_severity = DiffSeverity.INFO
+        if candidate_totals.errors and not self.policy.allow_new_errors:
+            rank = _SEVERITY_RANK[DiffSeverity.FAIL]
+
+        overall_severity = _SEVERITY_BY_RANK[rank]
 
         return {
-            "baseline_run_id": baseline.run_id,
-            "candidate_run_id": candidate.run_id,
-            "baseline_event_count": len(baseline.events),
-            "candidate_event_count": len(candidate.events),
+            "baseline_run_id": _run_id(baseline_data),
+            "candidate_run_id": _run_id(candidate_data),
+            "baseline_event_count": len(baseline_data),
+            "candidate_event_count": len(candidate_data),
             "added": [self._event_diff_to_dict(d) for d in added],
             "removed": [self._event_diff_to_dict(d) for d in removed],
             "changed": [self._event_diff_to_dict(d) for d in changed],
@@ -368,61 +556,85 @@ class TraceDiffer:
             "overall_severity": overall_severity.value,
         }
 
-    def _index_events(self, events: List[TraceEvent]) -> Dict[str, TraceEvent]:
+    def _fail_fast_result(
+        self,
+        baseline_data: List[_EventWithData],
+        candidate_data: List[_EventWithData],
+        reason: str,
+    ) -> Dict[str, Any]:
+        """Result for a diff stopped at its first FAIL finding (policy.fail_fast)."""
+        return {
+            "baseline_run_id": _run_id(baseline_data),
+            "candidate_run_id": _run_id(candidate_data),
+            "baseline_event_count": len(baseline_data),
+            "candidate_event_count": len(candidate_data),
+            "added": [],
+            "removed": [],
+            "changed": [],
+            "cost_delta": CostDelta().to_dict(),
+            "cost_severity": DiffSeverity.INFO.value,
+            "quality_delta": {},
+            "regressions": [reason],
+            "overall_severity": DiffSeverity.FAIL.value,
+            "fail_fast": True,
+        }
+
+    def _index_events(self, events: List[_EventWithData]) -> Dict[_EventKey, _EventWithData]:
         """
         Create index of events by semantic key.
 
-        Key format: {sequence}_{kind}_{name}_{identifier}
+        Keys are (sequence, kind, name, identifier) tuples; _event_key_str
+        renders the reported {sequence}_{kind}_{name}_{identifier} form.
         """
         indexed = {}
-        counters: Dict[str, int] = {}
+        counters: Dict[Tuple[str, str, Any], int] = {}
 
-        for event in events:
-            # Build semantic key
-            event_data = event.data if isinstance(event.data, dict) else event.data.model_dump()
+        # Bound once: this loop runs for every event of both traces
+        id_field_for = _IDENTIFIER_FIELDS.get
+        count_of = counters.get
 
-            identifier = ""
-            if event.kind == EventKind.NODE:
-                identifier = event_data.get("node", "")
-            elif event.kind == EventKind.TOOL:
-                identifier = event_data.get("tool", "")
-            elif event.kind == EventKind.LLM:
-                identifier = event_data.get("model", "")
-            elif event.kind == EventKind.POLICY:
-                identifier = event_data.get("policy", "")
+        for item in events:
+            event, event_data = item
+            kind, name = event.kind, event.name
+
+            # Build semantic key
+            id_field = id_field_for(kind)
+            identifier = event_data.get(id_field, "") if id_field else ""
 
-            base_key = f"{event.kind}_{event.name}_{identifier}"
+            base_key = (kind, name, identifier)
 
             # Add sequence number for duplicate keys
-            count = counters.get(base_key, 0)
+            count = count_of(base_key, 0)
             counters[base_key] = count + 1
 
-            key = f"{count}_{base_key}"
-            indexed[key] = event
+            indexed[(count, kind, name, identifier)] = item
 
         return indexed
 
     def _compare_events(
         self,
-        baseline: TraceEvent,
-        candidate: TraceEvent,
-    ) -> Dict[str, Tuple[Any, Any]]:
-        """Compare two events and return differences."""
-        changes = {}
+        baseline: _EventWithData,
+        candidate: _EventWithData,
+    ) -> List[_FieldChange]:
+        """Compare two events and return differences as (field, old, new)."""
+        changes: List[_FieldChange] = []
 
-        b_data = baseline.data if isinstance(baseline.data, dict) else baseline.data.model_dump()
-        c_data = candidate.data if isinstance(candidate.data, dict) else candidate.data.model_dump()
+        (b_event, b_data), (_, c_data) = baseline, candidate
 
         # Compare relevant fields based on event type
-        compare_fields = self._get_compare_fields(baseline.name)
+        compare_fields = _COMPARE_FIELDS.get(b_event.name, _COMPARE_FIELDS_DEFAULT)
 
-        for fld in compare_fields:
-            b_val = b_data.get(fld)
-            c_val = c_data.get(fld)
+        # Most matched events are unchanged: one C-level tuple comparison
+        # settles those before the per-field walk below
+        b_values = tuple(map(b_data.get, compare_fields))
+        c_values = tuple(map(c_data.get, compare_fields))
+        if b_values == c_values:
+            return changes
 
+        for fld, b_val, c_val in zip(compare_fields, b_values, c_values):
             if b_val != c_val:
                 # Skip hash differences (these are expected for different inputs)
-                if fld.endswith("_hash"):
+                if fld in _HASH_FIELDS:
                     continue
                 # Skip duration differences within tolerance
                 if fld == "duration_ms":
@@ -430,87 +642,67 @@ class TraceDiffer:
                         # Allow 50% variance in duration
                         if abs(b_val - c_val) / max(b_val, 1) < 0.5:
                             continue
-                changes[fld] = (b_val, c_val)
+                changes.append((fld, b_val, c_val))
 
         return changes
 
-    def _get_compare_fields(self, event_name: EventName) -> List[str]:
+    def _get_compare_fields(self, event_name: EventName) -> Tuple[str, ...]:
         """Get fields to compare for an event type."""
-        common = ["status", "error"]
-
-        field_map = {
-            EventName.NODE_ENTER: ["node"] + common,
-            EventName.NODE_EXIT: ["node", "output", "duration_ms"] + common,
-            EventName.TOOL_CALL: ["tool", "input"] + common,
-            EventName.TOOL_RESULT: ["tool", "result", "duration_ms"] + common,
-            EventName.LLM_REQUEST: ["model", "temperature", "max_tokens"] + common,
-            EventName.LLM_RESPONSE: ["model", "text", "usage"] + common,
-            EventName.POLICY_CHECK: ["policy", "decision", "reason"] + common,
-            EventName.RUN_START: ["pod", "graph"] + common,
-            EventName.RUN_END: ["status", "duration_ms", "error"] + common,
-        }
+        return _COMPARE_FIELDS.get(event_name, _COMPARE_FIELDS_DEFAULT)
 
-        return field_map.get(event_name, common)
-
-    def _calculate_cost_delta(self, baseline: TraceRun, candidate: TraceRun) -> CostDelta:
-        """Calculate cost differences between traces."""
-        delta = CostDelta()
-
-        for event in baseline.events:
-            if event.name == EventName.COST_RECORD:
-                data = event.data if isinstance(event.data, dict) else event.data.model_dump()
-                delta.baseline_tokens += data.get("tokens", 0)
-                delta.baseline_usd += data.get("usd_est", 0)
-                delta.baseline_latency_ms += data.get("latency_ms", 0)
-
-        for event in candidate.events:
-            if event.name == EventName.COST_RECORD:
-                data = event.data if isinstance(event.data, dict) else event.data.model_dump()
-                delta.candidate_tokens += data.get("tokens", 0)
-                delta.candidate_usd += data.get("usd_est", 0)
-                delta.candidate_latency_ms += data.get("latency_ms", 0)
-
-        return delta
-
-    def _calculate_quality_delta(self, baseline: TraceRun, candidate: TraceRun) -> QualityDelta:
-        """Calculate quality metric differences between traces."""
-        delta = QualityDelta()
-
-        for event in baseline.events:
-            if event.name == EventName.QUALITY_RECORD:
-                data = event.data if isinstance(event.data, dict) else event.data.model_dump()
-                metric = data.get("metric", "unknown")
-                value = data.get("value", 0.0)
-                delta.baseline_metrics[metric] = value
-
-        for event in candidate.events:
-            if event.name == EventName.QUALITY_RECORD:
-                data = event.data if isinstance(event.data, dict) else event.data.model_dump()
-                metric = data.get("metric", "unknown")
-                value = data.get("value", 0.0)
-                delta.candidate_metrics[metric] = value
-
-        return delta
-
-    def _count_tool_errors(self, trace: TraceRun) -> int:
-        """Count tool execution errors in a trace."""
-        count = 0
-        for event in trace.events:
-            if event.name == EventName.TOOL_RESULT:
-                data = event.data if isinstance(event.data, dict) else event.data.model_dump()
+    def _aggregate_trace(
+        self,
+        events: List[_EventWithData],
+        describe_errors: bool = True,
+    ) -> _TraceTotals:
+        """
+        Gather cost, quality, tool-error, policy-violation and error
+        aggregates for a trace in one pass over its events.
+
+        Error events are only formatted into descriptions when
+        describe_errors is set (they are reported for the candidate only).
+        """
+        quality: Dict[str, float] = {}
+        errors: List[str] = []
+        # Running sums stay in locals; the record is built once at the end
+        tokens = 0
+        usd = latency_ms = 0.0
+        tool_errors = policy_violations = 0
+        # Plain str values hoisted out of the loop (events store names as str)
+        cost_record = EventName.COST_RECORD.value
+        quality_record = EventName.QUALITY_RECORD.value
+        tool_result = EventName.TOOL_RESULT.value
+        policy_check = EventName.POLICY_CHECK.value
+        error = EventName.ERROR.value
+
+        for event, data in events:
+            name = event.name
+            if name == tool_result:
                 if data.get("status") == "error":
-                    count += 1
-        return count
-
-    def _count_policy_violations(self, trace: TraceRun) -> int:
-        """Count policy violations in a trace."""
-        count = 0
-        for event in trace.events:
-            if event.name == EventName.POLICY_CHECK:
-                data = event.data if isinstance(event.data, dict) else event.data.model_dump()
+                    tool_errors += 1
+            elif name == policy_check:
                 if data.get("decision") == "deny":
-                    count += 1
-        return count
+                    policy_violations += 1
+            elif name == cost_record:
+                tokens += data.get("tokens", 0)
+                usd += data.get("usd_est", 0)
+                latency_ms += data.get("latency_ms", 0)
+            elif name == quality_record:
+                quality[data.get("metric", "unknown")] = data.get("value", 0.0)
+            elif name == error and describe_errors:
+                errors.append(
+                    f"New error: {data.get('error_type', 'unknown')}: {data.get('message', '')}"
+                )
+
+        return _TraceTotals(
+            tokens=tokens,
+            usd=usd,
+            latency_ms=latency_ms,
+            quality=quality,
+            tool_errors=tool_errors,
+            policy_violations=policy_violations,
+            errors=errors,
+        )
 
     def _evaluate_cost_severity(self, cost_delta: CostDelta) -> DiffSeverity:
         """
@@ -518,36 +710,31 @@ class TraceDiffer:
 
         Returns the highest severity based on token, USD, and latency changes.
         """
-        severity = DiffSeverity.INFO
+        policy = self.policy
+        rank = 0
 
         # Token increase check
         if cost_delta.baseline_tokens > 0:
             token_pct = (cost_delta.tokens_delta / cost_delta.baseline_tokens) * 100
-            if token_pct >= self.policy.token_increase_fail_pct:
-                severity = DiffSeverity.FAIL
-            elif token_pct >= self.policy.token_increase_warn_pct:
-                if severity != DiffSeverity.FAIL:
-                    severity = DiffSeverity.WARN
+            rank = max(rank, _threshold_rank(
+                token_pct, policy.token_increase_warn_pct, policy.token_increase_fail_pct,
+            ))
 
         # USD increase check
         if cost_delta.baseline_usd > 0:
             usd_pct = (cost_delta.usd_delta / cost_delta.baseline_usd) * 100
-            if usd_pct >= self.policy.usd_increase_fail_pct:
-                severity = DiffSeverity.FAIL
-            elif usd_pct >= self.policy.usd_increase_warn_pct:
-                if severity != DiffSeverity.FAIL:
-                    severity = DiffSeverity.WARN
+            rank = max(rank, _threshold_rank(
+                usd_pct, policy.usd_increase_warn_pct, policy.usd_increase_fail_pct,
+            ))
 
         # Latency increase check
         if cost_delta.baseline_latency_ms > 0:
             latency_pct = (cost_delta.latency_delta_ms / cost_delta.baseline_latency_ms) * 100
-            if latency_pct >= self.policy.latency_increase_fail_pct:
-                severity = DiffSeverity.FAIL
-            elif latency_pct >= self.policy.latency_increase_warn_pct:
-                if severity != DiffSeverity.FAIL:
-                    severity = DiffSeverity.WARN
+            rank = max(rank, _threshold_rank(
+                latency_pct, policy.latency_increase_warn_pct, policy.latency_increase_fail_pct,
+            ))
 
-        return severity
+        return _SEVERITY_BY_RANK[rank]
 
     def _describe_regression(self, diff: EventDiff) -> str:
         """Create human-readable description of a regression."""
@@ -557,7 +744,7 @@ class TraceDiffer:
         if diff.diff_type == "changed":
             changes_desc = ", ".join(
                 f"{k}: {old} -> {new}"
-                for k, (old, new) in diff.changes.items()
+                for k, old, new in diff.changes
             )
             return f"Changed: {diff.event_key} ({changes_desc})"
 
@@ -568,11 +755,15 @@ class TraceDiffer:
         return {
             "event_key": diff.event_key,
             "diff_type": diff.diff_type,
-            "changes": {k: {"old": old, "new": new} for k, (old, new) in diff.changes.items()},
+            "changes": {k: {"old": old, "new": new} for k, old, new in diff.changes},
             "severity": diff.severity.value,
             "is_regression": diff.is_regression,
         }
 
+    def to_json(self, diff_result: Dict[str, Any]) -> bytes:
+        """Encode a diff result as indented UTF-8 JSON (orjson when installed)."""
+        return _dumps_json(diff_result)
+
     def to_markdown(self, diff_result: Dict[str, Any]) -> str:
         """Generate markdown report from diff result."""
         lines = []
@@ -584,7 +775,7 @@ class TraceDiffer:
 
         # Overall severity badge
         overall = diff_result.get("overall_severity", "info")
-        severity_emoji = {"info": "✅", "warn": "⚠️", "fail": "❌"}.get(overall, "❓")
+        severity_emoji = _SEVERITY_EMOJI.get(overall, "❓")
         lines.append(f"**Overall Severity:** {severity_emoji} `{overall.upper()}`")
         lines.append("")
 
@@ -602,8 +793,7 @@ class TraceDiffer:
         if regressions:
             lines.append("## Regressions")
             lines.append("")
-            for reg in regressions:
-                lines.append(f"- {reg}")
+            lines.extend(f"- {reg}" for reg in regressions)
             lines.append("")
         else:
             lines.append("## Regressions")
@@ -614,7 +804,7 @@ class TraceDiffer:
         # Cost Delta
         cost = diff_result.get("cost_delta", {})
         cost_sev = diff_result.get("cost_severity", "info")
-        cost_emoji = {"info": "✅", "warn": "⚠️", "fail": "❌"}.get(cost_sev, "❓")
+        cost_emoji = _SEVERITY_EMOJI.get(cost_sev, "❓")
         lines.append(f"## Cost Delta {cost_emoji}")
         lines.append("")
         lines.append(f"**Severity:** `{cost_sev.upper()}`")
@@ -660,7 +850,7 @@ class TraceDiffer:
                 lines.append("")
                 for evt in removed[:20]:
                     sev = evt.get("severity", "info")
-                    sev_badge = {"info": "ℹ️", "warn": "⚠️", "fail": "❌"}.get(sev, "")
+                    sev_badge = _SEVERITY_BADGES.get(sev, "")
                     lines.append(f"- {sev_badge} `{evt.get('event_key', 'unknown')}` [{sev.upper()}]")
                 if len(removed) > 20:
                     lines.append(f"- ... and {len(removed) - 20} more")
@@ -671,9 +861,9 @@ class TraceDiffer:
                 lines.append("")
                 for evt in changed[:20]:
                     sev = evt.get("severity", "info")
-                    sev_badge = {"info": "ℹ️", "warn": "⚠️", "fail": "❌"}.get(sev, "")
+                    sev_badge = _SEVERITY_BADGES.get(sev, "")
                     changes = evt.get("changes", {})
-                    change_desc = ", ".join(f"{k}" for k in changes.keys())
+                    change_desc = ", ".join(map(str, changes))
                     lines.append(f"- {sev_badge} `{evt.get('event_key', 'unknown')}`: {change_desc} [{sev.upper()}]")
                 if len(changed) > 20:
                     lines.append(f"- ... and {len(changed) - 20} more")
@@ -8,15 +8,26 @@ Spec: See docs/manual/HUAP_Public_Beta_Manual.md (Trace Spec section).
 """
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
+import os
+from array import array
+from dataclasses import fields, is_dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
 
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised when dependency missing
+    _loads = json.loads
+
 
 # =============================================================================
 # ENUMS
@@ -271,15 +282,54 @@ class TraceEvent(BaseModel):
         return self.model_dump_json()
 
     @classmethod
-    def from_jsonl(cls, line: str) -> "TraceEvent":
-        """Deserialize from JSONL line."""
-        return cls.model_validate_json(line)
+    def from_jsonl(cls, line: Union[str, bytes], validate: bool = True) -> "TraceEvent":
+        """
+        Deserialize from JSONL line.
+
+        With validate=False the line is trusted: it is parsed with orjson
+        (when installed) and built with model_construct, so ``data`` stays
+        a plain dict and only ``ts`` is converted. Several times faster,
+        for traces this package wrote itself.
+        """
+        if validate:
+            return cls.model_validate_json(line)
+        values = _loads(line)
+        ts = values.get("ts")
+        if isinstance(ts, str):
+            # fromisoformat only accepts a trailing "Z" from Python 3.11
+            values["ts"] = datetime.fromisoformat(
+                ts[:-1] + "+00:00" if ts.endswith("Z") else ts
+            )
+        return cls.model_construct(**values)
 
 
 # =============================================================================
 # TRACE RUN (Collection of events)
 # =============================================================================
 
+def _scan_offsets(path: str) -> Tuple[array, int]:
+    """Byte offsets of the event lines of a JSONL trace, and the bytes scanned."""
+    offsets = array("Q")
+    pos = 0
+    with open(path, "rb", buffering=1 << 20) as f:
+        for line in f:
+            if line.strip():
+                offsets.append(pos)
+            pos += len(line)
+    return offsets, pos
+
+
+@functools.lru_cache(maxsize=32)
+def _memory_offset_index(path: str, size: int, mtime_ns: int) -> array:
+    """In-process offsets per trace version, for traces whose sidecar can't be written."""
+    return _scan_offsets(path)[0]
+
+
+def _enum_value(value: Any) -> Any:
+    """Plain value of an enum member, so index keys are always the stored values."""
+    return value.value if isinstance(value, Enum) else value
+
+
 class TraceRun(BaseModel):
     """
     A complete trace run (collection of events).
@@ -290,21 +340,34 @@ class TraceRun(BaseModel):
     events: List[TraceEvent] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    def _events_by(self, attr: str) -> Dict[str, List[TraceEvent]]:
+        """
+        Events grouped by their ``kind`` or ``name`` value, built on first
+        use. The index is rebuilt when ``events`` is replaced or changes
+        length; events edited in place are not noticed.
+        """
+        slot = f"_by_{attr}"
+        events = self.events
+        cached = self.__dict__.get(slot)
+        if cached is None or cached[0] is not events or cached[1] != len(events):
+            index: Dict[str, List[TraceEvent]] = {}
+            for e in events:
+                index.setdefault(_enum_value(getattr(e, attr)), []).append(e)
+            # Kept out of the model fields, so dumps and equality ignore it
+            cached = self.__dict__[slot] = (events, len(events), index)
+        return cached[2]
+
     @property
     def start_event(self) -> Optional[TraceEvent]:
         """Get the run_start event."""
-        for e in self.events:
-            if e.name == EventName.RUN_START:
-                return e
-        return None
+        matches = self._events_by("name").get(EventName.RUN_START.value)
+        return matches[0] if matches else None
 
     @property
     def end_event(self) -> Optional[TraceEvent]:
         """Get the run_end event."""
-        for e in self.events:
-            if e.name == EventName.RUN_END:
-                return e
-        return None
+        matches = self._events_by("name").get(EventName.RUN_END.value)
+        return matches[0] if matches else None
 
     @property
     def duration_ms(self) -> Optional[float]:
@@ -316,28 +379,81 @@ class TraceRun(BaseModel):
 
     def filter_by_kind(self, kind: EventKind) -> List[TraceEvent]:
         """Filter events by kind."""
-        return [e for e in self.events if e.kind == kind]
+        return list(self._events_by("kind").get(_enum_value(kind), ()))
 
     def filter_by_name(self, name: EventName) -> List[TraceEvent]:
         """Filter events by name."""
-        return [e for e in self.events if e.name == name]
+        return list(self._events_by("name").get(_enum_value(name), ()))
+
+    @staticmethod
+    def iter_events_jsonl(path: str, validate: bool = True) -> Iterator[TraceEvent]:
+        """
+        Stream events from a JSONL file one line at a time.
+
+        Lines are read as bytes through a 1 MiB buffer and handed straight
+        to the JSON parser, so no decoded copy of the file is kept. See
+        TraceEvent.from_jsonl for ``validate``.
+        """
+        from_jsonl = TraceEvent.from_jsonl
+        with open(path, "rb", buffering=1 << 20) as f:
+            for line in f:
+                if line.strip():
+                    yield from_jsonl(line, validate)
+
+    @staticmethod
+    def build_offset_index(path: str) -> array:
+        """
+        Record the byte offset of every event line of a JSONL trace.
+
+        The sidecar ``<path>.bcl`` holds uint64 values: the trace size it
+        was built from, then the offsets (read back by load_event). Returns
+        the offsets; raises OSError if the sidecar can't be written.
+        """
+        offsets, size = _scan_offsets(path)
+        with open(f"{path}.bcl", "wb") as out:
+            array("Q", [size]).tofile(out)
+            offsets.tofile(out)
+        return offsets
+
+    @staticmethod
+    def _offset_index(path: str) -> array:
+        """
+        Offsets from the sidecar when it matches the trace's current size and
+        is not older than it; otherwise rebuilt, in memory if the sidecar
+        can't be written (e.g. read-only archives).
+        """
+        st = os.stat(path)
+        index_path = f"{path}.bcl"
+        try:
+            if os.stat(index_path).st_mtime_ns >= st.st_mtime_ns:
+                stored = array("Q")
+                with open(index_path, "rb") as f:
+                    stored.frombytes(f.read())
+                if stored and stored[0] == st.st_size:
+                    return stored[1:]
+        except (OSError, ValueError):
+            pass  # missing, unreadable or truncated sidecar: rebuild
+        try:
+            return TraceRun.build_offset_index(path)
+        except OSError:
+            return _memory_offset_index(path, st.st_size, st.st_mtime_ns)
+
+    @staticmethod
+    def load_event(path: str, index: int, validate: bool = True) -> TraceEvent:
+        """
+        Load event ``index`` of a JSONL trace (negative counts from the end)
+        with one seek, via the offset index. Raises IndexError when out of range.
+        """
+        offsets = TraceRun._offset_index(path)
+        with open(path, "rb") as f:
+            f.seek(offsets[index])
+            return TraceEvent.from_jsonl(f.readline(), validate)
 
     @classmethod
-    def from_jsonl_file(cls, path: str) -> "TraceRun":
+    def from_jsonl_file(cls, path: str, validate: bool = True) -> "TraceRun":
         """Load trace from JSONL file."""
-        events = []
-        run_id = None
-
-        with open(path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                event = TraceEvent.from_jsonl(line)
-                events.append(event)
-                if run_id is None:
-                    run_id = event.run_id
-
+        events = list(cls.iter_events_jsonl(path, validate))
+        run_id = events[0].run_id if events else None
         return cls(run_id=run_id or f"run_{uuid4().hex[:8]}", events=events)
 
 
@@ -353,6 +469,29 @@ EPHEMERAL_FIELDS = frozenset({
 })
 
 
+# Values that normalize to themselves (exact types, so str enums still
+# take the generic path below)
+_LEAF_TYPES = frozenset({str, int, bool, type(None)})
+_CONTAINER_TYPES = frozenset({dict, list, tuple})
+
+
+def _unwrap_for_hash(obj: Any) -> Any:
+    """Reduce models, dataclasses and plain objects to the dict they hash as."""
+    while obj is not None and not isinstance(obj, (dict, list, tuple, float)):
+        if hasattr(obj, 'model_dump'):
+            # Pydantic model
+            obj = obj.model_dump()
+        elif hasattr(obj, '__dict__'):
+            # Generic object (or dataclass) with __dict__ - convert to dict
+            obj = vars(obj)
+        elif is_dataclass(obj) and not isinstance(obj, type):
+            # Slotted dataclass (no __dict__) - convert its fields to a dict
+            obj = {f.name: getattr(obj, f.name) for f in fields(obj)}
+        else:
+            break
+    return obj
+
+
 def normalize_for_hash(
     data: Any,
     exclude_fields: Optional[set] = None,
@@ -363,7 +502,10 @@ def normalize_for_hash(
 
     - Removes ephemeral fields (timestamps, IDs)
     - Rounds floats to avoid precision issues
-    - Recursively sorts dicts and lists
+    - Converts models, dataclasses, objects and tuples to dicts and lists
+
+    Dict key order is left as found; hash_data serializes with sorted keys.
+    Nesting depth is not limited by the recursion limit.
 
     Args:
         data: Data to normalize
@@ -373,34 +515,61 @@ def normalize_for_hash(
     Returns:
         Normalized data structure suitable for hashing
     """
-    excluded = EPHEMERAL_FIELDS | (exclude_fields or set())
-
-    def _normalize(obj: Any) -> Any:
-        if obj is None:
-            return None
-        elif isinstance(obj, dict):
-            # Sort keys and recurse, excluding ephemeral fields
-            normalized = {}
-            for k in sorted(obj.keys()):
-                if k not in excluded:
-                    normalized[k] = _normalize(obj[k])
-            return normalized
+    excluded = EPHEMERAL_FIELDS | exclude_fields if exclude_fields else EPHEMERAL_FIELDS
+    leaf_types = _LEAF_TYPES
+
+    # Fresh containers are filled top-down; each pending (container, key)
+    # slot still holds the raw value that belongs there. A (None, obj) entry
+    # sits below obj's children and marks the end of its subtree, so
+    # `on_path` holds the ids of the containers being walked (obj stays
+    # referenced meanwhile, so its id cannot be reused)
+    root = [data]
+    pending: List[Any] = [(root, 0)]
+    on_path: set = set()
+    while pending:
+        container, key = pending.pop()
+        if container is None:
+            on_path.discard(id(key))
+            continue
+        obj = container[key]
+        if type(obj) not in _CONTAINER_TYPES:
+            obj = _unwrap_for_hash(obj)
+        if isinstance(obj, dict):
+            out = {k: v for k, v in obj.items() if k not in excluded}
+            items = out.items()
         elif isinstance(obj, (list, tuple)):
-            # Normalize each element
-            return [_normalize(item) for item in obj]
+            out = list(obj)
+            items = enumerate(out)
         elif isinstance(obj, float):
-            # Round floats to avoid precision issues
-            return round(obj, float_precision)
-        elif hasattr(obj, 'model_dump'):
-            # Pydantic model
-            return _normalize(obj.model_dump())
-        elif hasattr(obj, '__dict__'):
-            # Generic object with __dict__ - convert to dict
-            return _normalize(vars(obj))
+            container[key] = round(obj, float_precision)
+            continue
         else:
-            return obj
+            container[key] = obj
+            continue
+        container[key] = out
+
+        obj_id = id(obj)
+        if obj_id in on_path:
+            raise ValueError("Circular reference detected")
+        on_path.add(obj_id)
+        pending.append((None, obj))
+
+        # Scalar children are settled here rather than via the stack
+        for k, v in items:
+            t = type(v)
+            if t in leaf_types:
+                continue
+            if t is float:
+                out[k] = round(v, float_precision)
+            else:
+                pending.append((out, k))
 
-    return _normalize(data)
+    return root[0]
+
+
+# Same output as json.dumps(data, sort_keys=True, default=str), without
+# building a new encoder on every call
+_HASH_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
 
 
 def hash_data(data: Any, normalize: bool = False) -> str:
@@ -412,7 +581,11 @@ def hash_data(data: Any, normalize: bool = False) -> str:
         normalize: If True, normalize data before hashing (removes ephemeral fields)
 
     Returns:
-        16-character hex hash string
+        16-character hex hash string (truncated SHA-256)
+
+    The digest is a content identifier, not a security primitive. It is
+    written into traces and matched again on replay, so the algorithm and
+    serialization must stay fixed across releases.
     """
     if data is None:
         return ""
@@ -421,10 +594,10 @@ def hash_data(data: Any, normalize: bool = False) -> str:
         data = normalize_for_hash(data)
 
     if isinstance(data, (dict, list)):
-        serialized = json.dumps(data, sort_keys=True, default=str)
+        serialized = _HASH_ENCODER.encode(data)
     else:
         serialized = str(data)
-    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+    return hashlib.sha256(serialized.encode(), usedforsecurity=False).hexdigest()[:16]
 
 
 def hash_state(state: Dict[str, Any]) -> str:
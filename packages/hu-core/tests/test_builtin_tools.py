@@ -0,0 +1,303 @@
+"""Tests for built-in tools (fs_sandbox, http_fetch helpers, memory tools)."""
+import os
+
+import pytest
+
+from hu_core.tools import ToolStatus
+from hu_core.tools.builtin.fs_sandbox import FsSandbox
+
+
+@pytest.fixture
+def sandbox_root(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    return root
+
+
+async def _fs(root, **kwargs):
+    return await FsSandbox().execute({"root": str(root), **kwargs})
+
+
+class TestFsSandbox:
+    @pytest.mark.asyncio
+    async def test_write_then_read(self, sandbox_root):
+        result = await _fs(sandbox_root, action="write", path="a/b.txt", content="héllo")
+        assert result.status == ToolStatus.SUCCESS
+        result = await _fs(sandbox_root, action="read", path="a/b.txt")
+        assert result.data["content"] == "héllo"
+        assert result.data["size_bytes"] == len("héllo".encode("utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_read_too_large(self, sandbox_root):
+        (sandbox_root / "big.txt").write_text("x" * 10)
+        result = await _fs(sandbox_root, action="read", path="big.txt", max_bytes=5)
+        assert result.status == ToolStatus.ERROR
+        assert "too large" in result.data["error"]
+
+    @pytest.mark.asyncio
+    async def test_list(self, sandbox_root):
+        (sandbox_root / "b.txt").write_text("abc")
+        (sandbox_root / "a").mkdir()
+        result = await _fs(sandbox_root, action="list", path=".")
+        assert result.data["entries"] == [
+            {"name": "a", "is_dir": True, "size": 0},
+            {"name": "b.txt", "is_dir": False, "size": 3},
+        ]
+        result = await _fs(sandbox_root, action="list", path="b.txt")
+        assert result.data["error"] == "Not a directory: b.txt"
+        result = await _fs(sandbox_root, action="list", path="nope")
+        assert result.data["error"] == "Directory not found: nope"
+
+    @pytest.mark.asyncio
+    async def test_read_missing(self, sandbox_root):
+        result = await _fs(sandbox_root, action="read", path="nope.txt")
+        assert result.data["error"] == "File not found: nope.txt"
+
+    @pytest.mark.asyncio
+    async def test_list_sorted(self, sandbox_root):
+        (sandbox_root / "b.txt").write_text("bb")
+        (sandbox_root / "a").mkdir()
+        result = await _fs(sandbox_root, action="list", path=".")
+        assert result.data["entries"] == [
+            {"name": "a", "is_dir": True, "size": 0},
+            {"name": "b.txt", "is_dir": False, "size": 2},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_exists_relative_path(self, sandbox_root):
+        (sandbox_root / "a").mkdir()
+        result = await _fs(sandbox_root, action="exists", path="a")
+        assert result.data == {"exists": True, "path": "a"}
+
+    @pytest.mark.asyncio
+    async def test_traversal_denied(self, sandbox_root):
+        result = await _fs(sandbox_root, action="read", path="../outside.txt")
+        assert "Path traversal denied" in result.data["error"]
+
+    @pytest.mark.asyncio
+    async def test_symlink_escape_denied(self, sandbox_root, tmp_path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.txt").write_text("secret")
+        os.symlink(outside, sandbox_root / "link")
+        result = await _fs(sandbox_root, action="read", path="link/secret.txt")
+        assert "Path traversal denied" in result.data["error"]
+
+    @pytest.mark.asyncio
+    async def test_extension_not_allowed(self, sandbox_root):
+        result = await _fs(
+            sandbox_root, action="write", path="x.txt", content="x",
+            allowed_extensions=[".json"],
+        )
+        assert "Extension '.txt' not allowed" in result.data["error"]
+        result = await _fs(
+            sandbox_root, action="write", path="x.json", content="{}",
+            allowed_extensions=(".yaml", ".json"),
+        )
+        assert result.data["written_bytes"] == 2
+        result = await _fs(
+            sandbox_root, action="write", path="notes.", content="x",
+            allowed_extensions=[".json"],
+        )
+        assert result.data["written_bytes"] == 1
+
+
+@pytest.fixture
+def http_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            if self.path == "/missing":
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = {
+                "/big": b"x" * 1000,
+                "/badjson": b"{not json",
+                "/empty": b"",
+            }.get(self.path, b'{"ok": true}')
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpFetchSafe:
+    async def _fetch(self, url, **kwargs):
+        from hu_core.tools import _http_pool
+        from hu_core.tools.builtin import http_fetch_safe
+
+        try:
+            return await http_fetch_safe.HttpFetchSafe().execute(
+                {"url": url, "allowed_domains": ["127.0.0.1"], **kwargs}
+            )
+        finally:
+            await _http_pool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_domain_not_allowed(self):
+        result = await self._fetch("http://example.invalid/")
+        assert result.status == ToolStatus.ERROR
+        assert "not in allowlist" in result.data["error"]
+
+    @pytest.mark.asyncio
+    async def test_fetch(self, http_server):
+        result = await self._fetch(http_server + "/ok")
+        assert result.status == ToolStatus.SUCCESS
+        assert result.data["status_code"] == 200
+        assert result.data["body"] == '{"ok": true}'
+
+    @pytest.mark.asyncio
+    async def test_max_bytes(self, http_server):
+        result = await self._fetch(http_server + "/big", max_bytes=100)
+        assert result.data["size_bytes"] == 100
+
+    @pytest.mark.asyncio
+    async def test_content_type_rejected(self, http_server):
+        result = await self._fetch(http_server + "/ok", allowed_content_types=["text/"])
+        assert result.status == ToolStatus.ERROR
+        assert "not allowed" in result.data["error"]
+
+    @pytest.mark.asyncio
+    async def test_http_error(self, http_server):
+        result = await self._fetch(http_server + "/missing")
+        assert result.status == ToolStatus.ERROR
+        assert result.data["url"].endswith("/missing")
+
+
+class TestHTTPFetchAllowlist:
+    @pytest.fixture(autouse=True)
+    def _reset_domains(self):
+        from hu_core.tools.builtin.http_fetch import HTTPFetchTool
+
+        yield
+        HTTPFetchTool.set_allowed_domains([])
+        HTTPFetchTool.set_blocked_domains([])
+
+    def test_no_rules_allows_all(self):
+        from hu_core.tools.builtin.http_fetch import HTTPFetchTool
+
+        assert HTTPFetchTool()._check_url_allowed("https://example.com/x") == (True, None)
+
+    def test_allowlist_matches_subdomains(self):
+        from hu_core.tools.builtin.http_fetch import HTTPFetchTool
+
+        HTTPFetchTool.set_allowed_domains(["example.com"])
+        tool = HTTPFetchTool()
+        assert tool._check_url_allowed("https://example.com/")[0]
+        assert tool._check_url_allowed("https://api.Example.com/v1")[0]
+        assert not tool._check_url_allowed("https://badexample.com/")[0]
+
+    @pytest.mark.asyncio
+    async def test_include_body_false(self, http_server):
+        from hu_core.tools import ExecutionContext
+        from hu_core.tools.builtin.http_fetch import HTTPFetchTool
+
+        tool = HTTPFetchTool()
+        try:
+            result = await tool.execute({"url": http_server + "/ok"}, ExecutionContext())
+            assert result["body"] == {"ok": True}
+            result = await tool.execute(
+                {"url": http_server + "/ok", "include_body": False}, ExecutionContext()
+            )
+            assert result["status_code"] == 200
+            assert result["body"] is None
+        finally:
+            await HTTPFetchTool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_json_body_parsing(self, http_server):
+        from hu_core.tools import ExecutionContext
+        from hu_core.tools.builtin.http_fetch import HTTPFetchTool
+
+        tool = HTTPFetchTool()
+        try:
+            result = await tool.execute({"url": http_server + "/badjson"}, ExecutionContext())
+            assert result["body"] == "{not json"
+            result = await tool.execute({"url": http_server + "/empty"}, ExecutionContext())
+            assert result["body"] is None
+        finally:
+            await HTTPFetchTool.aclose()
+
+    @pytest.mark.asyncio
+    async def test_session_shared_with_http_fetch_safe(self):
+        from hu_core.tools import _http_pool
+        from hu_core.tools.builtin.http_fetch import HTTPFetchTool
+
+        try:
+            assert HTTPFetchTool._get_session() is _http_pool.get_session()
+        finally:
+            await _http_pool.aclose()
+
+    @pytest.mark.parametrize("url", [
+        "https://Example.com/path?q=1",
+        "http://example.com:8080",
+        "http://user:pw@example.com@evil.com/",
+        "https://example.com#frag",
+        "http://[::1]:80/",
+        "http://ex\tample.com/",
+        "ftp://example.com/",
+        " https://example.com ",
+        "example.com/path",
+    ])
+    def test_fast_domain_matches_urlparse(self, url):
+        from urllib.parse import urlparse
+
+        from hu_core.tools.builtin.http_fetch import _fast_domain
+
+        assert _fast_domain(url) == urlparse(url).netloc.lower()
+
+    def test_blocklist_wins(self):
+        from hu_core.tools.builtin.http_fetch import HTTPFetchTool
+
+        HTTPFetchTool.set_allowed_domains(["example.com"])
+        HTTPFetchTool.set_blocked_domains(["evil.example.com"])
+        allowed, reason = HTTPFetchTool()._check_url_allowed("https://x.evil.example.com/")
+        assert not allowed
+        assert "blocked" in reason
+
+
+class TestMemoryTools:
+    @pytest.fixture(autouse=True)
+    def _huap_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("HUAP_HOME", str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_write_read_list_delete(self):
+        from hu_core.tools.builtin.memory import (
+            MemoryDeleteTool, MemoryListTool, MemoryReadTool, MemoryWriteTool,
+        )
+
+        await MemoryWriteTool().execute({"key": "k", "value": {"a": 1}})
+        result = await MemoryReadTool().execute({"key": "k"})
+        assert result.data == {"key": "k", "value": {"a": 1}, "found": True}
+        result = await MemoryListTool().execute({})
+        assert result.data["keys"] == ["k"]
+        result = await MemoryDeleteTool().execute({"key": "k"})
+        assert result.data["deleted"] is True
+        result = await MemoryReadTool().execute({"key": "k"})
+        assert result.data["found"] is False
+
+    @pytest.mark.asyncio
+    async def test_store_follows_huap_home(self, tmp_path, monkeypatch):
+        from hu_core.tools.builtin.memory import MemoryReadTool, MemoryWriteTool
+
+        await MemoryWriteTool().execute({"key": "k", "value": 1})
+        monkeypatch.setenv("HUAP_HOME", str(tmp_path / "other"))
+        result = await MemoryReadTool().execute({"key": "k"})
+        assert result.data["found"] is False
@@ -0,0 +1,49 @@
+"""Tests for trace scoring against budgets."""
+import pytest
+from pydantic import ValidationError
+
+from hu_core.eval.scoring import TraceEvaluator
+from hu_core.trace.models import (
+    CostRecordData,
+    EventKind,
+    EventName,
+    RunEndData,
+    RunStartData,
+    TraceEvent,
+)
+
+
+def _write_trace(path, events):
+    path.write_text("".join(e.to_jsonl() + "\n" for e in events))
+    return str(path)
+
+
+class TestTraceEvaluator:
+    def test_metrics_streamed_from_trace(self, tmp_path):
+        events = [
+            TraceEvent(run_id="run_a", kind=EventKind.LIFECYCLE, name=EventName.RUN_START,
+                       data=RunStartData(pod="demo")),
+            TraceEvent(run_id="run_a", kind=EventKind.COST, name=EventName.COST_RECORD,
+                       data=CostRecordData(tokens=10, usd_est=0.001, latency_ms=5.0)),
+            TraceEvent(run_id="run_a", kind=EventKind.LIFECYCLE, name=EventName.RUN_END,
+                       data=RunEndData(status="success", duration_ms=3.0)),
+        ]
+        result = TraceEvaluator().evaluate(_write_trace(tmp_path / "a.jsonl", events))
+        assert result.run_id == "run_a"
+        assert result.tokens_total == 10
+        assert result.latency_total_ms == 5.0
+        assert result.quality_metrics == {"json_valid": 1.0}
+
+    def test_empty_trace_gets_generated_run_id(self, tmp_path):
+        result = TraceEvaluator().evaluate(_write_trace(tmp_path / "a.jsonl", []))
+        assert result.run_id.startswith("run_")
+        assert result.tokens_total == 0
+
+    def test_malformed_trace_rejected(self, tmp_path):
+        path = tmp_path / "bad.jsonl"
+        path.write_text(
+            '{"run_id": "run_a", "kind": "bogus", "name": "cost_record",'
+            ' "data": {"tokens": 1, "usd_est": 0.1, "latency_ms": 1.0}}\n'
+        )
+        with pytest.raises(ValidationError):
+            TraceEvaluator().evaluate(str(path))
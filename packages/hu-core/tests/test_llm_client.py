@@ -0,0 +1,66 @@
+"""Tests for pooled and context-local LLM client lookup."""
+import asyncio
+
+import pytest
+
+from hu_core.services.llm_client import (
+    LLMClient,
+    get_llm_client,
+    get_pooled_client,
+    reset_llm_client,
+    set_context_client,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_clients(monkeypatch):
+    monkeypatch.setenv("HUAP_LLM_MODE", "stub")
+    reset_llm_client()
+    yield
+    reset_llm_client()
+
+
+class TestPooledClient:
+    def test_one_client_per_configuration(self):
+        client = get_pooled_client()
+        assert get_pooled_client() is client
+        assert get_pooled_client(stub_mode=True, model=client.model) is client
+        assert get_pooled_client(model="other-model") is not client
+
+    def test_stub_mode_ignores_api_key(self):
+        assert get_pooled_client(api_key="sk-a") is get_pooled_client(api_key="sk-b")
+
+    def test_reset_clears_pool(self):
+        client = get_pooled_client()
+        reset_llm_client()
+        assert get_pooled_client() is not client
+
+
+class TestContextClient:
+    def test_falls_back_to_pool(self):
+        assert get_llm_client() is get_pooled_client()
+
+    def test_set_and_remove(self):
+        client = LLMClient(stub_mode=True)
+        set_context_client(client)
+        assert get_llm_client() is client
+        assert get_llm_client("other") is get_pooled_client()
+        set_context_client(None)
+        assert get_llm_client() is get_pooled_client()
+
+    def test_reset_clears_context_client(self):
+        set_context_client(LLMClient(stub_mode=True))
+        reset_llm_client()
+        assert get_llm_client() is get_pooled_client()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_runs_are_isolated(self):
+        async def run(name):
+            client = LLMClient(stub_mode=True, model=name)
+            set_context_client(client)
+            await asyncio.sleep(0)
+            return get_llm_client() is client
+
+        assert await asyncio.gather(run("a"), run("b")) == [True, True]
+        # Task contexts are copies; the caller's context is untouched
+        assert get_llm_client() is get_pooled_client()
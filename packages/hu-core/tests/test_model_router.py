@@ -88,6 +88,13 @@ class TestModelRouter:
         assert decision.model.privacy == "local"
         assert decision.model.provider != "openai"
 
+    def test_filters_snapshot_caller_lists(self):
+        router = self._make_router()
+        providers = ["stub"]
+        decision = router.select(capability="chat", providers_allow=providers)
+        providers.append("openai")
+        assert "providers_allow=['stub']" in decision.filters_applied
+
     def test_capability_filtering(self):
         router = self._make_router()
         decision = router.select(capability="classify")
@@ -129,6 +136,28 @@ class TestModelRouter:
         # Should pick ollama first (it's first in prefer list and local)
         assert decision.model.id == "ollama_phi3_chat"
 
+    def test_rules_keep_policy_order_across_conditions(self):
+        """A generic rule listed first wins over a more specific later rule."""
+        rules = [
+            RouterRule(name="any_chat", when={"capability": "chat"}, prefer=["stub_chat"]),
+            RouterRule(
+                name="local_chat",
+                when={"capability": "chat", "privacy": "local"},
+                prefer=["ollama_phi3_chat"],
+            ),
+        ]
+        router = self._make_router(rules)
+        decision = router.select(capability="chat", privacy="local")
+        assert decision.rule_name == "any_chat"
+
+    def test_rule_for_other_capability_is_skipped(self):
+        rules = [
+            RouterRule(name="extract_only", when={"capability": "extract"}, prefer=["stub_chat"]),
+        ]
+        router = self._make_router(rules)
+        decision = router.select(capability="chat")
+        assert decision.rule_name == "__fallback"
+
     def test_no_match_raises(self):
         reg = ModelRegistry([
             ModelSpec(id="only_chat", provider="stub", model="stub",
@@ -162,3 +191,169 @@ class TestModelRouter:
         decision = router.select(capability="chat")
         assert decision.model.id == "a_model"  # alphabetically first
         assert decision.rule_name == "__fallback"
+
+
+# ---------------------------------------------------------------------------
+# Policy loading tests
+# ---------------------------------------------------------------------------
+
+POLICY_YAML = """\
+rules:
+  - name: prefer_stub
+    when:
+      capability: chat
+    prefer: [stub_chat]
+"""
+
+
+class TestPolicyLoading:
+    def setup_method(self):
+        ModelRouter.clear_policy_cache()
+
+    def test_load_rules_from_yaml(self, tmp_path):
+        policy = tmp_path / "policy.yaml"
+        policy.write_text(POLICY_YAML)
+        router = ModelRouter.load(ModelRegistry(), str(policy))
+        decision = router.select(capability="chat")
+        assert decision.rule_name == "prefer_stub"
+
+    def test_cached_rules_are_copies(self, tmp_path):
+        policy = tmp_path / "policy.yaml"
+        policy.write_text(POLICY_YAML)
+        first = ModelRouter._load_rules(policy)
+        first[0].prefer.append("mutated")
+        second = ModelRouter._load_rules(policy)
+        assert second[0].prefer == ["stub_chat"]
+
+    def test_modified_policy_is_reparsed(self, tmp_path):
+        policy = tmp_path / "policy.yaml"
+        policy.write_text(POLICY_YAML)
+        ModelRouter._load_rules(policy)
+        policy.write_text(POLICY_YAML.replace("prefer_stub", "renamed_rule"))
+        rules = ModelRouter._load_rules(policy)
+        assert rules[0].name == "renamed_rule"
+
+    def test_empty_policy_has_no_rules(self, tmp_path):
+        policy = tmp_path / "policy.yaml"
+        policy.write_text("")
+        assert ModelRouter._load_rules(policy) == []
+
+
+# ---------------------------------------------------------------------------
+# Provider tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def chat_server():
+    """Local server speaking Ollama's /api/chat and OpenAI's /v1/chat/completions."""
+    import json
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            if self.path == "/api/chat":
+                body = b"".join(json.dumps(chunk).encode() + b"\n" for chunk in (
+                    {"message": {"content": "he"}},
+                    {"message": {"content": "llo"}, "done": True,
+                     "prompt_eval_count": 3, "eval_count": 2},
+                ))
+            else:
+                body = json.dumps({
+                    "id": "c1", "object": "chat.completion", "created": 0, "model": "m",
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": "hello"}}],
+                    "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5},
+                }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestOllamaProvider:
+    @pytest.mark.filterwarnings("ignore::ResourceWarning")
+    def test_reused_across_event_loops(self, chat_server):
+        import asyncio
+
+        from hu_core.services.providers.ollama_provider import OllamaProvider
+
+        provider = OllamaProvider()
+        # The first loop's session is left open, as after a plain asyncio.run
+        resp = asyncio.run(provider.chat_completion("m", [], endpoint=chat_server))
+        assert resp.text == "hello"
+
+        async def call_and_close():
+            try:
+                return await provider.chat_completion("m", [], endpoint=chat_server)
+            finally:
+                await provider.aclose()
+
+        resp = asyncio.run(call_and_close())
+        assert resp.text == "hello"
+        assert resp.usage["total_tokens"] == 5
+
+
+class TestOpenAIProvider:
+    @pytest.mark.filterwarnings("ignore::ResourceWarning")
+    def test_reused_across_event_loops(self, chat_server, monkeypatch):
+        import asyncio
+
+        from hu_core.services.providers.openai_provider import OpenAIProvider
+
+        monkeypatch.setenv("OPENAI_BASE_URL", f"{chat_server}/v1")
+        provider = OpenAIProvider(api_key="sk-test")
+        messages = [{"role": "user", "content": "hi"}]
+        assert asyncio.run(provider.chat_completion("m", messages)).text == "hello"
+
+        async def call_and_close():
+            try:
+                return await provider.chat_completion("m", messages)
+            finally:
+                await provider.aclose()
+
+        assert asyncio.run(call_and_close()).text == "hello"
+
+    @pytest.mark.asyncio
+    async def test_missing_openai_package_reported(self, monkeypatch):
+        import sys
+
+        from hu_core.services.providers.openai_provider import OpenAIProvider
+
+        monkeypatch.setitem(sys.modules, "openai", None)
+        with pytest.raises(ImportError, match="pip install openai"):
+            await OpenAIProvider(api_key="sk-test").chat_completion("gpt-4o-mini", [])
+
+
+class TestRoutedLLMClient:
+    def test_aclose_closes_provider_sessions(self, chat_server):
+        import asyncio
+
+        from hu_core.services.llm_client import RoutedLLMClient
+
+        client = RoutedLLMClient()
+        ollama = client._providers["ollama"]
+
+        async def use_and_close():
+            await ollama.chat_completion("m", [], endpoint=chat_server)
+            session = ollama._session
+            await client.aclose()
+            return session
+
+        session = asyncio.run(use_and_close())
+        assert session.closed
+        assert ollama._session is None
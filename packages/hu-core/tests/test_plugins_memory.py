@@ -1,11 +1,16 @@
 """Tests for P9 — Plugin SDK, MemoryPort, ingest policy, CMP toolpack, HindsightProvider."""
+import asyncio
+
 import pytest
 from pathlib import Path
+from uuid import uuid4
 
 from hu_core.plugins.spec import PluginSpec
 from hu_core.plugins.registry import PluginRegistry
 from hu_core.ports.memory import InMemoryPort, MemoryItem
-from hu_core.tools.memory_tools import memory_retain, memory_recall, memory_reflect
+from hu_core.tools.memory_tools import (
+    memory_retain, memory_recall, memory_recall_many, memory_reflect, set_context_port,
+)
 from hu_core.policies.memory_ingest import MemoryIngestPolicy
 from hu_core.memory.providers.hindsight import HindsightProvider
 from hu_core.memory.providers.base import MemoryEntry, MemoryQuery, MemoryType
@@ -137,6 +142,18 @@ class TestInMemoryPort:
         results = await port.recall("b", "match", k=3)
         assert len(results) == 3
 
+    @pytest.mark.asyncio
+    async def test_recall_batch_matches_recall(self):
+        port = InMemoryPort()
+        await port.retain("b", "I like dark mode")
+        await port.retain("b", "The weather is nice")
+        batches = await port.recall_batch("b", ["dark", "weather"], k=5)
+        assert [r.content for r in batches[0]] == ["I like dark mode", "The weather is nice"]
+        assert [r.content for r in batches[1]] == ["The weather is nice", "I like dark mode"]
+        # Scores are per query, not shared between batches
+        assert batches[0][0].score == 1.0 and batches[0][1].score == 0.0
+        assert batches[1][0].score == 1.0 and batches[1][1].score == 0.0
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Memory Tools
@@ -151,6 +168,17 @@ class TestMemoryTools:
         assert result["count"] == 1
         assert result["items"][0]["content"] == "test content"
 
+    @pytest.mark.asyncio
+    async def test_recall_unserialized_items(self):
+        port = InMemoryPort()
+        await memory_retain("bank", "test content", port=port)
+        result = await memory_recall("bank", "test", port=port, serialize=False)
+        assert isinstance(result["items"][0], MemoryItem)
+        reflected = await memory_reflect("bank", "test", port=port, serialize=False)
+        assert reflected["items"][0].content == "test content"
+        many = await memory_recall_many("bank", ["test"], port=port, serialize=False)
+        assert many["results"][0]["items"][0].content == "test content"
+
     @pytest.mark.asyncio
     async def test_reflect(self):
         port = InMemoryPort()
@@ -159,6 +187,63 @@ class TestMemoryTools:
         assert result["status"] == "reflected"
         assert result["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_tracer_events(self):
+        events = []
+
+        class Tracer:
+            def tool_call(self, name, data):
+                events.append(("call", name))
+
+            def tool_result(self, name, data, duration_ms):
+                events.append(("result", name))
+
+        port = InMemoryPort()
+        await memory_retain("bank", "traced", port=port, tracer=Tracer())
+        await memory_recall("bank", "traced", port=port, tracer=None)
+        assert events == [("call", "memory.retain"), ("result", "memory.retain")]
+
+    @pytest.mark.asyncio
+    async def test_traced_content_truncated(self):
+        calls = []
+
+        class Tracer:
+            def tool_call(self, name, data):
+                calls.append(data)
+
+            def tool_result(self, name, data, duration_ms):
+                pass
+
+        await memory_retain("bank", "x" * 500, port=InMemoryPort(), tracer=Tracer())
+        assert calls[0]["content"] == "x" * 200
+
+    @pytest.mark.asyncio
+    async def test_default_port_is_shared(self):
+        bank = f"bank_{uuid4().hex[:8]}"
+        await memory_retain(bank, "remembered without a port")
+        result = await memory_recall(bank, "remembered")
+        assert result["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_context_port_isolates_runs(self):
+        async def run(text):
+            set_context_port(InMemoryPort())
+            await memory_retain("bank", text)
+            return await memory_recall("bank", "run")
+
+        first, second = await asyncio.gather(run("run one"), run("run two"))
+        assert [i["content"] for i in first["items"]] == ["run one"]
+        assert [i["content"] for i in second["items"]] == ["run two"]
+
+    @pytest.mark.asyncio
+    async def test_recall_many(self):
+        port = InMemoryPort()
+        await memory_retain("bank", "test content", port=port)
+        result = await memory_recall_many("bank", ["test", "other"], k=1, port=port)
+        assert result["count"] == 2
+        assert [r["query"] for r in result["results"]] == ["test", "other"]
+        assert result["results"][0]["items"][0]["score"] == 1.0
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Memory Ingest Policy
@@ -0,0 +1,415 @@
+"""Tests for the tool registry, BaseTool validation and built-in tools."""
+import asyncio
+import sys
+from datetime import datetime
+
+import pytest
+
+from hu_core.tools import (
+    BaseTool,
+    ExecutionContext,
+    ToolCategory,
+    ToolRegistry,
+    ToolSpec,
+    ToolStatus,
+    register_builtin_tools,
+)
+from hu_core.tools.builtin import BUILTIN_TOOLS, EchoTool
+
+
+class SumTool(BaseTool):
+    """Tool declaring its spec explicitly."""
+
+    spec = ToolSpec(
+        name="sum",
+        input_schema={
+            "type": "object",
+            "properties": {
+                "a": {"type": "number"},
+                "b": {"type": "number"},
+            },
+            "required": ["a", "b"],
+        },
+    )
+
+    async def execute(self, input, context):
+        return {"result": input["a"] + input["b"]}
+
+
+class TestBaseTool:
+    def test_spec_from_class_attributes(self):
+        spec = EchoTool().spec
+        assert spec.name == "echo"
+        assert spec.category == ToolCategory.UTILITY
+        assert spec.input_schema["required"] == ["message"]
+
+    def test_missing_name_raises(self):
+        class Nameless(BaseTool):
+            async def execute(self, input, context):
+                return {}
+
+        with pytest.raises(TypeError, match="must define 'name'"):
+            Nameless().spec
+
+    def test_validate_input_ok(self):
+        assert SumTool().validate_input({"a": 1, "b": 2.5}) == []
+
+    def test_validate_input_errors(self):
+        errors = SumTool().validate_input({"a": "x"})
+        assert "Missing required field: b" in errors
+        assert "Field 'a' should be number, got str" in errors
+
+    def test_schema_compiled_at_class_definition(self):
+        assert SumTool._compiled_input_schema.required == ("a", "b")
+        assert EchoTool._compiled_input_schema.field_types == {"message": "string"}
+        assert BaseTool._compiled_input_schema is None
+
+    def test_computed_spec_compiles_lazily(self):
+        class Computed(SumTool):
+            @property
+            def spec(self):
+                return ToolSpec(name="computed", input_schema={"required": ["x"]})
+
+        assert Computed._compiled_input_schema is None
+        assert Computed().validate_input({}) == ["Missing required field: x"]
+
+
+class TestRegistration:
+    def test_register_duplicate_raises(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(SumTool())
+
+    def test_register_many_is_all_or_nothing(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        with pytest.raises(ValueError):
+            registry.register_many([EchoTool(), SumTool()])
+        assert registry.get("echo") is None
+
+    def test_register_many_skip_existing(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        count = registry.register_many([EchoTool(), SumTool()], skip_existing=True)
+        assert count == 1
+        assert registry.get("echo") is not None
+
+    def test_builtin_tools_shared_across_registries(self):
+        first, second = ToolRegistry(), ToolRegistry()
+        register_builtin_tools(first)
+        register_builtin_tools(first)  # idempotent
+        register_builtin_tools(second)
+        assert len(first.list_tools()) == len(BUILTIN_TOOLS)
+        assert first.get("echo") is second.get("echo")
+
+
+class TestDiscovery:
+    @pytest.fixture
+    def registry(self):
+        registry = ToolRegistry()
+        register_builtin_tools(registry)
+        registry.register(SumTool())
+        return registry
+
+    def test_discover_matches_full_scan(self, registry):
+        def scan(category=None, capability=None, tag=None, name_contains=None):
+            return [
+                spec for spec in registry.list_tools()
+                if (not category or spec.category == category)
+                and (not capability or capability in spec.required_capabilities)
+                and (not tag or tag in spec.tags)
+                and (not name_contains or name_contains in spec.name)
+            ]
+
+        for kwargs in (
+            {"category": ToolCategory.STORAGE},
+            {"category": ToolCategory.HTTP, "tag": "http"},
+            {"capability": "http_access", "name_contains": "http"},
+            {"tag": "llm"},
+            {"tag": "nope"},
+            {"name_contains": "memory"},
+            {},
+        ):
+            assert registry.discover(**kwargs) == scan(**kwargs)
+
+    def test_unregister_updates_indexes(self, registry):
+        assert [s.name for s in registry.discover(tag="http")] == ["http_fetch"]
+        registry.unregister("http_fetch")
+        assert registry.discover(tag="http") == []
+        assert "http" not in registry._names_by_tag
+        assert "sum" in [s.name for s in registry.get_by_category(ToolCategory.UTILITY)]
+
+
+class TestExecute:
+    @pytest.mark.asyncio
+    async def test_execute_success(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        result = await registry.execute("sum", {"a": 1, "b": 2})
+        assert result.status == ToolStatus.SUCCESS
+        assert result.data == {"result": 3}
+
+    @pytest.mark.asyncio
+    async def test_execute_validation_error(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        result = await registry.execute("sum", {"a": 1})
+        assert result.status == ToolStatus.VALIDATION_ERROR
+
+    @pytest.mark.asyncio
+    async def test_validator_follows_reregistration(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        registry.unregister("sum")
+        registry.register_many([SumTool()])
+        result = await registry.execute("sum", {"a": 1})
+        assert result.status == ToolStatus.VALIDATION_ERROR
+        result = await registry.execute("sum", {"a": 1}, validate=False)
+        assert result.status == ToolStatus.ERROR
+
+    @pytest.mark.asyncio
+    async def test_execute_unknown_tool(self):
+        result = await ToolRegistry().execute("missing", {})
+        assert result.status == ToolStatus.ERROR
+
+    @pytest.mark.asyncio
+    async def test_execute_denied(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        registry.permissions.deny_pod_all("locked")
+        result = await registry.execute(
+            "sum", {"a": 1, "b": 2}, context=ExecutionContext(pod_name="locked")
+        )
+        assert result.status == ToolStatus.DENIED
+
+    @pytest.mark.asyncio
+    async def test_execute_fast_skips_checks_and_logs(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        registry.permissions.deny_pod_all("locked")
+        context = ExecutionContext(pod_name="locked")
+
+        result = await registry.execute_fast("sum", {"a": 1, "b": 2}, context)
+        assert result.status == ToolStatus.SUCCESS
+        assert result.data == {"result": 3}
+        failed = await registry.execute_fast("sum", {"a": 1})
+        assert failed.status == ToolStatus.ERROR
+        missing = await registry.execute_fast("missing", {})
+        assert missing.error == "Tool 'missing' not found"
+        assert registry.get_execution_logs() == []
+
+
+class TestPermissions:
+    def test_capabilities_required(self):
+        perms = ToolRegistry().permissions
+        perms.set_tool_capabilities("sum", ["math"])
+        allowed, reason = perms.can_access("pod", "sum", [])
+        assert not allowed
+        assert reason == "Missing capabilities: math"
+        assert perms.can_access("pod", "sum", ["math"]) == (True, None)
+
+    def test_context_capabilities_frozen(self):
+        context = ExecutionContext(capabilities=["b", "a", "a"])
+        assert context.capabilities == frozenset({"a", "b"})
+        assert ExecutionContext().capabilities == frozenset()
+
+    def test_cached_decision_invalidated_on_change(self):
+        perms = ToolRegistry().permissions
+        assert perms.can_access("pod", "sum", []) == (True, None)
+        perms.deny_pod_all("pod")
+        assert perms.can_access("pod", "sum", [])[0] is False
+        perms.allow_pod("pod", ["sum"])
+        assert perms.can_access("pod", "sum", []) == (True, None)
+        assert perms.can_access("pod", "echo", [])[0] is False
+
+    def test_pod_and_tool_names_interned(self):
+        perms = ToolRegistry().permissions
+        pod, tool = "".join(["po", "d"]), "".join(["su", "m"])
+        perms.allow_pod(pod, [tool])
+        (stored_pod, tools), = perms._pod_permissions.items()
+        assert stored_pod is sys.intern(pod)
+        assert next(iter(tools)) is sys.intern(tool)
+
+        for add in (perms.allow_pod_all, perms.deny_pod_all):
+            other = "".join(["po", "d2"])
+            add(other)
+            assert next(k for k in perms._pod_permissions if k == other) is sys.intern(other)
+
+
+class TestExecutionLogs:
+    @pytest.fixture
+    def registry(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        return registry
+
+    @pytest.mark.asyncio
+    async def test_logs_most_recent_first(self, registry):
+        await registry.execute("sum", {"a": 1, "b": 2}, context=ExecutionContext(pod_name="p1"))
+        await registry.execute("sum", {"a": 1}, context=ExecutionContext(pod_name="p2"))
+        await registry.execute("missing", {})
+        logs = registry.get_execution_logs()
+        assert [log["tool_name"] for log in logs] == ["missing", "sum", "sum"]
+        assert [log["pod_name"] for log in registry.get_execution_logs(tool_name="sum")] == ["p2", "p1"]
+        assert len(registry.get_execution_logs(status="success")) == 1
+        assert len(registry.get_execution_logs(limit=2)) == 2
+
+    @pytest.mark.asyncio
+    async def test_log_retention_limit(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        registry._execution_logs = type(registry._execution_logs)(maxlen=3)
+        for i in range(5):
+            await registry.execute("sum", {"a": i, "b": 0})
+        await registry.execute("sum", {})
+        stats = registry.get_stats()
+        assert stats["total_executions"] == 3
+        assert stats["executions_by_status"] == {"success": 2, "validation_error": 1}
+
+    @pytest.mark.asyncio
+    async def test_filtered_logs_follow_retention(self):
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        registry._execution_logs = type(registry._execution_logs)(maxlen=4)
+        for i, pod in enumerate(["a", "b", "a", "b", "a", "a"]):
+            await registry.execute("sum", {"a": i, "b": 0}, ExecutionContext(pod_name=pod))
+        await registry.execute("missing", {}, ExecutionContext(pod_name="b"))
+
+        pod_a = registry.get_execution_logs(pod_name="a")
+        assert [entry["pod_name"] for entry in pod_a] == ["a", "a"]
+        assert len(registry.get_execution_logs(tool_name="sum")) == 3
+        assert len(registry.get_execution_logs(tool_name="sum", pod_name="b")) == 1
+        assert registry.get_execution_logs(tool_name="missing", pod_name="a") == []
+        assert registry.get_execution_logs(tool_name="nope") == []
+        assert registry.get_execution_logs(pod_name="b", status="error", limit=5) == [
+            registry.get_execution_logs(limit=1)[0]
+        ]
+        assert registry.get_execution_logs(status="success", limit=0) == []
+        assert registry._logs_by_pod.keys() == {"a", "b"}
+
+    @pytest.mark.asyncio
+    async def test_log_id_and_timestamp_stable(self, registry):
+        before = datetime.utcnow()
+        await registry.execute("sum", {"a": 1, "b": 2})
+        registry.flush_logs()
+        (entry,) = registry._execution_logs
+        assert entry.id == entry.id == entry.to_dict()["id"]
+        assert before <= entry.timestamp <= datetime.utcnow()
+        assert entry.to_dict()["timestamp"] == entry.timestamp.isoformat()
+
+    @pytest.mark.asyncio
+    async def test_evicted_logs_recycled_without_callbacks(self, registry):
+        registry._execution_logs = type(registry._execution_logs)(maxlen=2)
+        for i in range(2):
+            await registry.execute("sum", {"a": i, "b": 0})
+        registry.flush_logs()
+        oldest = registry._execution_logs[0]
+        await registry.execute("missing", {})
+        registry.flush_logs()
+        assert registry._execution_logs[-1] is oldest
+        assert oldest.tool_name == "missing"
+        assert [e["tool_name"] for e in registry.get_execution_logs()] == ["missing", "sum"]
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_stop_others(self, registry):
+        seen = []
+
+        def boom(entry):
+            raise RuntimeError("boom")
+
+        registry.on_execute(boom)
+        registry.on_execute(lambda entry: seen.append(entry.status))
+        await registry.execute("sum", {"a": 1, "b": 2})
+        registry.flush_logs()
+        assert seen == ["success"]
+
+    @pytest.mark.asyncio
+    async def test_logs_seen_by_callbacks_not_recycled(self, registry):
+        seen = []
+        registry.on_execute(seen.append)
+        registry._execution_logs = type(registry._execution_logs)(maxlen=1)
+        await registry.execute("sum", {"a": 1, "b": 2})
+        await registry.execute("missing", {})
+        registry.flush_logs()
+        assert [entry.tool_name for entry in seen] == ["sum", "missing"]
+
+    def test_tools_by_category(self):
+        registry = ToolRegistry()
+        register_builtin_tools(registry)
+        registry.register(SumTool())
+        assert registry.get_stats()["tools_by_category"]["utility"] == 3
+        registry.unregister("sum")
+        registry.unregister("echo")
+        registry.unregister("add")
+        assert "utility" not in registry.get_stats()["tools_by_category"]
+
+    @pytest.mark.asyncio
+    async def test_execution_logged(self, registry, caplog):
+        with caplog.at_level("INFO", logger="hu_core.tools.registry"):
+            await registry.execute("sum", {"a": 1, "b": 2}, context=ExecutionContext(pod_name="p1"))
+            registry.flush_logs()
+        message = caplog.records[-1].getMessage()
+        assert message.startswith("Tool execution: sum | status=success | duration=")
+        assert message.endswith("ms | pod=p1 | user=None")
+
+    @pytest.mark.asyncio
+    async def test_callbacks_run_in_batch(self, registry):
+        seen = []
+        registry.on_execute(lambda entry: seen.append(entry.tool_name))
+        await registry.execute("sum", {"a": 1, "b": 2})
+        await registry.execute("missing", {})
+        await asyncio.sleep(0)
+        assert seen == ["sum", "missing"]
+
+
+class TestTracing:
+    class ServiceTracer:
+        def __init__(self):
+            self.events = []
+
+        def tool_call(self, **kwargs):
+            self.events.append(("tool_call", kwargs))
+
+        def tool_result(self, **kwargs):
+            self.events.append(("tool_result", kwargs))
+
+    @pytest.mark.asyncio
+    async def test_trace_service_tracer(self):
+        tracer = self.ServiceTracer()
+        registry = ToolRegistry(tracer=tracer)
+        registry.register(SumTool())
+        await registry.execute("sum", {"a": 1, "b": 2}, context=ExecutionContext(pod_name="p"))
+        assert [name for name, _ in tracer.events] == ["tool_call", "tool_result"]
+        assert tracer.events[0][1]["permissions"]["allowed"] is True
+        assert tracer.events[0][1]["permissions"]["capabilities"] == []
+        assert tracer.events[1][1]["result"] == {"result": 3}
+        assert tracer.events[1][1]["pod"] == "p"
+
+    @pytest.mark.asyncio
+    async def test_unchecked_permissions_traced_empty(self):
+        tracer = self.ServiceTracer()
+        registry = ToolRegistry(tracer=tracer)
+        registry.register(SumTool())
+        await registry.execute("sum", {"a": 1, "b": 2}, check_permissions=False)
+        assert tracer.events[0][1]["permissions"] == {}
+
+    @pytest.mark.asyncio
+    async def test_legacy_callable_tracer(self):
+        events = []
+        registry = ToolRegistry()
+        registry.register(SumTool())
+        registry.set_tracer(events.append)
+        await registry.execute("sum", {"a": 1, "b": 2})
+        assert events[0] == {"event": "tool_call", "tool": "sum", "input_keys": ["a", "b"]}
+        assert events[1]["event"] == "tool_result"
+        assert events[1]["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_unset_tracer(self):
+        tracer = self.ServiceTracer()
+        registry = ToolRegistry(tracer=tracer)
+        registry.register(SumTool())
+        registry.set_tracer(None)
+        await registry.execute("sum", {"a": 1, "b": 2})
+        assert tracer.events == []
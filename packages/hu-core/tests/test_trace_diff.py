@@ -0,0 +1,242 @@
+"""Tests for the trace differ and diff policies."""
+import os
+
+import pytest
+
+from hu_core.trace.diff import DiffPolicy, TraceDiffer, _load_policy_yaml, _with_data
+from hu_core.trace.models import EventKind, EventName, TraceEvent, TraceRun
+
+
+def _event(name, kind, **data):
+    return TraceEvent(run_id="run_test", kind=kind, name=name, data=data)
+
+
+def _write_trace(path, events):
+    path.write_text("\n".join(e.to_jsonl() for e in events) + "\n")
+    return str(path)
+
+
+def _baseline_events():
+    return [
+        _event(EventName.RUN_START, EventKind.LIFECYCLE, pod="demo"),
+        _event(EventName.NODE_ENTER, EventKind.NODE, node="plan"),
+        _event(EventName.TOOL_CALL, EventKind.TOOL, tool="echo", input={"message": "hi"}),
+        _event(EventName.TOOL_RESULT, EventKind.TOOL, tool="echo", status="ok", duration_ms=5.0),
+        _event(EventName.POLICY_CHECK, EventKind.POLICY, policy="p", decision="allow"),
+        _event(EventName.COST_RECORD, EventKind.COST, tokens=100, usd_est=0.01, latency_ms=50.0),
+        _event(EventName.QUALITY_RECORD, EventKind.QUALITY, metric="json_valid", value=1.0),
+        _event(EventName.NODE_EXIT, EventKind.NODE, node="plan", duration_ms=10.0),
+        _event(EventName.RUN_END, EventKind.LIFECYCLE, status="success", duration_ms=20.0),
+    ]
+
+
+class TestDiffPolicy:
+    def test_missing_file_gives_default(self, tmp_path):
+        assert DiffPolicy.from_yaml(tmp_path / "nope.yaml") == DiffPolicy()
+
+    def test_from_yaml_and_reload_on_change(self, tmp_path):
+        path = tmp_path / "policy.yaml"
+        path.write_text("allow_new_errors: true\nremovals_info_only: [cost_record]\n")
+        policy = DiffPolicy.from_yaml(path)
+        assert policy.allow_new_errors is True
+        assert policy.removals_info_only == frozenset({"cost_record"})
+        assert policy.ignore_fields == DiffPolicy().ignore_fields
+
+        hits = _load_policy_yaml.cache_info().hits
+        assert DiffPolicy.from_yaml(path) == policy
+        assert _load_policy_yaml.cache_info().hits == hits + 1
+
+        path.write_text("token_increase_fail_pct: 80\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        reloaded = DiffPolicy.from_yaml(path)
+        assert reloaded.token_increase_fail_pct == 80
+        assert reloaded.allow_new_errors is False
+
+    def test_name_lists_become_frozensets(self):
+        policy = DiffPolicy(ignore_fields=["a", "a"], removals_info_only=("error",))
+        assert policy.ignore_fields == frozenset({"a"})
+        assert policy.removals_info_only == frozenset({"error"})
+
+
+class TestTraceDiffer:
+    def test_identical_traces(self, tmp_path):
+        events = _baseline_events()
+        baseline = _write_trace(tmp_path / "a.jsonl", events)
+        candidate = _write_trace(tmp_path / "b.jsonl", events)
+        result = TraceDiffer().diff(baseline, candidate)
+        assert result["overall_severity"] == "info"
+        assert result["added"] == result["removed"] == result["changed"] == []
+        assert result["regressions"] == []
+        assert result["cost_delta"]["tokens_delta"] == 0
+        assert result["baseline_run_id"] == result["candidate_run_id"] == "run_test"
+        assert result["baseline_event_count"] == len(events)
+
+    def test_blank_lines_skipped(self, tmp_path):
+        path = tmp_path / "a.jsonl"
+        path.write_text("\n" + _baseline_events()[0].to_jsonl() + "\n\n  \n")
+        assert [e.name for e in TraceRun.iter_events_jsonl(str(path))] == ["run_start"]
+        assert TraceRun.from_jsonl_file(str(path)).run_id == "run_test"
+
+    def test_regressions_detected(self, tmp_path):
+        candidate_events = _baseline_events()
+        candidate_events[3] = _event(
+            EventName.TOOL_RESULT, EventKind.TOOL, tool="echo", status="error", duration_ms=5.0
+        )
+        candidate_events[4] = _event(
+            EventName.POLICY_CHECK, EventKind.POLICY, policy="p", decision="deny"
+        )
+        candidate_events[5] = _event(
+            EventName.COST_RECORD, EventKind.COST, tokens=200, usd_est=0.01, latency_ms=50.0
+        )
+        del candidate_events[1]
+        candidate_events.append(
+            _event(EventName.ERROR, EventKind.SYSTEM, error_type="ValueError", message="bad")
+        )
+
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", candidate_events)
+        result = TraceDiffer().diff(baseline, candidate)
+
+        assert result["overall_severity"] == "fail"
+        assert result["cost_severity"] == "fail"
+        assert result["cost_delta"]["tokens_delta"] == 100
+        assert [d["event_key"] for d in result["removed"]] == ["0_node_node_enter_plan"]
+        assert {d["event_key"] for d in result["changed"]} == {
+            "0_tool_tool_result_echo", "0_policy_policy_check_p",
+        }
+        assert [d["event_key"] for d in result["added"]] == ["0_system_error_"]
+        assert result["regressions"] == [
+            "Missing event: 0_node_node_enter_plan",
+            "Changed: 0_tool_tool_result_echo (status: ok -> error)",
+            "Changed: 0_policy_policy_check_p (decision: allow -> deny)",
+            "New error: ValueError: bad",
+            "Tool errors increased: 0 -> 1",
+            "Policy violations increased: 0 -> 1",
+        ]
+
+    def test_run_end_status_change_reported_once(self, tmp_path):
+        candidate_events = _baseline_events()
+        candidate_events[-1] = _event(
+            EventName.RUN_END, EventKind.LIFECYCLE, status="error", duration_ms=20.0
+        )
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", candidate_events)
+        result = TraceDiffer().diff(baseline, candidate)
+        assert result["changed"] == [{
+            "event_key": "0_lifecycle_run_end_",
+            "diff_type": "changed",
+            "changes": {"status": {"old": "success", "new": "error"}},
+            "severity": "fail",
+            "is_regression": True,
+        }]
+        assert "Changed: 0_lifecycle_run_end_ (status: success -> error)" in result["regressions"]
+
+    def test_omitted_defaults_match_reserialized_trace(self, tmp_path):
+        # Hand-written traces may leave out fields that have model defaults
+        sparse = tmp_path / "sparse.jsonl"
+        sparse.write_text(
+            '{"run_id": "run_test", "kind": "llm", "name": "llm_request",'
+            ' "data": {"model": "gpt-4o-mini", "messages": []}}\n'
+        )
+        reserialized = _write_trace(
+            tmp_path / "full.jsonl", TraceRun.from_jsonl_file(str(sparse)).events
+        )
+        result = TraceDiffer().diff(str(sparse), reserialized)
+        assert result["changed"] == []
+        assert result["overall_severity"] == "info"
+
+    def test_new_errors_allowed_by_policy(self, tmp_path):
+        candidate_events = _baseline_events() + [
+            _event(EventName.ERROR, EventKind.SYSTEM, error_type="ValueError", message="bad")
+        ]
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", candidate_events)
+        result = TraceDiffer(policy=DiffPolicy(allow_new_errors=True)).diff(baseline, candidate)
+        assert result["overall_severity"] == "info"
+
+    def test_quality_delta_and_markdown(self, tmp_path):
+        candidate_events = _baseline_events()
+        candidate_events[6] = _event(
+            EventName.QUALITY_RECORD, EventKind.QUALITY, metric="json_valid", value=0.5
+        )
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", candidate_events)
+        differ = TraceDiffer()
+        result = differ.diff(baseline, candidate)
+        assert result["quality_delta"] == {"json_valid": pytest.approx(-0.5)}
+        assert "| json_valid | -0.50 |" in differ.to_markdown(result)
+
+    def test_compare_tolerates_duration_jitter(self):
+        differ = TraceDiffer()
+        b = _event(EventName.TOOL_RESULT, EventKind.TOOL, tool="t", status="ok", duration_ms=10.0)
+        c = _event(EventName.TOOL_RESULT, EventKind.TOOL, tool="t", status="ok", duration_ms=12.0)
+        slow = _event(
+            EventName.TOOL_RESULT, EventKind.TOOL, tool="t", status="ok", duration_ms=30.0
+        )
+        (b_item, c_item, slow_item) = _with_data([b, c, slow])
+        assert differ._compare_events(b_item, b_item) == []
+        assert differ._compare_events(b_item, c_item) == []
+        assert differ._compare_events(b_item, slow_item) == [("duration_ms", 10.0, 30.0)]
+
+    def test_cost_severity_is_highest_threshold_crossed(self):
+        from hu_core.trace.diff import CostDelta
+
+        differ = TraceDiffer()
+        assert differ._evaluate_cost_severity(CostDelta()).value == "info"
+        warn = CostDelta(baseline_tokens=100, candidate_tokens=130)
+        assert differ._evaluate_cost_severity(warn).value == "warn"
+        warn.baseline_latency_ms, warn.candidate_latency_ms = 10.0, 30.0
+        assert differ._evaluate_cost_severity(warn).value == "fail"
+
+    def test_parallel_load_matches_sequential(self, tmp_path, monkeypatch):
+        import hu_core.trace.diff as diff_module
+
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", _baseline_events()[:-1])
+        sequential = TraceDiffer().diff(baseline, candidate)
+        monkeypatch.setattr(diff_module, "_PARALLEL_LOAD_BYTES", 0)
+        assert TraceDiffer().diff(baseline, candidate) == sequential
+
+    def test_to_json_roundtrip(self, tmp_path):
+        import json
+
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", _baseline_events()[1:])
+        differ = TraceDiffer()
+        result = differ.diff(baseline, candidate)
+        assert json.loads(differ.to_json(result)) == result
+
+    def test_markdown_lists_event_changes(self, tmp_path):
+        candidate_events = _baseline_events()
+        candidate_events[4] = _event(
+            EventName.POLICY_CHECK, EventKind.POLICY, policy="p", decision="deny"
+        )
+        del candidate_events[1]
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", candidate_events)
+        differ = TraceDiffer()
+        markdown = differ.to_markdown(differ.diff(baseline, candidate))
+        assert "**Overall Severity:** ❌ `FAIL`" in markdown
+        assert "- ❌ `0_node_node_enter_plan` [FAIL]" in markdown
+        assert "- ❌ `0_policy_policy_check_p`: decision [FAIL]" in markdown
+        assert "- Missing event: 0_node_node_enter_plan" in markdown
+
+    def test_fail_fast_stops_at_first_failure(self, tmp_path):
+        candidate_events = _baseline_events()
+        del candidate_events[1]
+        baseline = _write_trace(tmp_path / "a.jsonl", _baseline_events())
+        candidate = _write_trace(tmp_path / "b.jsonl", candidate_events)
+        result = TraceDiffer(policy=DiffPolicy(fail_fast=True)).diff(baseline, candidate)
+        assert result["overall_severity"] == "fail"
+        assert result["fail_fast"] is True
+        assert result["regressions"] == ["Missing event: 0_node_node_enter_plan"]
+
+        errors = _write_trace(tmp_path / "c.jsonl", _baseline_events() + [
+            _event(EventName.ERROR, EventKind.SYSTEM, error_type="ValueError", message="bad")
+        ])
+        result = TraceDiffer(policy=DiffPolicy(fail_fast=True)).diff(baseline, errors)
+        assert result["regressions"] == ["New error: ValueError: bad"]
+
+        clean = TraceDiffer(policy=DiffPolicy(fail_fast=True)).diff(baseline, baseline)
+        assert clean["overall_severity"] == "info" and "fail_fast" not in clean
@@ -0,0 +1,181 @@
+"""Tests for trace models and hashing helpers."""
+import os
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import pytest
+
+from hu_core.trace.models import (
+    EventKind,
+    EventName,
+    ToolCallData,
+    TraceEvent,
+    TraceRun,
+    hash_data,
+    hash_state,
+    normalize_for_hash,
+)
+
+
+class TestHashData:
+    def test_digests_are_stable(self):
+        # Recorded traces carry these digests and replay matches them
+        # against freshly computed ones, so they must never change
+        assert hash_data({"message": "hi", "n": [1, 2.5]}) == "fb03d4e396f66b13"
+        assert hash_data("text") == "982d9e3eb996f559"
+        assert hash_state({"a": 1.23456, "run_id": "x"}) == "b0d4076409edfd3a"
+        assert hash_data(None) == ""
+
+    def test_serialization_format_is_pinned(self):
+        # json.dumps separators, float repr, \u escapes and the ordering of
+        # non-str keys (sorted before coercion) all feed these digests;
+        # compiled encoders such as orjson differ on each of them
+        assert hash_data({"text": "café", "big": 1e16}) == "ffff6b4b1eb955a1"
+        assert hash_data({2: "b", 10: "a"}) == "ba07bbf0d9c562f3"
+
+    def test_key_order_ignored(self):
+        assert hash_data({"a": 1, "b": 2}) == hash_data({"b": 2, "a": 1})
+
+    def test_normalize_drops_ephemeral_fields(self):
+        data = {"span_id": "sp_1", "value": 0.123456, "nested": [{"id": 3, "k": "v"}]}
+        assert normalize_for_hash(data) == {"nested": [{"k": "v"}], "value": 0.1235}
+
+
+class TestTraceEventJsonl:
+    def test_trusted_parse_matches_validated(self):
+        event = TraceEvent(
+            run_id="run_x", kind=EventKind.TOOL, name=EventName.TOOL_CALL,
+            data=ToolCallData(tool="echo", input={"message": "hi"}),
+        )
+        line = event.to_jsonl()
+        trusted = TraceEvent.from_jsonl(line.encode(), validate=False)
+        assert isinstance(trusted.data, dict)
+        assert trusted.ts == event.ts
+        assert trusted.model_dump() == TraceEvent.from_jsonl(line).model_dump()
+        assert trusted.to_jsonl() == line
+
+    def test_trusted_parse_accepts_utc_suffix(self):
+        line = '{"run_id": "r", "kind": "node", "name": "node_enter", "ts": "2024-01-01T00:00:00Z"}'
+        event = TraceEvent.from_jsonl(line, validate=False)
+        assert event.ts == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert event.span_id.startswith("sp_")
+
+
+class TestOffsetIndex:
+    def test_load_event_seeks_by_index(self, tmp_path):
+        events = [
+            TraceEvent(run_id="run_x", kind=EventKind.NODE, name=EventName.NODE_ENTER,
+                       data={"node": f"n{i}"})
+            for i in range(3)
+        ]
+        path = tmp_path / "t.jsonl"
+        path.write_text("\n".join(e.to_jsonl() for e in events) + "\n\n")
+
+        assert TraceRun.load_event(str(path), 1).data.node == "n1"
+        assert os.path.exists(f"{path}.bcl")
+        assert TraceRun.load_event(str(path), -1, validate=False).data["node"] == "n2"
+        with pytest.raises(IndexError):
+            TraceRun.load_event(str(path), 3)
+
+        # A trace written after its index gets a fresh one
+        with open(path, "a") as f:
+            f.write(events[0].model_copy(update={"data": {"node": "n3"}}).to_jsonl() + "\n")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert TraceRun.load_event(str(path), -1, validate=False).data["node"] == "n3"
+
+    def test_append_within_same_mtime_detected(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text(_node_line("n0") + "\n")
+        assert TraceRun.load_event(str(path), -1).data.node == "n0"
+
+        st = path.stat()
+        with open(path, "a") as f:
+            f.write(_node_line("n1") + "\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert TraceRun.load_event(str(path), -1).data.node == "n1"
+
+    def test_unwritable_sidecar_falls_back_to_memory(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text(_node_line("n0") + "\n" + _node_line("n1") + "\n")
+        # A directory in the sidecar's place can be neither read nor written
+        os.mkdir(f"{path}.bcl")
+        assert TraceRun.load_event(str(path), 1).data.node == "n1"
+        with pytest.raises(OSError):
+            TraceRun.build_offset_index(str(path))
+
+
+def _node_line(node):
+    return TraceEvent(
+        run_id="run_x", kind=EventKind.NODE, name=EventName.NODE_ENTER, data={"node": node}
+    ).to_jsonl()
+
+
+class TestTraceRunIndex:
+    def test_filters_served_from_index(self):
+        def event(kind, name):
+            return TraceEvent(run_id="run_x", kind=kind, name=name)
+
+        run = TraceRun(run_id="run_x", events=[
+            event(EventKind.LIFECYCLE, EventName.RUN_START),
+            event(EventKind.NODE, EventName.NODE_ENTER),
+            event(EventKind.NODE, EventName.NODE_EXIT),
+        ])
+        assert run.start_event is run.events[0]
+        assert run.end_event is None
+        assert [e.name for e in run.filter_by_kind(EventKind.NODE)] == ["node_enter", "node_exit"]
+        assert run.filter_by_name("node_exit") == [run.events[2]]
+        assert run.filter_by_kind(EventKind.TOOL) == []
+        assert run == TraceRun(run_id="run_x", events=list(run.events))
+
+        run.events.append(event(EventKind.LIFECYCLE, EventName.RUN_END))
+        assert run.end_event is run.events[-1]
+        assert len(run.filter_by_kind("lifecycle")) == 2
+
+
+class TestNormalizeForHash:
+    def test_converts_nested_objects(self):
+        @dataclass(slots=True)
+        class Point:
+            x: float
+            id: int
+
+        data = {"p": Point(1.234567, 7), "t": (1.00001, {"created_at": 0, "ok": True})}
+        assert normalize_for_hash(data) == {"p": {"x": 1.2346}, "t": [1.0, {"ok": True}]}
+        assert normalize_for_hash({"a": 1, "b": 2}, exclude_fields={"b"}) == {"a": 1}
+
+    def test_dataclass_with_dict_hashes_all_attributes(self):
+        @dataclass
+        class Step:
+            name: str
+
+            def __post_init__(self):
+                self.label = self.name.upper()
+
+        assert normalize_for_hash(Step("a")) == {"name": "a", "label": "A"}
+
+    def test_circular_reference_rejected(self):
+        looped = []
+        looped.append(looped)
+        with pytest.raises(ValueError, match="Circular reference detected"):
+            hash_data(looped, normalize=True)
+
+        node = {"name": "a"}
+        node["children"] = [{"parent": node}]
+        with pytest.raises(ValueError, match="Circular reference detected"):
+            normalize_for_hash(node)
+
+        # The same object twice side by side is not a cycle
+        shared = {"v": 1.0}
+        assert normalize_for_hash([shared, shared]) == [{"v": 1.0}, {"v": 1.0}]
+
+    def test_deep_nesting_beyond_recursion_limit(self):
+        data = leaf = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            leaf["child"] = leaf = {}
+        leaf["value"] = 0.123456
+        normalized = normalize_for_hash(data)
+        while "child" in normalized:
+            normalized = normalized["child"]
+        assert normalized == {"value": 0.1235}